@@ -84,6 +84,13 @@ class Device:
             return self._screen_size
         return (1080, 2340)  # Default fallback
     
+    def dump_hierarchy(self) -> str:
+        """Dump the current UI hierarchy as uiautomator XML ("" if unavailable)"""
+        output = self.shell("uiautomator dump /dev/tty") or ""
+        # The XML is followed by "UI hierchary dumped to: /dev/tty" on the same stream
+        end = output.rfind("</hierarchy>")
+        return output[output.find("<?xml"):end + len("</hierarchy>")] if end >= 0 and "<?xml" in output else ""
+    
     def click(self, selector: Dict[str, Any]) -> bool:
         """Click UI element by selector (mock implementation)"""
         # This would need uiautomator2 integration for real implementation
@@ -7,7 +7,9 @@ Handles ADB commands for test automation
 import subprocess
 import time
 import logging
+import queue
 import sys
+import threading
 from typing import Optional, List, Dict, Any
 
 # Windows에서 cmd 창 안 뜨게 하는 설정
@@ -16,6 +18,102 @@ if sys.platform == 'win32':
 else:
     SUBPROCESS_FLAGS = 0
 
+logger = logging.getLogger(__name__)
+
+
+class PersistentAdbShell:
+    """One long-lived 'adb shell' process that runs commands written to its stdin
+    
+    Each command is followed by an end marker carrying its exit status, so the
+    output can be read back without spawning a new adb process per command.
+    """
+    
+    _END = "__DOU_END__"
+    
+    def __init__(self, device_id: str):
+        self.device_id = device_id
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: Optional[queue.Queue] = None
+        self._lock = threading.Lock()  # One command in flight at a time
+    
+    def _start(self):
+        self._proc = subprocess.Popen(
+            ['adb', '-s', self.device_id, 'shell'],
+            # stdout only, like _run_adb_command; UTF-8 regardless of the host locale (e.g. cp949)
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8', errors='replace', bufsize=1, creationflags=SUBPROCESS_FLAGS)
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self._proc.stdout, self._lines),
+                         name="adb-shell-reader", daemon=True).start()
+    
+    @staticmethod
+    def _pump(stream, lines: queue.Queue):
+        try:
+            for line in stream:
+                lines.put(line)
+        except (OSError, ValueError) as e:
+            logger.error(f"adb shell reader stopped: {e}")
+        finally:
+            lines.put(None)  # EOF: shell exited or the reader failed; run() stops waiting
+    
+    def run(self, command: str, timeout: float = 30) -> Optional[str]:
+        """Run command in the session; returns stdout, or None on non-zero exit status
+        
+        Raises OSError if the command could not be sent (adb missing, session
+        gone), so callers can fall back to a one-shot command. If the command was
+        sent but did not finish (timeout, shell exited), the session is discarded
+        and None is returned rather than risking running it twice.
+        """
+        with self._lock:
+            try:
+                if self._proc is None or self._proc.poll() is not None:
+                    self._start()
+                self._proc.stdin.write(f"{command}\necho {self._END}$?\n")
+                self._proc.stdin.flush()
+            except (OSError, ValueError) as e:
+                self._close_locked()
+                raise OSError(f"adb shell session unavailable: {e}") from e
+            
+            deadline = time.monotonic() + timeout
+            output = []
+            try:
+                while True:
+                    line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                    if line is None:
+                        logger.error(f"adb shell session exited during: {command}")
+                        break
+                    head, marker, status = line.partition(self._END)
+                    if marker:
+                        output.append(head)
+                        return ''.join(output) if status.strip() == '0' else None
+                    output.append(line)
+            except queue.Empty:
+                logger.error(f"ADB shell command timeout ({timeout}s): {command}")
+            self._close_locked()
+            return None
+    
+    def _close_locked(self):
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+                self._proc.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        self._proc = None
+    
+    def close(self):
+        with self._lock:
+            self._close_locked()
+    
+    def interrupt(self):
+        """Kill the shell without waiting for the lock, ending a command still in flight"""
+        proc = self._proc
+        if proc is not None:
+            try:
+                proc.kill()
+            except OSError:
+                pass
+
 
 class ADBService:
     """Service for controlling Android devices via ADB"""
@@ -24,6 +122,7 @@ class ADBService:
         self.logger = logging.getLogger(__name__)
         self.connected_device = None
         self.device_info = {}
+        self._shell_session: Optional[PersistentAdbShell] = None  # Reused by shell() and key events
         
     def get_connected_devices(self) -> List[str]:
         """Get list of connected ADB devices"""
@@ -62,6 +161,7 @@ class ADBService:
                 self.logger.error(f"Device {device_id} not found in connected devices")
                 return False
             
+            self._close_shell_session()
             self.connected_device = device_id
             self.device_info = self._get_device_info()
             self.logger.info(f"Connected to ADB device: {device_id}")
@@ -137,11 +237,40 @@ class ADBService:
             self.logger.error(f"Error running ADB command: {e}")
             return None
     
+    def _close_shell_session(self):
+        if self._shell_session is not None:
+            self._shell_session.close()
+            self._shell_session = None
+    
+    def interrupt_shell(self):
+        """Abort the command currently running in the persistent shell session, if any"""
+        session = self._shell_session
+        if session is not None:
+            session.interrupt()
+    
+    def shell(self, command: str, timeout: int = 30) -> Optional[str]:
+        """Run one command line in the device shell
+        
+        Uses the persistent shell session; falls back to a one-shot
+        'adb shell' if the session cannot be used.
+        """
+        if not self.connected_device:
+            self.logger.error("No device connected")
+            return None
+        
+        if self._shell_session is None:
+            self._shell_session = PersistentAdbShell(self.connected_device)
+        try:
+            return self._shell_session.run(command, timeout=timeout)
+        except OSError as e:
+            self.logger.warning(f"Persistent adb shell unavailable ({e}), using one-shot command")
+            return self._run_adb_command(['shell', command], timeout=timeout)
+    
     def turn_screen_on(self) -> bool:
         """Turn device screen on"""
         try:
             # Wake up device
-            result = self._run_adb_command(['shell', 'input', 'keyevent', 'KEYCODE_WAKEUP'])
+            result = self.shell('input keyevent KEYCODE_WAKEUP')
             if result is not None:
                 time.sleep(0.5)  # Wait for screen to turn on
                 self.logger.info("Screen turned on")
@@ -154,7 +283,7 @@ class ADBService:
     def turn_screen_off(self) -> bool:
         """Turn device screen off"""
         try:
-            result = self._run_adb_command(['shell', 'input', 'keyevent', 'KEYCODE_POWER'])
+            result = self.shell('input keyevent KEYCODE_POWER')
             if result is not None:
                 time.sleep(0.5)  # Wait for screen to turn off
                 self.logger.info("Screen turned off")
@@ -167,7 +296,7 @@ class ADBService:
     def press_home_key(self) -> bool:
         """Press home key"""
         try:
-            result = self._run_adb_command(['shell', 'input', 'keyevent', 'KEYCODE_HOME'])
+            result = self.shell('input keyevent KEYCODE_HOME')
             if result is not None:
                 self.logger.info("Home key pressed")
                 return True
@@ -668,6 +797,7 @@ class ADBService:
     
     def disconnect(self):
         """Disconnect from device"""
+        self._close_shell_session()
         self.connected_device = None
         self.device_info = {}
         self.logger.info("Disconnected from ADB device")
@@ -4,14 +4,32 @@ Test Scenario Engine for Automated Testing
 Handles complex test scenarios with ADB, HVPM, and DAQ integration
 """
 
+import atexit
 import time
+import traceback
 import logging
+import logging.handlers
+import math
 import threading
 import os
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass
-from enum import Enum
+import csv
+import queue
+import random
+import re
+import sys
+import zipfile
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape as xml_escape
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Callable, Mapping, NamedTuple, Union
+from dataclasses import dataclass, replace
+from enum import Enum, IntFlag
+from itertools import islice
+
+import numpy as np
 
 try:
     import pandas as pd
@@ -21,9 +39,20 @@ except ImportError:
 
 try:
     import xlsxwriter
+    from xlsxwriter.exceptions import XlsxWriterException
     XLSXWRITER_AVAILABLE = True
+    # TypeError/ValueError: values a writer cannot encode; the export still falls back to CSV
+    _EXCEL_EXPORT_ERRORS = (ImportError, OSError, TypeError, ValueError, XlsxWriterException)
 except ImportError:
     XLSXWRITER_AVAILABLE = False
+    _EXCEL_EXPORT_ERRORS = (ImportError, OSError, TypeError, ValueError)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 try:
     from PyQt6.QtCore import QObject, pyqtSignal, QTimer, QMetaObject, Qt
@@ -35,6 +64,182 @@ except ImportError:
 
 from .adb_service import ADBService
 
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records unformatted (the listener formats them)"""
+    
+    def prepare(self, record):
+        return record
+
+
+def _mean_std(values: np.ndarray, shift: float) -> tuple:
+    """(mean, population std) of a non-empty float64 array from one sum / sum-of-squares pair
+    
+    The sums are taken around `shift` (e.g. the median) rather than 0, so
+    E[x^2] - E[x]^2 does not cancel when the spread is tiny next to the values.
+    """
+    deviations = values - shift
+    n = len(deviations)
+    mean_dev = float(deviations.sum()) / n
+    variance = float(np.dot(deviations, deviations)) / n - mean_dev * mean_dev
+    return shift + mean_dev, math.sqrt(max(variance, 0.0))
+
+
+_daq_log_lock = threading.Lock()
+_daq_log_listener = None
+
+
+def _daq_logger() -> logging.Logger:
+    """Logger for DAQ sampling threads, backed by a QueueHandler
+    
+    The sampling thread only puts records on a queue; a QueueListener thread
+    (started on first use) formats them and writes to stdout.
+    """
+    global _daq_log_listener
+    log = logging.getLogger(__name__ + ".daq")
+    with _daq_log_lock:
+        if _daq_log_listener is None:
+            log_queue = queue.SimpleQueue()
+            log.addHandler(_DeferredQueueHandler(log_queue))
+            log.setLevel(logging.INFO)
+            log.propagate = False  # Root handlers would otherwise run on the sampling thread
+            _daq_log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+            _daq_log_listener.start()
+            atexit.register(_daq_log_listener.stop)  # Flush queued records on exit
+    return log
+
+# Windows sleeps/waits round up to the ~15.6 ms system tick; ms-paced loops
+# raise the timer resolution to 1 ms while they run (timeBeginPeriod)
+if sys.platform == 'win32':
+    try:
+        import ctypes
+        _WINMM = ctypes.windll.winmm
+    except (ImportError, OSError, AttributeError):
+        _WINMM = None
+else:
+    _WINMM = None
+
+# Captures at or above this many rows skip pandas/xlsxwriter and write the
+# worksheet XML directly (see _export_fast_xlsx)
+_FAST_XLSX_MIN_ROWS = 100_000
+_FAST_XLSX_CHUNK_ROWS = 5_000
+# xlsxwriter keeps worksheet parts in memory up to this many rows; larger
+# workbooks stream their parts through temp files (export_tmpdir)
+_XLSX_IN_MEMORY_MAX_ROWS = 200_000
+# Preallocated staging buffer; sheet XML reaches zlib in writes of this size
+_FAST_XLSX_BUFFER_BYTES = 4 << 20
+
+# Zip compression for the fast xlsx path. 'stored' skips deflate, which costs
+# more CPU than it saves on a local disk for mostly-numeric sheets
+_XLSX_COMPRESSION = {
+    'deflated': zipfile.ZIP_DEFLATED,
+    'stored': zipfile.ZIP_STORED,
+}
+
+# Column letters A..ZZ, computed once instead of per cell
+_XLSX_COLUMNS = tuple(
+    [chr(65 + i) for i in range(26)] +
+    [chr(65 + i) + chr(65 + j) for i in range(26) for j in range(26)]
+)
+
+_XLSX_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_XLSX_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_XLSX_SHEET_CT = 'application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml'
+
+# Minimal package skeleton for a two-sheet workbook (Test_Results, Test_Summary)
+_XLSX_SKELETON = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        f'<Override PartName="/xl/worksheets/sheet1.xml" ContentType="{_XLSX_SHEET_CT}"/>'
+        f'<Override PartName="/xl/worksheets/sheet2.xml" ContentType="{_XLSX_SHEET_CT}"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'<Relationship Id="rId1" Type="{_XLSX_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<workbook xmlns="{_XLSX_NS}" xmlns:r="{_XLSX_REL_NS}"><sheets>'
+        '<sheet name="Test_Results" sheetId="1" r:id="rId1"/>'
+        '<sheet name="Test_Summary" sheetId="2" r:id="rId2"/>'
+        '</sheets></workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'<Relationship Id="rId1" Type="{_XLSX_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+        f'<Relationship Id="rId2" Type="{_XLSX_REL_NS}/worksheet" Target="worksheets/sheet2.xml"/>'
+        f'<Relationship Id="rId3" Type="{_XLSX_REL_NS}/styles" Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/styles.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<styleSheet xmlns="{_XLSX_NS}">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    ),
+}
+
+_XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<worksheet xmlns="{_XLSX_NS}"><sheetData>'
+).encode('utf-8')
+_XLSX_SHEET_TAIL = b'</sheetData></worksheet>'
+
+
+# Fixed head of the Test_Summary sheet (values filled per export)
+_SUMMARY_KEYS = ('Test Name', 'Start Time', 'Data Points', 'Duration (s)')
+
+
+def _drop_page_cache(path: str):
+    """Ask the OS to evict a finished export file from the page cache
+    
+    Exports are written once and rarely read back; dropping them keeps memory
+    for the next scenario. No-op where posix_fadvise is unavailable (Windows).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _xlsx_cell(ref: str, value) -> str:
+    """Format a single worksheet cell (number or inline string; NaN/inf become an empty cell)"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if not math.isfinite(value):
+            return f'<c r="{ref}"/>'
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    return f'<c r="{ref}" t="inlineStr"><is><t>{xml_escape(str(value))}</t></is></c>'
+
+
+def _xlsx_sparse_row(row_num: int, row: tuple, columns: tuple) -> str:
+    """Format one Test_Results row, leaving out cells for NaN/inf samples (which <v> cannot hold)"""
+    cells = [f'<c r="{columns[0]}{row_num}"><v>{row[0]:d}</v></c>']
+    cells += [f'<c r="{col}{row_num}"><v>{value:.6g}</v></c>'
+              for col, value in zip(columns[1:], row[1:]) if math.isfinite(value)]
+    return f'<row r="{row_num}">' + ''.join(cells) + '</row>'
+
 
 class TestStatus(Enum):
     """Test execution status"""
@@ -46,13 +251,39 @@ class TestStatus(Enum):
     STOPPED = "stopped"
 
 
-@dataclass
+class StepKind(IntFlag):
+    """Step category, assigned when a scenario is defined"""
+    OTHER = 0
+    INIT = 1
+    DEFAULT = 2
+    STABILIZE = 4
+    DAQ = 8
+    TEST = 16
+    EXPORT = 32
+
+
+@dataclass(frozen=True, slots=True)
 class TestStep:
     """Individual test step"""
     name: str
     duration: float  # seconds
     action: str
     parameters: Dict[str, Any] = None
+    kind: StepKind = StepKind.OTHER
+
+
+class ExportSchema(NamedTuple):
+    """Channel layout shared by the DAQ exports (see _resolve_export_schema)"""
+    enabled_channels: tuple
+    rail_names: Mapping[str, str]
+    measurement_mode: str
+
+
+class BrowserEnv(NamedTuple):
+    """Device wrapper, evaluation context and action library shared by the browser steps"""
+    device: Any
+    ctx: Any
+    act: Any
 
 
 @dataclass
@@ -65,6 +296,182 @@ class TestConfig:
     monitoring_interval: float = 0.001  # 1ms interval
     test_duration: float = 20.0
     steps: List[TestStep] = None
+    quick_steps: List[TestStep] = None  # Steps for repeat iterations 2+ (see _build_quick_steps)
+
+
+# log_callback level strings -> logging levels
+_LEVEL = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "success": logging.INFO,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+# Verbosity rank for _log(); higher is chattier
+_LOG_RANK = {"error": 0, "warn": 1, "success": 2, "info": 2, "debug": 3}
+
+# One screen on/off cycle as a single device-side batch (off, 1s, on, 1s)
+_SCREEN_CYCLE_BATCH = ("input keyevent KEYCODE_POWER", "sleep 1", "input keyevent KEYCODE_WAKEUP", "sleep 1")
+# Browser-test UI selectors, built once. Patterns stay strings: uiautomator evaluates
+# textMatches on the device, so a Python re.Pattern could not be sent in their place.
+_SEL_CONTINUE = MappingProxyType({"textMatches": "(?i)Continue"})
+_SEL_NOT_NOW = MappingProxyType({"textMatches": "(?i)Not now"})
+_SEL_CLEAR = MappingProxyType({"text": "Clear"})  # Exact match instead of a \Q...\E regex
+_SEL_LOCATION_BAR = MappingProxyType({"resourceId": "com.sec.android.app.sbrowser:id/location_bar_edit_text"})
+_SEL_GOOGLE_ONBOARDING = tuple(MappingProxyType({"resourceId": f"com.google.android.googlequicksearchbox:id/{res}"}) for res in (
+    "omnient_onboarding_continue_button",
+    "omnient_onboarding_complete_btn",
+    "omnient_onboarding_dialog_complete_btn",
+    "omnient_onboarding_tooltip_page_close_button",
+))
+
+# uiautomator node bounds: "[x1,y1][x2,y2]"
+_BOUNDS_RE = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+
+# The whole screen on/off pattern as one device-side loop ({cycles} cycles, 2 s each)
+_SCREEN_CYCLE_SCRIPT = "for i in $(seq 1 {cycles}); do " + " ; ".join(_SCREEN_CYCLE_BATCH) + " ; done"
+# Wall-clock budget per cycle: 2 s of sleeps plus two 'input keyevent' calls, each of
+# which starts app_process (typically 0.2-0.5 s, longer on a busy device)
+_SCREEN_CYCLE_BUDGET_S = 4.0
+
+# Pre-bound formatters for the per-second screen-test progress messages
+_FMT_SCREEN_PROGRESS = "Screen Test: {:.1f}s / {}s".format
+_FMT_SCREEN_PCT = "Screen Test: {}%".format
+
+# Repeat iterations 2+ skip device setup (INIT/DEFAULT/STABILIZE) and only
+# re-run DAQ/test/export steps
+_REPEAT_KINDS = StepKind.DAQ | StepKind.TEST | StepKind.EXPORT
+
+
+def _quick_mode(scenario_key: str) -> str:
+    """Classify a scenario key for repeat iterations: 'screen_onoff', 'wifi' or 'default'"""
+    scenario_key = (scenario_key or '').lower()
+    if 'screen' in scenario_key and 'onoff' in scenario_key:
+        return 'screen_onoff'
+    if 'wifi' in scenario_key:
+        return 'wifi'
+    return 'default'
+
+
+def _is_screen_onoff(scenario_key: str, scenario_name: str) -> bool:
+    """Whether a scenario is a Screen On/Off test, by key or by display name"""
+    if _quick_mode(scenario_key) == 'screen_onoff':
+        return True
+    scenario_name = (scenario_name or '').lower()
+    return 'screen' in scenario_name and ('on' in scenario_name or 'off' in scenario_name)
+
+
+def _build_quick_steps(scenario_key: str, steps: List[TestStep]) -> List[TestStep]:
+    """Build the step list for repeat iterations 2+ (computed once per scenario)"""
+    if _quick_mode(scenario_key) in ('screen_onoff', 'wifi'):
+        # Screen off / WiFi+BT already configured from 1st iteration: 10s stabilization only
+        head = TestStep("quick_stabilization", 10.0, "quick_stabilization_10s", kind=StepKind.STABILIZE)
+    else:
+        head = TestStep("quick_reset", 0.0, "quick_reset_before_test", kind=StepKind.INIT)
+    return [head] + [step for step in steps if step.kind & _REPEAT_KINDS]
+
+
+class DAQBuffer:
+    """Columnar (SoA) store for DAQ samples
+    
+    Each column is a preallocated NumPy array filled by a running sample index,
+    instead of one dict per sample. len(), indexing and iteration still yield
+    row dicts so code written for the list-of-dicts daq_data keeps working;
+    exports should read whole columns via column() / to_dict().
+    
+    If started_at is given, rows and to_dict() include a derived 'timestamp'
+    (started_at + time_key * time_scale seconds) instead of storing one per sample.
+    """
+    
+    def __init__(self, columns: List[str], capacity: int = 1024, dtypes: Dict[str, Any] = None,
+                 started_at: Optional[datetime] = None, time_key: str = 'time_elapsed', time_scale: float = 1.0):
+        dtypes = dtypes or {}
+        self._names = tuple(columns)
+        self._cols = {name: np.empty(max(int(capacity), 1), dtype=dtypes.get(name, np.float64))
+                      for name in self._names}
+        self._n = 0
+        self.started_at = started_at
+        self.time_key = time_key
+        self.time_scale = time_scale
+    
+    @property
+    def columns(self) -> tuple:
+        return self._names
+    
+    def _grow(self, min_capacity: int):
+        capacity = len(self._cols[self._names[0]])
+        while capacity < min_capacity:
+            capacity *= 2
+        for name, col in self._cols.items():
+            grown = np.empty(capacity, dtype=col.dtype)
+            grown[:self._n] = col[:self._n]
+            self._cols[name] = grown
+    
+    def append(self, row: Dict[str, Any]):
+        """Append one sample given as a dict (missing columns are stored as 0)"""
+        i = self._n
+        if i >= len(self._cols[self._names[0]]):
+            self._grow(i + 1)
+        for name, col in self._cols.items():
+            col[i] = row.get(name, 0)
+        self._n = i + 1
+    
+    def append_values(self, values):
+        """Append one sample given as values in column order"""
+        i = self._n
+        if i >= len(self._cols[self._names[0]]):
+            self._grow(i + 1)
+        for col, value in zip(self._cols.values(), values):
+            col[i] = value
+        self._n = i + 1
+    
+    def extend_columns(self, columns: Dict[str, Any]):
+        """Append a block of samples given as whole columns (missing columns are stored as 0)"""
+        count = len(next(iter(columns.values()))) if columns else 0
+        start = self._n
+        if start + count > len(self._cols[self._names[0]]):
+            self._grow(start + count)
+        for name, col in self._cols.items():
+            col[start:start + count] = columns.get(name, 0)
+        self._n = start + count
+    
+    def column(self, name: str) -> np.ndarray:
+        """View of the filled part of one column"""
+        return self._cols[name][:self._n]
+    
+    def timestamps(self) -> np.ndarray:
+        """Wall-clock timestamps derived from started_at and the time column"""
+        offsets_us = (self.column(self.time_key) * (self.time_scale * 1e6)).astype('timedelta64[us]')
+        return np.datetime64(self.started_at, 'us') + offsets_us
+    
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Column name -> filled array view (plus derived 'timestamp' when available)"""
+        data = {'timestamp': self.timestamps()} if self.started_at is not None else {}
+        data.update((name, col[:self._n]) for name, col in self._cols.items())
+        return data
+    
+    def __len__(self) -> int:
+        return self._n
+    
+    def _row(self, i: int) -> Dict[str, Any]:
+        row = {name: col[i].item() for name, col in self._cols.items()}
+        if self.started_at is not None:
+            row = {'timestamp': self.started_at + timedelta(seconds=row[self.time_key] * self.time_scale), **row}
+        return row
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._n))]
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("DAQBuffer index out of range")
+        return self._row(index)
+    
+    def __iter__(self):
+        for i in range(self._n):
+            yield self._row(i)
 
 
 @dataclass
@@ -76,6 +483,172 @@ class TestResult:
     status: TestStatus = TestStatus.IDLE
     daq_data: List[Dict[str, Any]] = None
     error_message: str = ""
+    is_screen_onoff: bool = False  # Quick reset turns the screen off between iterations
+
+
+def _build_builtin_scenarios() -> Mapping[str, TestConfig]:
+    """Build the built-in test scenarios (once, at import)"""
+    scenarios = {}
+    
+    # Removed Screen On/Off and Browser Performance Test scenarios
+    
+    # Phone App Test Scenario
+    phone_app_config = TestConfig(
+        name="Phone App Power Test",
+        description="Test power consumption during Phone app usage with init mode setup",
+        test_duration=10.0,  # Phone app test duration
+        stabilization_time=10.0
+    )
+    
+    phone_app_config.steps = [
+        # Init Mode Setup - Scenario-specific settings
+        TestStep("init_hvpm", 2.0, "set_hvpm_voltage", {"voltage": 4.0}, kind=StepKind.INIT),
+        TestStep("init_adb", 3.0, "setup_adb_device", kind=StepKind.INIT),
+        
+        # Default Settings - Clean state (after ADB connection)
+        TestStep("default_settings", 5.0, "apply_default_settings", kind=StepKind.DEFAULT),
+        
+        TestStep("lcd_on_unlock_early", 3.0, "lcd_on_and_unlock", kind=StepKind.INIT),  # LCD ON + Unlock first
+        TestStep("init_flight_mode", 2.0, "enable_flight_mode", kind=StepKind.INIT),
+        TestStep("init_wifi_2g", 8.0, "connect_wifi_2g", kind=StepKind.INIT),
+        TestStep("home_after_wifi", 2.0, "go_to_home", kind=StepKind.INIT),  # Home after WiFi
+        TestStep("init_bluetooth", 3.0, "enable_bluetooth", kind=StepKind.INIT),
+        TestStep("home_after_bluetooth", 2.0, "go_to_home", kind=StepKind.INIT),  # Home after Bluetooth
+        TestStep("init_screen_timeout", 3.0, "set_screen_timeout_10min", kind=StepKind.INIT),
+        TestStep("init_clear_apps", 8.0, "home_and_clear_apps_only", kind=StepKind.INIT),  # No unlock (already done)
+        
+        # Stabilization - 75 seconds for current stabilization after WiFi/Bluetooth
+        TestStep("stabilize", 75.0, "wait_stabilization", kind=StepKind.STABILIZE),
+        
+        # DAQ Start + Phone App Test + DAQ Stop (separated)
+        TestStep("start_daq", 2.0, "start_daq_monitoring", kind=StepKind.DAQ),
+        TestStep("phone_app_test", 0.0, "phone_app_scenario_test", kind=StepKind.TEST),  # Duration 0: function handles timing
+        TestStep("stop_daq", 2.0, "stop_daq_monitoring", kind=StepKind.DAQ),
+        
+        # Export results
+        TestStep("save_data", 2.0, "export_to_excel", kind=StepKind.EXPORT)
+    ]
+    
+    scenarios["phone_app_test"] = phone_app_config
+
+    # Screen On/Off Test Scenario (LCD를 3초마다 켜고 끄는 전력 소비 테스트)
+    screen_onoff_config = TestConfig(
+        name="Screen On/Off Test",
+        description="LCD를 3초마다 켜고 끄는 전력 소비 테스트 (hold key 10회)",
+        test_duration=30.0,  # 30초 테스트
+        stabilization_time=60.0  # 1분 안정화
+    )
+    
+    screen_onoff_config.steps = [
+        # Init Mode Setup - ADB connection first
+        TestStep("init_adb", 3.0, "setup_adb_device", kind=StepKind.INIT),
+        
+        # Default Settings (after ADB connection)
+        TestStep("default_settings", 5.0, "apply_default_settings", kind=StepKind.DEFAULT),
+        
+        # Init Mode Setup
+        TestStep("lcd_on_unlock", 3.0, "lcd_on_and_unlock", kind=StepKind.INIT),
+        TestStep("flight_mode", 2.0, "enable_flight_mode", kind=StepKind.INIT),
+        TestStep("bluetooth_on", 3.0, "enable_bluetooth", kind=StepKind.INIT),
+        TestStep("clear_apps", 8.0, "clear_recent_apps", kind=StepKind.INIT),
+        TestStep("lcd_off", 2.0, "lcd_off", kind=StepKind.INIT),
+        
+        # 전류 안정화 1분
+        TestStep("stabilize", 60.0, "wait_stabilization", kind=StepKind.STABILIZE),
+        
+        # DAQ Start + Screen On/Off Test + DAQ Stop
+        TestStep("start_daq", 2.0, "start_daq_monitoring", kind=StepKind.DAQ),
+        TestStep("screen_onoff_test", 0.0, "screen_onoff_test", kind=StepKind.TEST),  # Duration 0: function handles timing
+        TestStep("stop_daq", 2.0, "stop_daq_monitoring", kind=StepKind.DAQ),
+        
+        # Export results
+        TestStep("save_data", 2.0, "export_to_excel", kind=StepKind.EXPORT)
+    ]
+    
+    scenarios["screen_onoff_test"] = screen_onoff_config
+
+    # WiFi 2G 15분 대기 Test Scenario
+    wifi_2g_config = TestConfig(
+        name="WiFi 2G 15분 대기 Test",
+        description="WiFi 2.4GHz 연결 후 15분간 전력 소비 측정",
+        test_duration=900.0,  # 15분 테스트
+        stabilization_time=60.0  # 1분 안정화
+    )
+
+    wifi_2g_config.steps = [
+        # Init Mode Setup - ADB connection first
+        TestStep("init_adb", 3.0, "setup_adb_device", kind=StepKind.INIT),
+
+        # Default Settings (after ADB connection)
+        TestStep("default_settings", 5.0, "apply_default_settings", kind=StepKind.DEFAULT),
+
+        # Init Mode Setup
+        TestStep("lcd_on_unlock", 3.0, "lcd_on_and_unlock", kind=StepKind.INIT),
+        TestStep("enable_aod", 2.0, "enable_aod", kind=StepKind.INIT),
+        TestStep("flight_mode", 2.0, "enable_flight_mode", kind=StepKind.INIT),
+        TestStep("wifi_2g_connect", 10.0, "connect_wifi_2g", kind=StepKind.INIT),
+        TestStep("bluetooth_on", 5.0, "enable_bluetooth", kind=StepKind.INIT),
+        TestStep("lcd_off", 2.0, "lcd_off", kind=StepKind.INIT),
+
+        # 전류 안정화 1분
+        TestStep("stabilize", 60.0, "wait_stabilization", kind=StepKind.STABILIZE),
+
+        # DAQ Start + 15분 대기 + DAQ Stop
+        TestStep("start_daq", 2.0, "start_daq_monitoring", kind=StepKind.DAQ),
+        TestStep("wifi_2g_wait", 0.0, "wait_15_minutes", kind=StepKind.TEST),  # Duration 0: function handles 15min timing
+        TestStep("stop_daq", 2.0, "stop_daq_monitoring", kind=StepKind.DAQ),
+
+        # Export results
+        TestStep("save_data", 2.0, "export_to_excel", kind=StepKind.EXPORT)
+    ]
+
+    scenarios["wifi_2g_test"] = wifi_2g_config
+
+    # WiFi 5G 15분 대기 Test Scenario
+    wifi_5g_config = TestConfig(
+        name="WiFi 5G 15분 대기 Test",
+        description="WiFi 5GHz 연결 후 15분간 전력 소비 측정",
+        test_duration=900.0,  # 15분 테스트
+        stabilization_time=60.0  # 1분 안정화
+    )
+
+    wifi_5g_config.steps = [
+        # Init Mode Setup - ADB connection first
+        TestStep("init_adb", 3.0, "setup_adb_device", kind=StepKind.INIT),
+
+        # Default Settings (after ADB connection)
+        TestStep("default_settings", 5.0, "apply_default_settings", kind=StepKind.DEFAULT),
+
+        # Init Mode Setup
+        TestStep("lcd_on_unlock", 3.0, "lcd_on_and_unlock", kind=StepKind.INIT),
+        TestStep("enable_aod", 2.0, "enable_aod", kind=StepKind.INIT),
+        TestStep("flight_mode", 2.0, "enable_flight_mode", kind=StepKind.INIT),
+        TestStep("wifi_5g_connect", 10.0, "connect_wifi_5g", kind=StepKind.INIT),
+        TestStep("bluetooth_on", 5.0, "enable_bluetooth", kind=StepKind.INIT),
+        TestStep("lcd_off", 2.0, "lcd_off", kind=StepKind.INIT),
+
+        # 전류 안정화 1분
+        TestStep("stabilize", 60.0, "wait_stabilization", kind=StepKind.STABILIZE),
+
+        # DAQ Start + 15분 대기 + DAQ Stop
+        TestStep("start_daq", 2.0, "start_daq_monitoring", kind=StepKind.DAQ),
+        TestStep("wifi_5g_wait", 0.0, "wait_15_minutes", kind=StepKind.TEST),  # Duration 0: function handles 15min timing
+        TestStep("stop_daq", 2.0, "stop_daq_monitoring", kind=StepKind.DAQ),
+
+        # Export results
+        TestStep("save_data", 2.0, "export_to_excel", kind=StepKind.EXPORT)
+    ]
+
+    scenarios["wifi_5g_test"] = wifi_5g_config
+
+    # Precompute repeat-iteration step lists once per scenario
+    for key, config in scenarios.items():
+        config.quick_steps = _build_quick_steps(key, config.steps)
+    
+    return MappingProxyType(scenarios)
+
+
+_BUILTIN_SCENARIOS = _build_builtin_scenarios()
 
 
 class TestScenarioEngine(QObject):
@@ -89,6 +662,16 @@ class TestScenarioEngine(QObject):
     def __init__(self, hvpm_service=None, daq_service=None, log_callback: Callable = None):
         super().__init__()
         self.logger = logging.getLogger(__name__)
+        
+        # Signal emitter chosen once: Qt signals are thread-safe (queued connections)
+        # and do not raise, so no per-call guard is needed
+        if QT_AVAILABLE:
+            self._emit = lambda signal, *args: signal.emit(*args)
+        else:
+            self._emit = lambda signal, *args: None
+        self._ui_log_enabled = QT_AVAILABLE  # log_message signal reaches the UI log
+        # Hot-loop messages sent through _log() are dropped above this rank (DOU_LOG=error|warn|info|debug)
+        self._log_min_level = _LOG_RANK.get(os.environ.get("DOU_LOG", "info").lower(), _LOG_RANK["info"])
         self.hvpm_service = hvpm_service
         self.daq_service = daq_service
         self.adb_service = ADBService()
@@ -97,20 +680,49 @@ class TestScenarioEngine(QObject):
         self.current_test: Optional[TestResult] = None
         self.status = TestStatus.IDLE
         self.test_thread: Optional[threading.Thread] = None
-        self.stop_requested = False
+        self._stop_evt = threading.Event()  # Set by stop_test(); wakes any waits immediately
         
         # DAQ monitoring
         self.daq_data = []
         self.monitoring_thread: Optional[threading.Thread] = None
-        self.monitoring_active = False
+        self._monitor_stop_evt = threading.Event()  # Set = monitoring off; see monitoring_active
+        self._monitor_stop_evt.set()
+        self._screen_start_evt = threading.Event()  # Set = screen test begun; see _screen_test_started
+        self._screen_test_start_time: Optional[float] = None  # monotonic() at screen test start
         
         # Multi-channel monitor integration
         self.multi_channel_monitor = None
         self.enabled_channels = []
+        # Monitor configuration snapshot for the running test (None outside a run)
+        self._cached_channels: Optional[List[str]] = None
+        self._cached_rails: Optional[Dict[str, str]] = None
+        self._cached_mode: Optional[str] = None
+        self._export_schema: Optional[ExportSchema] = None  # See _resolve_export_schema
+        self._rng = np.random.default_rng()  # Simulated DAQ readings
+        self._results_dir_ready = False  # test_results/ known to exist
+        self._browser: Optional[BrowserEnv] = None  # Set by _step_setup_browser_environment
+        self._collector = (None, None)  # ((mode, channels), compiled collector) for _collect_daq_data_point
         
         # Progress tracking
         self.current_step = 0
         self.total_steps = 0
+        self._last_emitted_pct = -1  # Last screen-test percentage sent by _update_test_progress_only
+        self._last_progress = -1  # Last value and monotonic_ns() time sent by _emit_progress
+        self._last_progress_emit_ns = 0
+        self.current_scenario: Optional[str] = None
+        self.repeat_count = 1
+        self.current_repeat = 0
+        
+        # Ordered background ADB commands (single worker keeps device actions in sequence)
+        self._adb_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TSE-adb")
+        
+        # Background Excel export (single worker keeps exports ordered)
+        self._export_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ExcelExport")
+        self.export_tmpdir: Optional[str] = None  # xlsxwriter temp dir for large workbooks (None = system default)
+        self._log_batched: queue.SimpleQueue = queue.SimpleQueue()  # (message, level) from Excel exports, see log_callback_flush
+        
+        # Step action name -> handler, one dict lookup per step
+        self._action_dispatch = self._build_action_dispatch()
         
         # Register built-in scenarios
         self.scenarios = {}
@@ -118,186 +730,54 @@ class TestScenarioEngine(QObject):
     
     def _default_log(self, message: str, level: str = "info"):
         """Default logging function"""
-        if level == "error":
-            self.logger.error(message)
-        elif level == "warn":
-            self.logger.warning(message)
-        else:
-            self.logger.info(message)
+        lvl = _LEVEL.get(level, logging.INFO)
+        logger_enabled = self.logger.isEnabledFor(lvl)
+        if not logger_enabled and not self._ui_log_enabled:
+            return  # Nobody consumes this record
+        if logger_enabled:
+            self.logger.log(lvl, message)
         
         # Emit log signal for thread-safe UI updates
-        self._emit_signal_safe(self.log_message, message, level)
+        self._emit(self.log_message, message, level)
     
-    def _emit_signal_safe(self, signal, *args):
-        """Thread-safe signal emission"""
-        if QT_AVAILABLE:
+    def _log_traceback(self, label: str = "Traceback"):
+        """Log the active exception's traceback; only formatted when DOU_LOG=debug
+        
+        Callers log the error message itself unconditionally; the full stack is
+        diagnostic detail that is not worth building at normal verbosity.
+        """
+        if _LOG_RANK["debug"] <= self._log_min_level:
+            self.log_callback(f"{label}: {traceback.format_exc()}", "error")
+    
+    def _log(self, level: str, fmt: str, *args):
+        """Log a %-style message, formatting it only if level passes DOU_LOG"""
+        if _LOG_RANK.get(level, _LOG_RANK["info"]) > self._log_min_level:
+            return
+        self.log_callback(fmt % args if args else fmt, level)
+    
+    def log_callback_flush(self):
+        """Forward batched export log messages to log_callback"""
+        while True:
             try:
-                # Qt signals are thread-safe by default when using queued connections
-                # Just emit directly - Qt will handle the thread safety
-                signal.emit(*args)
-            except Exception as e:
-                # Fallback to print if Qt signals fail
-                print(f"Signal emit error: {e}, args: {args}")
+                message, level = self._log_batched.get_nowait()
+            except queue.Empty:
+                break
+            self.log_callback(message, level)
     
     def _register_builtin_scenarios(self):
         """Register built-in test scenarios"""
         self.log_callback("Registering built-in test scenarios...", "info")
         
-        # Removed Screen On/Off and Browser Performance Test scenarios
-        
-        # Phone App Test Scenario
-        phone_app_config = TestConfig(
-            name="Phone App Power Test",
-            description="Test power consumption during Phone app usage with init mode setup",
-            test_duration=10.0,  # Phone app test duration
-            stabilization_time=10.0
-        )
-        
-        phone_app_config.steps = [
-            # Init Mode Setup - Scenario-specific settings
-            TestStep("init_hvpm", 2.0, "set_hvpm_voltage", {"voltage": 4.0}),
-            TestStep("init_adb", 3.0, "setup_adb_device"),
-            
-            # Default Settings - Clean state (after ADB connection)
-            TestStep("default_settings", 5.0, "apply_default_settings"),
-            
-            TestStep("lcd_on_unlock_early", 3.0, "lcd_on_and_unlock"),  # LCD ON + Unlock first
-            TestStep("init_flight_mode", 2.0, "enable_flight_mode"),
-            TestStep("init_wifi_2g", 8.0, "connect_wifi_2g"),
-            TestStep("home_after_wifi", 2.0, "go_to_home"),  # Home after WiFi
-            TestStep("init_bluetooth", 3.0, "enable_bluetooth"),
-            TestStep("home_after_bluetooth", 2.0, "go_to_home"),  # Home after Bluetooth
-            TestStep("init_screen_timeout", 3.0, "set_screen_timeout_10min"),
-            TestStep("init_clear_apps", 8.0, "home_and_clear_apps_only"),  # No unlock (already done)
-            
-            # Stabilization - 75 seconds for current stabilization after WiFi/Bluetooth
-            TestStep("stabilize", 75.0, "wait_stabilization"),
-            
-            # DAQ Start + Phone App Test + DAQ Stop (separated)
-            TestStep("start_daq", 2.0, "start_daq_monitoring"),
-            TestStep("phone_app_test", 0.0, "phone_app_scenario_test"),  # Duration 0: function handles timing
-            TestStep("stop_daq", 2.0, "stop_daq_monitoring"),
-            
-            # Export results
-            TestStep("save_data", 2.0, "export_to_excel")
-        ]
-        
-        self.scenarios["phone_app_test"] = phone_app_config
-        self.log_callback(f"Registered scenario: {phone_app_config.name} (key: phone_app_test)", "info")
-
-        # Screen On/Off Test Scenario (LCD를 3초마다 켜고 끄는 전력 소비 테스트)
-        screen_onoff_config = TestConfig(
-            name="Screen On/Off Test",
-            description="LCD를 3초마다 켜고 끄는 전력 소비 테스트 (hold key 10회)",
-            test_duration=30.0,  # 30초 테스트
-            stabilization_time=60.0  # 1분 안정화
-        )
-        
-        screen_onoff_config.steps = [
-            # Init Mode Setup - ADB connection first
-            TestStep("init_adb", 3.0, "setup_adb_device"),
-            
-            # Default Settings (after ADB connection)
-            TestStep("default_settings", 5.0, "apply_default_settings"),
-            
-            # Init Mode Setup
-            TestStep("lcd_on_unlock", 3.0, "lcd_on_and_unlock"),
-            TestStep("flight_mode", 2.0, "enable_flight_mode"),
-            TestStep("bluetooth_on", 3.0, "enable_bluetooth"),
-            TestStep("clear_apps", 8.0, "clear_recent_apps"),
-            TestStep("lcd_off", 2.0, "lcd_off"),
-            
-            # 전류 안정화 1분
-            TestStep("stabilize", 60.0, "wait_stabilization"),
-            
-            # DAQ Start + Screen On/Off Test + DAQ Stop
-            TestStep("start_daq", 2.0, "start_daq_monitoring"),
-            TestStep("screen_onoff_test", 0.0, "screen_onoff_test"),  # Duration 0: function handles timing
-            TestStep("stop_daq", 2.0, "stop_daq_monitoring"),
-            
-            # Export results
-            TestStep("save_data", 2.0, "export_to_excel")
-        ]
+        # Definitions are built once at import (_BUILTIN_SCENARIOS); each engine gets its own
+        # TestConfig copies (and step lists) so per-run changes such as quick_steps stay local
+        self.scenarios = {
+            key: replace(config, steps=list(config.steps),
+                         quick_steps=list(config.quick_steps) if config.quick_steps is not None else None)
+            for key, config in _BUILTIN_SCENARIOS.items()
+        }
+        for key, config in self.scenarios.items():
+            self.log_callback(f"Registered scenario: {config.name} (key: {key})", "info")
         
-        self.scenarios["screen_onoff_test"] = screen_onoff_config
-        self.log_callback(f"Registered scenario: {screen_onoff_config.name} (key: screen_onoff_test)", "info")
-
-        # WiFi 2G 15분 대기 Test Scenario
-        wifi_2g_config = TestConfig(
-            name="WiFi 2G 15분 대기 Test",
-            description="WiFi 2.4GHz 연결 후 15분간 전력 소비 측정",
-            test_duration=900.0,  # 15분 테스트
-            stabilization_time=60.0  # 1분 안정화
-        )
-
-        wifi_2g_config.steps = [
-            # Init Mode Setup - ADB connection first
-            TestStep("init_adb", 3.0, "setup_adb_device"),
-
-            # Default Settings (after ADB connection)
-            TestStep("default_settings", 5.0, "apply_default_settings"),
-
-            # Init Mode Setup
-            TestStep("lcd_on_unlock", 3.0, "lcd_on_and_unlock"),
-            TestStep("enable_aod", 2.0, "enable_aod"),
-            TestStep("flight_mode", 2.0, "enable_flight_mode"),
-            TestStep("wifi_2g_connect", 10.0, "connect_wifi_2g"),
-            TestStep("bluetooth_on", 5.0, "enable_bluetooth"),
-            TestStep("lcd_off", 2.0, "lcd_off"),
-
-            # 전류 안정화 1분
-            TestStep("stabilize", 60.0, "wait_stabilization"),
-
-            # DAQ Start + 15분 대기 + DAQ Stop
-            TestStep("start_daq", 2.0, "start_daq_monitoring"),
-            TestStep("wifi_2g_wait", 0.0, "wait_15_minutes"),  # Duration 0: function handles 15min timing
-            TestStep("stop_daq", 2.0, "stop_daq_monitoring"),
-
-            # Export results
-            TestStep("save_data", 2.0, "export_to_excel")
-        ]
-
-        self.scenarios["wifi_2g_test"] = wifi_2g_config
-        self.log_callback(f"Registered scenario: {wifi_2g_config.name} (key: wifi_2g_test)", "info")
-
-        # WiFi 5G 15분 대기 Test Scenario
-        wifi_5g_config = TestConfig(
-            name="WiFi 5G 15분 대기 Test",
-            description="WiFi 5GHz 연결 후 15분간 전력 소비 측정",
-            test_duration=900.0,  # 15분 테스트
-            stabilization_time=60.0  # 1분 안정화
-        )
-
-        wifi_5g_config.steps = [
-            # Init Mode Setup - ADB connection first
-            TestStep("init_adb", 3.0, "setup_adb_device"),
-
-            # Default Settings (after ADB connection)
-            TestStep("default_settings", 5.0, "apply_default_settings"),
-
-            # Init Mode Setup
-            TestStep("lcd_on_unlock", 3.0, "lcd_on_and_unlock"),
-            TestStep("enable_aod", 2.0, "enable_aod"),
-            TestStep("flight_mode", 2.0, "enable_flight_mode"),
-            TestStep("wifi_5g_connect", 10.0, "connect_wifi_5g"),
-            TestStep("bluetooth_on", 5.0, "enable_bluetooth"),
-            TestStep("lcd_off", 2.0, "lcd_off"),
-
-            # 전류 안정화 1분
-            TestStep("stabilize", 60.0, "wait_stabilization"),
-
-            # DAQ Start + 15분 대기 + DAQ Stop
-            TestStep("start_daq", 2.0, "start_daq_monitoring"),
-            TestStep("wifi_5g_wait", 0.0, "wait_15_minutes"),  # Duration 0: function handles 15min timing
-            TestStep("stop_daq", 2.0, "stop_daq_monitoring"),
-
-            # Export results
-            TestStep("save_data", 2.0, "export_to_excel")
-        ]
-
-        self.scenarios["wifi_5g_test"] = wifi_5g_config
-        self.log_callback(f"Registered scenario: {wifi_5g_config.name} (key: wifi_5g_test)", "info")
-
         self.log_callback(f"Total scenarios registered: {len(self.scenarios)}", "info")
     
     def get_available_scenarios(self) -> Dict[str, TestConfig]:
@@ -325,8 +805,7 @@ class TestScenarioEngine(QObject):
         # Reset state for new test (stability improvement)
         try:
             self._screen_test_start_time = None
-            if hasattr(self, '_screen_test_started'):
-                self._screen_test_started.clear()
+            self._screen_test_started = False
             self.monitoring_active = False
             self.daq_data = []
             self.log_callback("Test state reset for new execution", "info")
@@ -338,7 +817,8 @@ class TestScenarioEngine(QObject):
         self.current_test = TestResult(
             scenario_name=scenario_name,
             start_time=datetime.now(),
-            daq_data=[]
+            daq_data=[],
+            is_screen_onoff=_is_screen_onoff(scenario_name, scenario.name)
         )
         
         # Initialize progress tracking
@@ -350,7 +830,7 @@ class TestScenarioEngine(QObject):
         self.current_repeat = 0
         
         self.status = TestStatus.INITIALIZING
-        self.stop_requested = False
+        self._stop_evt.clear()
         
         # Execute test in separate thread for UI responsiveness
         self.log_callback(f"Starting test scenario: {scenario_name} (Repeat: {repeat_count} times)", "info")
@@ -360,6 +840,7 @@ class TestScenarioEngine(QObject):
             self.test_thread = threading.Thread(
                 target=self._execute_test_with_repeat,
                 args=(scenario,),
+                name="TSE-exec",
                 daemon=True
             )
             self.test_thread.start()
@@ -369,32 +850,65 @@ class TestScenarioEngine(QObject):
             self.status = TestStatus.FAILED
             return False
     
+    @property
+    def stop_requested(self) -> bool:
+        """True once stop_test() has been called for the current run"""
+        return self._stop_evt.is_set()
+    
+    @property
+    def monitoring_active(self) -> bool:
+        """True while DAQ monitoring should keep sampling
+        
+        Backed by _monitor_stop_evt, so a monitor loop needs one flag read per
+        iteration and can pace itself with _monitor_stop_evt.wait(); clearing
+        this (directly or via stop_test()) wakes it at once.
+        """
+        return not self._monitor_stop_evt.is_set()
+    
+    @monitoring_active.setter
+    def monitoring_active(self, active: bool):
+        if active:
+            self._monitor_stop_evt.clear()
+        else:
+            self._monitor_stop_evt.set()
+    
+    @property
+    def _screen_test_started(self) -> bool:
+        """True once the test thread has begun the screen test
+        
+        Backed by _screen_start_evt, so the monitor thread can block on the start
+        signal; setting this (or the release on stop/cleanup) wakes it at once.
+        """
+        return self._screen_start_evt.is_set()
+    
+    @_screen_test_started.setter
+    def _screen_test_started(self, started: bool):
+        if started:
+            self._screen_start_evt.set()
+        else:
+            self._screen_start_evt.clear()
+    
     def stop_test(self) -> bool:
         """Stop current test execution"""
         if self.status == TestStatus.IDLE:
             return True
         
         self.log_callback("Stopping test execution...", "info")
-        self.stop_requested = True
+        self._stop_evt.set()
+        self._screen_start_evt.set()  # Release a monitor thread still waiting for the start signal
         self.status = TestStatus.STOPPED
         
         # Stop DAQ monitoring
         if self.monitoring_active:
             self.monitoring_active = False
         
-        # Wait for test thread to finish
-        if hasattr(self, 'test_thread') and self.test_thread and self.test_thread.is_alive():
-            self.log_callback("Waiting for test thread to finish...", "info")
-            self.test_thread.join(timeout=3.0)
-            if self.test_thread.is_alive():
-                self.log_callback("WARNING: Test thread did not finish in time", "warn")
-        
-        # Wait for monitoring thread to finish
-        if hasattr(self, 'monitoring_thread') and self.monitoring_thread and self.monitoring_thread.is_alive():
-            self.log_callback("Waiting for monitoring thread to finish...", "info")
-            self.monitoring_thread.join(timeout=2.0)
-            if self.monitoring_thread.is_alive():
-                self.log_callback("WARNING: Monitoring thread did not finish in time", "warn")
+        # The stop event wakes both threads at once, so a short join is enough
+        threads = [t for t in (self.test_thread, self.monitoring_thread) if t is not None]
+        for t in threads:
+            t.join(timeout=0.2)
+        for t in threads:
+            if t.is_alive():
+                self.log_callback(f"WARNING: Thread {t.name} did not finish in time", "warn")
         
         if self.current_test:
             self.current_test.end_time = datetime.now()
@@ -411,33 +925,27 @@ class TestScenarioEngine(QObject):
         if duration <= 0:
             return True
         
-        # Sleep in small chunks to allow quick response to stop requests
-        chunk_size = 0.1  # Check every 100ms
-        remaining = duration
-        
-        while remaining > 0 and not self.stop_requested:
-            sleep_time = min(chunk_size, remaining)
-            time.sleep(sleep_time)
-            remaining -= sleep_time
-            
-            # Note: Do NOT process Qt events here as this runs in a worker thread
-            # Qt events can only be processed in the main thread
-        
-        return not self.stop_requested
+        # Blocks without polling; stop_test() sets the event and wakes us at once
+        return not self._stop_evt.wait(duration)
     
     def _execute_test_with_repeat(self, scenario: TestConfig):
         """Execute test scenario with repeat logic"""
         try:
+            # Read the monitor's channel configuration once for the whole run
+            self._cached_channels = self._get_enabled_channels_from_monitor()
+            self._cached_rails = self._get_channel_rail_names()
+            self._cached_mode = self._get_measurement_mode()
+            self._export_schema = None
+            
             for repeat_idx in range(self.repeat_count):
                 if self.stop_requested:
                     self.log_callback("Test stopped by user", "warn")
                     break
                 
                 self.current_repeat = repeat_idx + 1
-                self.log_callback(f"", "info")
-                self.log_callback(f"{'='*60}", "info")
-                self.log_callback(f"🔄 Test Iteration {self.current_repeat}/{self.repeat_count}", "info")
-                self.log_callback(f"{'='*60}", "info")
+                self.log_callback(
+                    f"\n{'='*60}\n🔄 Test Iteration {self.current_repeat}/{self.repeat_count}\n{'='*60}", "info"
+                )
                 
                 # First iteration: Full init
                 if repeat_idx == 0:
@@ -463,22 +971,24 @@ class TestScenarioEngine(QObject):
                 self.log_callback(f"", "info")
                 self.log_callback(f"🎉 All {self.repeat_count} test iterations completed successfully!", "info")
                 self.status = TestStatus.COMPLETED
-                self._emit_signal_safe(self.test_completed, True, f"Completed {self.repeat_count} iterations")
+                self._emit(self.test_completed, True, f"Completed {self.repeat_count} iterations")
             else:
                 self.status = TestStatus.STOPPED
-                self._emit_signal_safe(self.test_completed, False, "Test stopped by user")
+                self._emit(self.test_completed, False, "Test stopped by user")
                 
         except Exception as e:
             self.log_callback(f"Error in repeat test execution: {e}", "error")
-            import traceback
-            self.log_callback(f"Traceback: {traceback.format_exc()}", "error")
+            self._log_traceback("Traceback")
             self.status = TestStatus.FAILED
-            self._emit_signal_safe(self.test_completed, False, f"Test failed: {e}")
+            self._emit(self.test_completed, False, f"Test failed: {e}")
         finally:
             # CRITICAL: Reset to IDLE state to allow re-running tests
             self.running = False
             self.monitoring_active = False
             self.status = TestStatus.IDLE
+            self._cached_channels = self._cached_rails = self._cached_mode = None
+            self._export_schema = None
+            self.log_callback_flush()
             self.log_callback("Test execution completed, status reset to IDLE", "info")
     
     def _execute_test_unified(self, scenario: TestConfig, is_first_iteration: bool = True):
@@ -497,76 +1007,30 @@ class TestScenarioEngine(QObject):
                 steps_to_execute = scenario.steps
                 self.log_callback(f"Starting {len(steps_to_execute)} test steps (full initialization)", "info")
             else:
-                # Subsequent iterations: Different handling based on scenario
-                is_screen_onoff = False
-                is_wifi_test = False
-                if hasattr(self, 'current_scenario') and self.current_scenario:
-                    scenario_key = self.current_scenario.lower()
-                    if 'screen' in scenario_key and 'onoff' in scenario_key:
-                        is_screen_onoff = True
-                    elif 'wifi' in scenario_key:
-                        is_wifi_test = True
-
-                if is_screen_onoff:
-                    # Screen On/Off: Skip quick reset, only 10s stabilization (screen already off from 1st test)
+                # Subsequent iterations: precomputed quick step list (see _build_quick_steps)
+                if scenario.quick_steps is None:
+                    scenario.quick_steps = _build_quick_steps(self.current_scenario, scenario.steps)
+                steps_to_execute = scenario.quick_steps
+                
+                mode = _quick_mode(self.current_scenario)
+                if mode == 'screen_onoff':
                     self.log_callback(f"📌 Iteration {self.current_repeat}: Screen On/Off quick setup - 10s stabilization only", "info")
-                    stabilization_step = TestStep("quick_stabilization", 10.0, "quick_stabilization_10s")
-
-                    # Find test steps only
-                    daq_test_steps = []
-                    for step in scenario.steps:
-                        if step.action in ['start_daq_monitoring', 'screen_onoff_test',
-                                           'stop_daq_monitoring', 'export_to_excel']:
-                            self.log_callback(f"  Including step: {step.name} (action: {step.action})", "debug")
-                            daq_test_steps.append(step)
-
-                    steps_to_execute = [stabilization_step] + daq_test_steps
-
-                elif is_wifi_test:
-                    # WiFi 2G/5G Test: Skip all init, short stabilization + DAQ collection only
-                    # Device is already in proper state from 1st iteration (WiFi connected, BT on, LCD off)
+                elif mode == 'wifi':
                     self.log_callback(f"📌 Iteration {self.current_repeat}: WiFi test quick setup - 10s stabilization, skip all init", "info")
-                    stabilization_step = TestStep("quick_stabilization", 10.0, "quick_stabilization_10s")
-
-                    # Find DAQ and test steps only (skip all init/default steps)
-                    daq_test_steps = []
-                    for step in scenario.steps:
-                        # Include only DAQ collection and export steps
-                        if step.action in ['start_daq_monitoring', 'wait_15_minutes',
-                                           'stop_daq_monitoring', 'export_to_excel']:
-                            self.log_callback(f"  Including step: {step.name} (action: {step.action})", "debug")
-                            daq_test_steps.append(step)
-
-                    steps_to_execute = [stabilization_step] + daq_test_steps
                     self.log_callback(f"WiFi test iteration {self.current_repeat}: Skipping init (LCD/AOD/Flight/WiFi/BT already configured)", "info")
-
                 else:
-                    # Other scenarios: Quick reset + DAQ + Test + Stop DAQ + Export
                     self.log_callback(f"📌 Iteration {self.current_repeat}: Skip default+init, quick reset only", "info")
-                    quick_reset_step = TestStep("quick_reset", 0.0, "quick_reset_before_test")
-
-                    # Find DAQ and test steps (skip all init/default/stabilization steps)
-                    daq_test_steps = []
-                    for step in scenario.steps:
-                        # Skip init, default, stabilization steps
-                        if any(keyword in step.name.lower() for keyword in ['init', 'default', 'stabilize']):
-                            self.log_callback(f"  Skipping step: {step.name} (action: {step.action})", "debug")
-                            continue
-
-                        # Include DAQ, test, and export steps
-                        if step.action in ['start_daq_monitoring', 'phone_app_scenario_test',
-                                           'screen_on_off_with_daq_monitoring', 'screen_on_off_cycle',
-                                           'execute_screen_onoff_test', 'screen_onoff_test',
-                                           'stop_daq_monitoring', 'export_to_excel']:
-                            self.log_callback(f"  Including step: {step.name} (action: {step.action})", "debug")
-                            daq_test_steps.append(step)
-
-                    steps_to_execute = [quick_reset_step] + daq_test_steps
                 self.log_callback(f"Iteration {self.current_repeat}/{self.repeat_count}: {len(steps_to_execute)} steps", "info")
-                for i, step in enumerate(steps_to_execute):
-                    self.log_callback(f"  Step {i+1}: {step.name} (action: {step.action})", "info")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    # One emission for the whole step list
+                    self.log_callback("\n".join(
+                        f"  Step {i+1}: {step.name} (action: {step.action})"
+                        for i, step in enumerate(steps_to_execute)
+                    ), "debug")
             
             # Execute each step in single thread
+            n_steps = len(steps_to_execute)
+            last_pct = -1
             for i, step in enumerate(steps_to_execute):
                 if self.stop_requested:
                     break
@@ -574,11 +1038,13 @@ class TestScenarioEngine(QObject):
                 try:
                     self.current_step = i + 1
                     
-                    # Update progress bar
-                    progress = int((i / len(steps_to_execute)) * 100) if len(steps_to_execute) > 0 else 0
-                    self._emit_signal_safe(self.progress_updated, progress, f"Iter {self.current_repeat}/{self.repeat_count} - Step {i+1}/{len(steps_to_execute)}: {step.name}")
+                    # Update progress bar only when the integer percentage advances
+                    pct = (i * 100) // n_steps
+                    if pct != last_pct:
+                        self._emit_progress(pct, f"Iter {self.current_repeat}/{self.repeat_count} - Step {i+1}/{n_steps}: {step.name}")
+                        last_pct = pct
                     
-                    self.log_callback(f"Step {self.current_step}/{len(steps_to_execute)}: {step.name}", "info")
+                    self.log_callback(f"Step {self.current_step}/{n_steps}: {step.name}", "info")
                     
                     # Special handling for screen test with DAQ monitoring
                     if step.action == "screen_on_off_with_daq_monitoring":
@@ -630,7 +1096,7 @@ class TestScenarioEngine(QObject):
             self.log_callback(f"Auto test status changed after error: {old_status.value} ? {self.status.value}", "info")
             
             # Emit failure signal after state reset
-            self._emit_signal_safe(self.test_completed, False, f"Test failed: {e}")
+            self._emit(self.test_completed, False, f"Test failed: {e}")
         
         finally:
             # Ensure cleanup (redundant but safe)
@@ -640,8 +1106,43 @@ class TestScenarioEngine(QObject):
                 self.status = TestStatus.IDLE
                 self.log_callback(f"Final auto test state reset: {old_status.value} ? {self.status.value}", "info")
 
+    def _screen_test_sampler(self, samples: queue.SimpleQueue, start_time: float, sample_deadlines: List[float],
+                             test_data_start: float, collect: Callable[[float], dict]):
+        """Producer for the unified screen test: collect one point per deadline into samples"""
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        wait, monotonic, put = self._stop_evt.wait, time.monotonic, samples.put_nowait  # Loop-invariant lookups
+        for deadline in sample_deadlines:
+            # stop_test() wakes the wait immediately
+            if wait(max(0.0, deadline - (monotonic() - start_time))):
+                return
+            try:
+                # Exact integer test time (0.0s, 1.0s, ..., 9.0s)
+                sample_time = deadline - test_data_start
+                put(collect(sample_time))
+                if debug_enabled:  # Logger only; no Qt signal per sample
+                    self.logger.debug("Collected data point at %.1fs (elapsed: %.1fs)",
+                                      sample_time, monotonic() - start_time)
+            except Exception as sample_error:
+                self.log_callback(f"Error collecting DAQ sample at {deadline:.1f}s: {sample_error}", "error")
+    
+    def _drain_samples(self, samples: queue.SimpleQueue) -> int:
+        """Move queued sample points into daq_data; returns how many were stored"""
+        count = 0
+        while True:
+            try:
+                data_point = samples.get_nowait()
+            except queue.Empty:
+                return count
+            self.daq_data.append(data_point)
+            count += 1
+    
     def _unified_screen_test_with_daq(self) -> bool:
-        """Unified screen test with DAQ monitoring in single thread"""
+        """Unified screen test with DAQ monitoring
+        
+        Samples are produced on their own thread (_screen_test_sampler) so ADB
+        screen toggles cannot delay them; this thread drives the screen, drains
+        the sample queue into daq_data and reports progress.
+        """
         try:
             self.log_callback("Starting unified screen test with DAQ monitoring", "info")
             
@@ -687,77 +1188,95 @@ class TestScenarioEngine(QObject):
             self.log_callback("Starting screen on/off cycle with integrated DAQ monitoring", "info")
             self.log_callback(f"Test duration: {test_duration}s, Data collection: {test_data_start}s-{test_data_end}s", "info")
             
+            # Columnar sample storage sized for the collection window (1 sample/s, see below)
+            value_suffix = "_current" if measurement_mode == "current" else "_voltage"
+            value_keys = [f"{channel}{value_suffix}" for channel in enabled_channels]
+            est_samples = int(test_data_end - test_data_start) + 8
+            
             # Start with screen on
             self.adb_service.turn_screen_on()
+            self._last_emitted_pct = -1
             
-            start_time = time.time()
-            last_screen_change = 0
+            self.daq_data = DAQBuffer(
+                ['time_elapsed', 'screen_test_time'] + value_keys,
+                capacity=est_samples,
+                started_at=datetime.now() + timedelta(seconds=test_data_start),
+            )
+            
+            # Event schedule (seconds since start): a screen toggle every screen_interval
+            # inside the collection window plus a progress tick every second until
+            # test_duration. One sample per second is produced by the sampler thread.
+            # Stored as parallel compact arrays (8-byte deadline, 1-byte kind), walked by index
+            ev_screen, ev_progress = 1, 2
+            window = test_data_end - test_data_start
+            sample_deadlines = [test_data_start + i for i in range(10)]
+            events = sorted(
+                [(test_data_start + k * screen_interval, ev_screen)
+                 for k in range(1, int(window // screen_interval) + 1)] +
+                [(float(t), ev_progress) for t in range(1, int(test_duration) + 1)]
+            )
+            deadlines = array('d', (deadline for deadline, _ in events))
+            kinds = array('b', (kind for _, kind in events))
+            
+            start_time = time.monotonic()  # Immune to wall-clock jumps
             screen_state = True  # True = ON, False = OFF
             data_point_count = 0
-            last_data_collection_time = -1  # Track last data collection time to prevent duplicates
             
-            # Main test loop with precise timing
-            while True:
-                current_time = time.time()
-                elapsed_time = current_time - start_time
-                
-                # Check if test duration completed
-                if elapsed_time >= test_duration:
-                    break
-                    
-                if self.stop_requested:
+            last_toggle = None
+            samples = queue.SimpleQueue()
+            sampler = threading.Thread(
+                target=self._screen_test_sampler,
+                args=(samples, start_time, sample_deadlines, test_data_start,
+                      self._compile_collector(enabled_channels, measurement_mode, len(sample_deadlines))),
+                name="TSE-sampler",
+                daemon=True
+            )
+            sampler.start()
+            
+            # Sleep until each deadline; stop_test() wakes the wait immediately
+            # Loop-invariant lookups bound to locals
+            wait, monotonic, log = self._stop_evt.wait, time.monotonic, self._log
+            submit, adb = self._adb_pool.submit, self.adb_service
+            i, n = 0, len(deadlines)
+            while i < n:
+                deadline, kind = deadlines[i], kinds[i]
+                i += 1
+                if wait(max(0.0, deadline - (monotonic() - start_time))):
                     self.log_callback("Test stop requested, breaking cycle", "warn")
                     break
                 
+                elapsed_time = monotonic() - start_time
                 try:
-                    # 1. Collect DAQ data ONLY during actual test period (exclude setup/teardown)
-                    if test_data_start <= elapsed_time <= test_data_end:
-                        # Calculate data point index relative to test start
+                    if kind == ev_screen:
                         test_elapsed = elapsed_time - test_data_start
-                        target_data_time = int(test_elapsed)  # Integer seconds only (0, 1, 2, 3, ...)
-                        
-                        # Only collect if we haven't collected for this exact second yet
-                        if target_data_time != last_data_collection_time and target_data_time < 10:
-                            # Use exact integer time (0.0s, 1.0s, 2.0s, ..., 9.0s)
-                            data_point = self._collect_daq_data_point(enabled_channels, measurement_mode, float(target_data_time))
-                            if data_point:
-                                self.daq_data.append(data_point)
-                                data_point_count += 1
-                                last_data_collection_time = target_data_time  # Update last collection time
-                                self.log_callback(f"? Collected data point {data_point_count}: {target_data_time}.0s (elapsed: {elapsed_time:.1f}s)", "info")
-                    
-                    # 2. Screen control every 2 seconds (only during test period)
-                    if test_data_start <= elapsed_time <= test_data_end:
-                        # Calculate screen cycle relative to test start
-                        test_elapsed = elapsed_time - test_data_start
-                        screen_cycle_time = int(test_elapsed / screen_interval)
-                        if screen_cycle_time > last_screen_change:
-                            screen_state = not screen_state
-                            if screen_state:
-                                self.adb_service.turn_screen_on()
-                                self.log_callback(f"Screen ON at test time {test_elapsed:.1f}s (total: {elapsed_time:.1f}s)", "info")
-                            else:
-                                self.adb_service.turn_screen_off()
-                                self.log_callback(f"Screen OFF at test time {test_elapsed:.1f}s (total: {elapsed_time:.1f}s)", "info")
-                            last_screen_change = screen_cycle_time
-                    
-                    # 3. Update progress (pure test progress only)
-                    test_progress = int((elapsed_time / test_duration) * 100)
-                    self._update_test_progress_only(test_progress, f"Screen Test: {elapsed_time:.1f}s / {test_duration}s")
+                        screen_state = not screen_state
+                        # Queued on the ordered ADB worker so the adb round-trip doesn't hold up this loop
+                        if screen_state:
+                            last_toggle = submit(adb.turn_screen_on)
+                            log("info", "Screen ON at test time %.1fs (total: %.1fs)", test_elapsed, elapsed_time)
+                        else:
+                            last_toggle = submit(adb.turn_screen_off)
+                            log("info", "Screen OFF at test time %.1fs (total: %.1fs)", test_elapsed, elapsed_time)
                     
-                    # 4. Sleep with stop check (no Qt events in worker thread)
-                    time.sleep(0.2)  # Check every 0.2s for responsive UI but prevent over-sampling
+                    else:
+                        data_point_count += self._drain_samples(samples)
+                        
+                        # Update progress (pure test progress only)
+                        test_progress = int((elapsed_time / test_duration) * 100)
+                        self._update_test_progress_only(test_progress, _FMT_SCREEN_PROGRESS(elapsed_time, test_duration))
                     
                 except Exception as cycle_error:
                     self.log_callback(f"Error in test loop at {elapsed_time:.1f}s: {cycle_error}", "error")
-                    time.sleep(0.1)
-                    continue
             
             # Test completed - no final data collection (only test period data)
+            if last_toggle is not None:
+                last_toggle.result()  # Leave the device in its final screen state before the next step
+            sampler.join(timeout=1.0)
+            data_point_count += self._drain_samples(samples)
             self.monitoring_active = False
-            data_count = len(self.daq_data)
             test_data_duration = test_data_end - test_data_start
-            self.log_callback(f"Unified screen test completed. Collected {data_count} data points over {test_data_duration}s test period", "info")
+            self.log_callback(f"Unified screen test completed. Collected {data_point_count} DAQ samples over "
+                              f"{time.monotonic() - start_time:.1f}s ({test_data_duration}s test period)", "info")
             
             # Final progress update
             self._update_progress_safe("Screen test completed, preparing export")
@@ -766,40 +1285,65 @@ class TestScenarioEngine(QObject):
             
         except Exception as e:
             self.log_callback(f"CRITICAL ERROR in unified screen test: {e}", "error")
-            import traceback
-            self.log_callback(f"Traceback: {traceback.format_exc()}", "error")
+            self._log_traceback("Traceback")
             return False
         
         finally:
             self.monitoring_active = False
 
-    def _collect_daq_data_point(self, enabled_channels: List[str], measurement_mode: str, elapsed_time: float) -> dict:
-        """Collect a single DAQ data point"""
-        try:
-            channel_data = {}
+    def _compile_collector(self, enabled_channels: List[str], measurement_mode: str,
+                           n_samples: int = 0) -> Callable[[float], dict]:
+        """Build a point collector specialised for one channel set and measurement mode
+        
+        Keys and the mode branch are fixed once here, so the returned
+        collect(elapsed_time) is straight-line code on the sampling path.
+        When n_samples is known, the simulated noise for the whole capture is
+        drawn up front and consumed one row per call.
+        """
+        rng = self._rng
+        n_channels = len(enabled_channels)
+        
+        def noise_source(low: float, high: float) -> Callable[[], np.ndarray]:
+            block = iter(rng.uniform(low, high, (n_samples, n_channels))) if n_samples > 0 else iter(())
             
-            # Generate simulation data (replace with actual DAQ calls if available)
-            import random
-            for channel in enabled_channels:
-                if measurement_mode == "current":
-                    # Simulate current data with screen on/off variation
-                    base_current = 0.15 if elapsed_time % 4 < 2 else 0.05  # Screen on/off simulation
-                    value = round(base_current + random.uniform(-0.02, 0.02), 6)
-                    channel_data[f"{channel}_current"] = value
-                else:
-                    value = round(random.uniform(1.0, 5.0), 3)
-                    channel_data[f"{channel}_voltage"] = value
-            
-            # Create data point with precise timing (ensure clean integer seconds)
-            clean_time = round(elapsed_time, 1)  # Round to 1 decimal place
-            data_point = {
-                'timestamp': datetime.now(),
-                'time_elapsed': clean_time,
-                'screen_test_time': clean_time,
-                **channel_data
-            }
+            def draw() -> np.ndarray:
+                row = next(block, None)
+                return rng.uniform(low, high, n_channels) if row is None else row  # Past the block: draw per call
+            return draw
+        
+        if measurement_mode == "current":
+            keys = tuple(sys.intern(f"{channel}_current") for channel in enabled_channels)
+            noise = noise_source(-0.02, 0.02)
+            
+            def sample_values(elapsed_time: float) -> list:
+                # Simulate current data with screen on/off variation
+                base_current = 0.15 if elapsed_time % 4 < 2 else 0.05  # Screen on/off simulation
+                return np.round(base_current + noise(), 6).tolist()
+        else:
+            keys = tuple(sys.intern(f"{channel}_voltage") for channel in enabled_channels)
+            noise = noise_source(1.0, 5.0)
             
+            def sample_values(elapsed_time: float) -> list:
+                return np.round(noise(), 3).tolist()
+        
+        def collect(elapsed_time: float) -> dict:
+            data_point = dict(zip(keys, sample_values(elapsed_time)))
+            # Precise timing (ensure clean integer seconds, 1 decimal place). No wall-clock
+            # timestamp per point: daq_data derives it from its start time at export.
+            data_point['time_elapsed'] = data_point['screen_test_time'] = round(elapsed_time, 1)
             return data_point
+        
+        return collect
+    
+    def _collect_daq_data_point(self, enabled_channels: List[str], measurement_mode: str, elapsed_time: float) -> dict:
+        """Collect a single DAQ data point"""
+        try:
+            # Simulation data (replace with actual DAQ calls if available); the specialised
+            # collector is rebuilt only when the channel set or mode changes
+            cache_key = (measurement_mode, tuple(enabled_channels))
+            if self._collector[0] != cache_key:
+                self._collector = (cache_key, self._compile_collector(enabled_channels, measurement_mode))
+            return self._collector[1](elapsed_time)
             
         except Exception as e:
             self.log_callback(f"Error collecting DAQ data: {e}", "error")
@@ -838,19 +1382,15 @@ class TestScenarioEngine(QObject):
                     self.current_test.error_message = f"Failed at step: {step.name}"
                     self.current_test.end_time = datetime.now()
                     self.log_callback(f"Test failed at step: {step.name}", "error")
-                    self._emit_signal_safe(self.test_completed, False, f"Test failed at step: {step.name}")
+                    self._emit(self.test_completed, False, f"Test failed at step: {step.name}")
                     return
                 
                 # Wait for step duration (with progress updates for long steps)
                 if step.duration > 0:
                     if step.duration > 5:  # For long steps, show countdown
-                        for remaining in range(int(step.duration), 0, -1):
-                            if self.stop_requested:
-                                break
-                            self._update_progress(f"{step.name} - {remaining}s remaining")
-                            time.sleep(1)
+                        self._countdown(step.name, step.duration)
                     else:
-                        time.sleep(step.duration)
+                        self._interruptible_sleep(step.duration)
             
             # Test completed successfully
             if not self.stop_requested:
@@ -858,7 +1398,7 @@ class TestScenarioEngine(QObject):
                 self.current_test.status = TestStatus.COMPLETED
                 self.current_test.end_time = datetime.now()
                 self.log_callback("Test scenario completed successfully", "info")
-                self._emit_signal_safe(self.test_completed, True, "Test completed successfully")
+                self._emit(self.test_completed, True, "Test completed successfully")
             
         except Exception as e:
             self.status = TestStatus.FAILED
@@ -866,7 +1406,7 @@ class TestScenarioEngine(QObject):
                 self.current_test.status = TestStatus.FAILED
                 self.current_test.error_message = str(e)
             self.log_callback(f"Test execution error: {e}", "error")
-            self._emit_signal_safe(self.test_completed, False, f"Test failed: {e}")
+            self._emit(self.test_completed, False, f"Test failed: {e}")
         
         finally:
             # Cleanup
@@ -874,106 +1414,75 @@ class TestScenarioEngine(QObject):
                 self.monitoring_active = False
             self.status = TestStatus.IDLE
     
+    def _build_action_dispatch(self) -> Dict[str, Callable[[TestStep], bool]]:
+        """Map step action names to handlers taking the TestStep"""
+        no_arg_actions = {
+            "setup_adb_device": self._step_setup_adb,
+            "enable_flight_mode": self._step_enable_flight_mode,
+            "clear_recent_apps": self._step_clear_recent_apps,
+            "unlock_device": self._step_unlock_device,
+            "go_to_home": self._step_go_to_home,
+            "wait_stabilization": self._step_wait_stabilization,
+            "start_daq_monitoring": self._step_start_daq_monitoring,
+            "screen_on_off_cycle": self._step_screen_on_off_cycle,
+            "screen_on_off_with_daq_monitoring": self._step_screen_on_off_with_daq_monitoring,
+            "stop_daq_monitoring": self._step_stop_daq_monitoring,
+            "setup_browser_environment": self._step_setup_browser_environment,
+            "enable_wifi_connection": self._step_enable_wifi_connection,
+            "run_browser_search_test": self._step_run_browser_search_test,
+            "run_pageboost_performance": self._step_run_pageboost_performance,
+            "cleanup_apps_and_notifications": self._step_cleanup_apps_and_notifications,
+            "export_to_excel": self._step_export_to_csv,
+            "connect_wifi_2g": self._step_connect_wifi_2g,
+            "connect_wifi_5g": self._step_connect_wifi_5g,
+            "enable_bluetooth": self._step_enable_bluetooth,
+            "enable_aod": self._step_enable_aod,
+            "wait_15_minutes": self._step_wait_15_minutes,
+            "set_screen_timeout_10min": self._step_set_screen_timeout_10min,
+            "lcd_on_unlock_home_clear_apps": self._step_lcd_on_unlock_home_clear_apps,
+            "wait_current_stabilization": self._step_wait_current_stabilization,
+            "execute_phone_app_scenario": self._step_execute_phone_app_scenario,
+            "apply_default_settings": self._step_apply_default_settings,
+            "clear_all_recent_apps": self._step_clear_all_recent_apps,
+            "phone_app_test_with_daq": self._step_phone_app_test_with_daq,
+            "phone_app_test_only": self._step_phone_app_test_only,
+            "phone_app_scenario_test": self._step_phone_app_scenario_test,
+            "screen_onoff_test": self._step_screen_onoff_test,
+            "lcd_off": self._step_lcd_off,
+            "screen_on_app_clear_screen_off": self._step_screen_on_app_clear_screen_off,
+            "phone_app_test_with_daq_optimized": self._step_phone_app_test_with_daq_optimized,
+            "turn_screen_off": self._step_turn_screen_off,
+            "turn_screen_on": self._step_turn_screen_on,
+            "unlock_screen": self._step_unlock_screen,
+            "quick_reset_before_test": self._step_quick_reset_before_test,
+            "quick_stabilization_10s": self._step_quick_stabilization_10s,
+            "deviceidle_step": self._step_deviceidle_step,
+            "unlock_and_clear_apps": self._step_unlock_and_clear_apps,
+            "lcd_on_and_unlock": self._step_lcd_on_and_unlock,
+            "home_and_clear_apps_only": self._step_home_and_clear_apps_only,
+        }
+        dispatch = {action: (lambda step, fn=fn: fn()) for action, fn in no_arg_actions.items()}
+        dispatch["set_hvpm_voltage"] = lambda step: self._step_set_hvpm_voltage(step.parameters.get("voltage", 4.0))
+        return dispatch
+    
+    def _countdown(self, name: str, seconds: float) -> bool:
+        """Wait for seconds, posting "<name> - Ns remaining" about once a second.
+        Returns True if completed normally, False if interrupted."""
+        deadline = time.monotonic() + seconds
+        while (remaining := deadline - time.monotonic()) > 0:
+            self._update_progress(f"{name} - {math.ceil(remaining)}s remaining")
+            if self._stop_evt.wait(min(1.0, remaining)):
+                return False
+        return True
+    
     def _execute_step(self, step: TestStep) -> bool:
         """Execute individual test step"""
         try:
-            if step.action == "set_hvpm_voltage":
-                return self._step_set_hvpm_voltage(step.parameters.get("voltage", 4.0))
-            elif step.action == "setup_adb_device":
-                return self._step_setup_adb()
-            elif step.action == "enable_flight_mode":
-                return self._step_enable_flight_mode()
-            elif step.action == "clear_recent_apps":
-                return self._step_clear_recent_apps()
-            elif step.action == "unlock_device":
-                return self._step_unlock_device()
-            elif step.action == "go_to_home":
-                return self._step_go_to_home()
-            elif step.action == "wait_stabilization":
-                return self._step_wait_stabilization()
-            elif step.action == "start_daq_monitoring":
-                return self._step_start_daq_monitoring()
-            elif step.action == "screen_on_off_cycle":
-                return self._step_screen_on_off_cycle()
-            elif step.action == "screen_on_off_with_daq_monitoring":
-                return self._step_screen_on_off_with_daq_monitoring()
-            elif step.action == "stop_daq_monitoring":
-                return self._step_stop_daq_monitoring()
-            elif step.action == "setup_browser_environment":
-                return self._step_setup_browser_environment()
-            elif step.action == "enable_wifi_connection":
-                return self._step_enable_wifi_connection()
-            elif step.action == "run_browser_search_test":
-                return self._step_run_browser_search_test()
-            elif step.action == "run_pageboost_performance":
-                return self._step_run_pageboost_performance()
-            elif step.action == "cleanup_apps_and_notifications":
-                return self._step_cleanup_apps_and_notifications()
-            elif step.action == "export_to_excel":
-                return self._step_export_to_csv()
-            elif step.action == "connect_wifi_2g":
-                return self._step_connect_wifi_2g()
-            elif step.action == "connect_wifi_5g":
-                return self._step_connect_wifi_5g()
-            elif step.action == "enable_bluetooth":
-                return self._step_enable_bluetooth()
-            elif step.action == "enable_aod":
-                return self._step_enable_aod()
-            elif step.action == "wait_15_minutes":
-                return self._step_wait_15_minutes()
-            elif step.action == "set_screen_timeout_10min":
-                return self._step_set_screen_timeout_10min()
-            elif step.action == "lcd_on_unlock_home_clear_apps":
-                return self._step_lcd_on_unlock_home_clear_apps()
-            elif step.action == "wait_current_stabilization":
-                return self._step_wait_current_stabilization()
-            elif step.action == "execute_phone_app_scenario":
-                return self._step_execute_phone_app_scenario()
-            elif step.action == "apply_default_settings":
-                return self._step_apply_default_settings()
-            elif step.action == "clear_all_recent_apps":
-                return self._step_clear_all_recent_apps()
-            elif step.action == "phone_app_test_with_daq":
-                return self._step_phone_app_test_with_daq()
-            elif step.action == "phone_app_test_only":
-                return self._step_phone_app_test_only()
-            elif step.action == "set_screen_timeout_10min":
-                return self._step_set_screen_timeout_10min()
-            elif step.action == "lcd_on_unlock_home_clear_apps":
-                return self._step_lcd_on_unlock_home_clear_apps()
-            elif step.action == "phone_app_scenario_test":
-                return self._step_phone_app_scenario_test()
-            elif step.action == "screen_onoff_test":
-                return self._step_screen_onoff_test()
-            elif step.action == "lcd_off":
-                return self._step_lcd_off()
-            elif step.action == "screen_on_app_clear_screen_off":
-                return self._step_screen_on_app_clear_screen_off()
-            elif step.action == "phone_app_test_with_daq_optimized":
-                return self._step_phone_app_test_with_daq_optimized()
-            elif step.action == "stop_daq_monitoring":
-                return self._step_stop_daq_monitoring()
-            elif step.action == "turn_screen_off":
-                return self._step_turn_screen_off()
-            elif step.action == "turn_screen_on":
-                return self._step_turn_screen_on()
-            elif step.action == "unlock_screen":
-                return self._step_unlock_screen()
-            elif step.action == "quick_reset_before_test":
-                return self._step_quick_reset_before_test()
-            elif step.action == "quick_stabilization_10s":
-                return self._step_quick_stabilization_10s()
-            elif step.action == "deviceidle_step":
-                return self._step_deviceidle_step()
-            elif step.action == "unlock_and_clear_apps":
-                return self._step_unlock_and_clear_apps()
-            elif step.action == "lcd_on_and_unlock":
-                return self._step_lcd_on_and_unlock()
-            elif step.action == "home_and_clear_apps_only":
-                return self._step_home_and_clear_apps_only()
-            else:
+            handler = self._action_dispatch.get(step.action)
+            if handler is None:
                 self.log_callback(f"Unknown step action: {step.action}", "error")
                 return False
+            return handler(step)
                 
         except Exception as e:
             self.log_callback(f"Error executing step {step.name}: {e}", "error")
@@ -1167,22 +1676,10 @@ class TestScenarioEngine(QObject):
             else:
                 self.log_callback("✅ Recent apps cleared", "info")
             
-            # Step 2: Check if this is Screen On/Off scenario and turn screen off if needed
-            is_screen_onoff = False
-            if hasattr(self, 'current_scenario') and self.current_scenario:
-                scenario_key = self.current_scenario.lower()
-                # Check both scenario key and scenario name
-                if 'screen' in scenario_key and 'onoff' in scenario_key:
-                    is_screen_onoff = True
-                    self.log_callback("🔍 Detected Screen On/Off scenario (from scenario key)", "info")
-                else:
-                    # Also check scenario config name
-                    scenario_config = self.scenarios.get(self.current_scenario)
-                    if scenario_config:
-                        scenario_name = scenario_config.name.lower()
-                        if 'screen' in scenario_name and ('on' in scenario_name or 'off' in scenario_name):
-                            is_screen_onoff = True
-                            self.log_callback("🔍 Detected Screen On/Off scenario (from scenario name)", "info")
+            # Step 2: Check if this is Screen On/Off scenario (classified in start_test) and turn screen off if needed
+            is_screen_onoff = self.current_test is not None and self.current_test.is_screen_onoff
+            if is_screen_onoff:
+                self.log_callback("🔍 Detected Screen On/Off scenario", "info")
             
             # For Screen On/Off scenario, turn screen off after clearing apps
             if is_screen_onoff:
@@ -1239,12 +1736,12 @@ class TestScenarioEngine(QObject):
             self.monitoring_active = True
             
             # Initialize screen test synchronization
-            self._screen_test_started = threading.Event()
+            self._screen_test_started = False
             self._screen_test_start_time = None
             
             # Get test duration from current scenario (default 10s for backward compatibility)
             test_duration = 10.0  # Default
-            if hasattr(self, 'current_scenario') and self.current_scenario:
+            if self.current_scenario:
                 scenario_config = self.scenarios.get(self.current_scenario)
                 if scenario_config and hasattr(scenario_config, 'test_duration'):
                     test_duration = scenario_config.test_duration
@@ -1254,7 +1751,7 @@ class TestScenarioEngine(QObject):
             self._test_duration = test_duration
             
             # Set a reasonable timeout (test duration + 15s buffer)
-            self._monitoring_timeout = time.time() + test_duration + 15.0
+            self._monitoring_timeout = time.monotonic() + test_duration + 15.0
             
             self.log_callback(f"DAQ monitoring initialized with {test_duration}s test duration", "info")
             
@@ -1273,10 +1770,18 @@ class TestScenarioEngine(QObject):
             # Store configuration for monitoring thread
             self._monitoring_channels = enabled_channels
             self._monitoring_mode = 'current'  # Default to current mode
+            self._export_schema = None
+            
+            # Preallocate columnar sample storage for the whole capture (1 sample per ms)
+            self.daq_data = self._preallocate_daq_buffers(
+                int(test_duration * 1000) + 1024, [f"{channel}_current" for channel in enabled_channels])
             
             # Start monitoring in separate thread using hardware timing
-            self.monitoring_thread = threading.Thread(target=self._daq_monitoring_hardware_timed)
-            self.monitoring_thread.daemon = True
+            self.monitoring_thread = threading.Thread(
+                target=self._daq_monitoring_hardware_timed,
+                name="TSE-monitor",
+                daemon=True
+            )
             self.monitoring_thread.start()
             self.log_callback("DAQ hardware-timed monitoring thread started (1kHz)", "info")
             
@@ -1284,8 +1789,42 @@ class TestScenarioEngine(QObject):
             return True
         except Exception as e:
             self.log_callback(f"ERROR starting DAQ monitoring: {e}", "error")
-            import traceback
-            self.log_callback(f"DAQ monitoring error details: {traceback.format_exc()}", "error")
+            self._log_traceback("DAQ monitoring error details")
+            return False
+    
+    def _run_screen_cycles_on_device(self, cycles: int, on_cycle: Optional[Callable[[int], None]] = None) -> bool:
+        """Run `cycles` screen off/on cycles as a single on-device shell loop
+        
+        The script runs on the adb worker; this thread only wakes every 2 s to
+        report the cycle (on_cycle(i)) and interrupts the device loop on stop or
+        when it overruns its budget. Returns False unless the loop ran to the end.
+        """
+        script = _SCREEN_CYCLE_SCRIPT.format(cycles=cycles)
+        budget = cycles * _SCREEN_CYCLE_BUDGET_S + 5
+        deadline = time.monotonic() + budget
+        done = self._adb_pool.submit(self.adb_service.shell, script, timeout=budget)
+        for i in range(cycles):
+            if on_cycle:
+                on_cycle(i)
+            self._log("info", "Screen OFF/ON (cycle %d/%d)", i + 1, cycles)
+            if self._stop_evt.wait(2.0) or done.done():
+                break
+        
+        # The device loop runs longer than the nominal 2 s per cycle; wait it out,
+        # but never leave it running (and holding the shell session) past the budget
+        while not done.done() and not self._stop_evt.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.log_callback(f"Screen cycle script did not finish within {budget:.0f}s, interrupting", "error")
+                break
+            self._stop_evt.wait(min(0.5, remaining))
+        if not done.done():
+            self.adb_service.interrupt_shell()
+        
+        try:
+            return done.result(timeout=5) is not None
+        except Exception as e:
+            self.log_callback(f"Error in screen cycle script: {type(e).__name__}: {e}", "error")
             return False
     
     def _step_screen_on_off_cycle(self) -> bool:
@@ -1295,23 +1834,13 @@ class TestScenarioEngine(QObject):
             
             # Start with screen on
             self.adb_service.turn_screen_on()
-            time.sleep(1)
+            self._interruptible_sleep(1)
             
             # Cycle for 20 seconds with 2-second intervals
             cycles = 10  # 20 seconds / 2 seconds per cycle
-            for i in range(cycles):
-                if self.stop_requested:
-                    break
-                
-                # Turn screen off
-                self.adb_service.turn_screen_off()
-                self.log_callback(f"Screen OFF (cycle {i+1}/{cycles})", "info")
-                time.sleep(1)
-                
-                # Turn screen on
-                self.adb_service.turn_screen_on()
-                self.log_callback(f"Screen ON (cycle {i+1}/{cycles})", "info")
-                time.sleep(1)
+            if not self._run_screen_cycles_on_device(cycles) and not self.stop_requested:
+                self.log_callback("Screen on/off cycle failed", "error")
+                return False
             
             self.log_callback("Screen on/off cycle completed", "info")
             return True
@@ -1367,13 +1896,14 @@ class TestScenarioEngine(QObject):
                 # Store configuration for the monitoring thread
                 self._monitoring_channels = enabled_channels
                 self._monitoring_mode = measurement_mode
-                # Initialize screen test timing with thread-safe event
+                self._export_schema = None
+                # Initialize screen test timing
                 self._screen_test_start_time = None
-                self._screen_test_started = threading.Event()  # Thread-safe synchronization
+                self._screen_test_started = False
                 # Calculate timeout based on test duration + buffer
                 test_duration = 10.0  # Phone app test duration
                 timeout_buffer = 15.0  # Reduced buffer time from 30s to 15s
-                self._monitoring_timeout = time.time() + test_duration + timeout_buffer  # Dynamic timeout
+                self._monitoring_timeout = time.monotonic() + test_duration + timeout_buffer  # Dynamic timeout
                 
                 # Create thread for DAQ hardware-timed monitoring (1kHz, 10 seconds)
                 monitoring_thread = threading.Thread(
@@ -1388,51 +1918,38 @@ class TestScenarioEngine(QObject):
                 return False
             
             # Start screen on/off cycle with error handling
+            screen_ok = True
             try:
                 self.log_callback("Starting screen on/off cycle (20 seconds, 2-second intervals)", "info")
                 
                 # Start with screen on
                 self.adb_service.turn_screen_on()
-                time.sleep(1)
+                self._interruptible_sleep(1)
                 
                 # Record start time for progress tracking AND data collection timing
-                test_start_time = time.time()
+                test_start_time = time.monotonic()
                 self._screen_test_start_time = test_start_time  # Store for DAQ timing
                 
                 # Signal DAQ monitoring thread that screen test has started
-                if hasattr(self, '_screen_test_started'):
-                    self._screen_test_started.set()
-                    self.log_callback("Screen test start signal sent to DAQ monitoring", "info")
+                self._screen_test_started = True
+                self.log_callback("Screen test start signal sent to DAQ monitoring", "info")
                 
                 # Cycle for 20 seconds with 2-second intervals
                 cycles = 10  # 20 seconds / 2 seconds per cycle
-                for i in range(cycles):
-                    if self.stop_requested:
-                        self.log_callback("Test stop requested, breaking cycle", "warn")
-                        break
-                    
-                    try:
-                        # Calculate progress during screen test (0-90%)
-                        elapsed = time.time() - test_start_time
-                        progress = min(90, int((elapsed / 20.0) * 90))  # 0-90% for screen test
-                        self._emit_signal_safe(self.progress_updated, progress, f"Screen test cycle {i+1}/{cycles}")
-                        
-                        # Turn screen off
-                        self.adb_service.turn_screen_off()
-                        self.log_callback(f"Screen OFF (cycle {i+1}/{cycles})", "info")
-                        time.sleep(1)
-                        
-                        # Turn screen on
-                        self.adb_service.turn_screen_on()
-                        self.log_callback(f"Screen ON (cycle {i+1}/{cycles})", "info")
-                        time.sleep(1)
-                    except Exception as cycle_error:
-                        self.log_callback(f"Error in screen cycle {i+1}: {cycle_error}", "error")
-                        # Continue with next cycle instead of failing completely
-                        continue
+                
+                def report_cycle(i):
+                    # Calculate progress during screen test (0-90%)
+                    elapsed = time.monotonic() - test_start_time
+                    progress = min(90, int((elapsed / 20.0) * 90))  # 0-90% for screen test
+                    self._emit_progress(progress, f"Screen test cycle {i+1}/{cycles}")
+                
+                screen_ok = self._run_screen_cycles_on_device(cycles, report_cycle)
+                if self.stop_requested:
+                    self.log_callback("Test stop requested, breaking cycle", "warn")
+                    screen_ok = True
                 
                 # Mark screen test end time
-                self._screen_test_end_time = time.time()
+                self._screen_test_end_time = time.monotonic()
                 self.log_callback(f"Screen test duration: {self._screen_test_end_time - test_start_time:.1f} seconds", "info")
                 
             except Exception as e:
@@ -1443,29 +1960,28 @@ class TestScenarioEngine(QObject):
             try:
                 self.monitoring_active = False
                 
-                # Clear the screen test event to stop waiting
-                if hasattr(self, '_screen_test_started'):
-                    self._screen_test_started.set()  # Wake up waiting thread
+                # Release a monitoring thread still waiting for the start flag
+                self._screen_test_started = True
                 
                 if monitoring_thread and monitoring_thread.is_alive():
                     self.log_callback("Waiting for monitoring thread to finish...", "info")
-                    monitoring_thread.join(timeout=5.0)  # Increased timeout
+                    monitoring_thread.join(timeout=1.0)  # Monitor loops wake on monitoring_active = False
                     if monitoring_thread.is_alive():
+                        # Daemon thread; it exits at its next monitoring_active check
                         self.log_callback("WARNING: Monitoring thread did not finish in time", "warn")
-                        # Force cleanup
-                        try:
-                            monitoring_thread._stop()
-                        except:
-                            pass
             except Exception as e:
                 self.log_callback(f"Error stopping monitoring: {e}", "error")
             
-            data_count = len(self.daq_data) if hasattr(self, 'daq_data') else 0
+            data_count = len(self.daq_data)
+            if not screen_ok:
+                # Monitoring is stopped and the data kept, but the screen pattern did not run as measured
+                self.log_callback(f"Screen on/off cycles failed. Collected {data_count} data points", "error")
+                return False
             self.log_callback(f"Screen test completed. Collected {data_count} data points", "info")
             
             # Final progress update
             try:
-                self._emit_signal_safe(self.progress_updated, 90, "Screen test completed, preparing export")
+                self._emit_progress(90, "Screen test completed, preparing export")
             except Exception as e:
                 self.log_callback(f"Error updating progress: {e}", "warn")
             
@@ -1473,16 +1989,14 @@ class TestScenarioEngine(QObject):
             
         except Exception as e:
             self.log_callback(f"CRITICAL ERROR in screen on/off with DAQ monitoring: {e}", "error")
-            import traceback
-            self.log_callback(f"Traceback: {traceback.format_exc()}", "error")
+            self._log_traceback("Traceback")
             
             # Comprehensive cleanup on error
             try:
                 self.monitoring_active = False
                 
                 # Wake up any waiting threads
-                if hasattr(self, '_screen_test_started'):
-                    self._screen_test_started.set()
+                self._screen_test_started = True
                 
                 # Force stop monitoring thread
                 if 'monitoring_thread' in locals() and monitoring_thread and monitoring_thread.is_alive():
@@ -1491,8 +2005,7 @@ class TestScenarioEngine(QObject):
                     
                 # Reset screen test state
                 self._screen_test_start_time = None
-                if hasattr(self, '_screen_test_started'):
-                    self._screen_test_started.clear()
+                self._screen_test_started = False
                     
             except Exception as cleanup_error:
                 self.log_callback(f"Error during cleanup: {cleanup_error}", "error")
@@ -1520,9 +2033,7 @@ class TestScenarioEngine(QObject):
                 act = ActLibrary()
                 
                 # Store for other steps
-                self._browser_device = device
-                self._browser_ctx = ctx
-                self._browser_act = act
+                self._browser = BrowserEnv(device, ctx, act)
                 
                 # Calculate screen coordinates
                 coord_calc = CoordinateCalculator(device)
@@ -1554,13 +2065,11 @@ class TestScenarioEngine(QObject):
         try:
             self.log_callback("Enabling WiFi connection", "info")
             
-            if not hasattr(self, '_browser_device'):
+            if self._browser is None:
                 self.log_callback("ERROR: Browser environment not setup", "error")
                 return False
             
-            device = self._browser_device
-            ctx = self._browser_ctx
-            act = self._browser_act
+            device, ctx, act = self._browser
             
             # Enable WiFi
             device.shell("svc wifi enable")
@@ -1588,13 +2097,11 @@ class TestScenarioEngine(QObject):
         try:
             self.log_callback("Starting browser search test", "info")
             
-            if not hasattr(self, '_browser_device'):
+            if self._browser is None:
                 self.log_callback("ERROR: Browser environment not setup", "error")
                 return False
             
-            device = self._browser_device
-            ctx = self._browser_ctx
-            act = self._browser_act
+            device, ctx, act = self._browser
             
             # Launch Samsung Internet browser
             self.log_callback("Launching Samsung Internet browser", "info")
@@ -1622,23 +2129,19 @@ class TestScenarioEngine(QObject):
         try:
             self.log_callback("Starting Pageboost performance test", "info")
             
-            if not hasattr(self, '_browser_device'):
+            if self._browser is None:
                 self.log_callback("ERROR: Browser environment not setup", "error")
                 return False
             
-            device = self._browser_device
+            device = self._browser.device
             
             # Run Pageboost: Launch browser 10 times
             for i in range(10):
                 self.log_callback(f"Pageboost iteration {i+1}/10", "info")
                 
-                # Launch browser
-                device.shell("am start -n com.sec.android.app.sbrowser")
-                device.sleep(1000)
-                
-                # Return to home
-                device.press("home")
-                device.sleep(2000)
+                # Launch browser, wait 1s, return to home, wait 2s (one adb round-trip; sleeps run on device)
+                device.shell("am start -n com.sec.android.app.sbrowser ; sleep 1 ; "
+                             "input keyevent KEYCODE_HOME ; sleep 2")
                 
                 # Check if test should stop
                 if self.stop_requested:
@@ -1657,13 +2160,11 @@ class TestScenarioEngine(QObject):
         try:
             self.log_callback("Cleaning up apps and notifications", "info")
             
-            if not hasattr(self, '_browser_device'):
+            if self._browser is None:
                 self.log_callback("ERROR: Browser environment not setup", "error")
                 return False
             
-            device = self._browser_device
-            ctx = self._browser_ctx
-            act = self._browser_act
+            device, ctx, act = self._browser
             
             # Use act_library cleanup method
             act.recent_noti_clear(ctx, device)
@@ -1679,12 +2180,12 @@ class TestScenarioEngine(QObject):
         """Handle common browser dialogs"""
         try:
             # Handle Continue dialog
-            if device.click({"textMatches": "(?i)Continue"}):
+            if device.click(_SEL_CONTINUE):
                 device.sleep(1000)
                 self.log_callback("Handled Continue dialog", "info")
             
             # Handle Not now dialog
-            if device.click({"textMatches": "(?i)Not now"}):
+            if device.click(_SEL_NOT_NOW):
                 device.sleep(1000)
                 self.log_callback("Handled Not now dialog", "info")
                 
@@ -1695,11 +2196,11 @@ class TestScenarioEngine(QObject):
         """Navigate to Google search page"""
         try:
             # Click address bar
-            device.click({"resourceId": "com.sec.android.app.sbrowser:id/location_bar_edit_text"})
+            device.click(_SEL_LOCATION_BAR)
             device.sleep(2000)
             
             # Clear existing text
-            device.click({"textMatches": r"\QClear\E"})
+            device.click(_SEL_CLEAR)
             device.sleep(500)
             
             # Enter Google URL
@@ -1725,24 +2226,41 @@ class TestScenarioEngine(QObject):
             device.tap(int(home_x), int(home_y))
             device.sleep(1500)
             
-            # Handle Google onboarding dialogs
-            onboarding_ids = [
-                "com.google.android.googlequicksearchbox:id/omnient_onboarding_continue_button",
-                "com.google.android.googlequicksearchbox:id/omnient_onboarding_complete_btn",
-                "com.google.android.googlequicksearchbox:id/omnient_onboarding_dialog_complete_btn",
-                "com.google.android.googlequicksearchbox:id/omnient_onboarding_tooltip_page_close_button",
-            ]
-            
-            for res_id in onboarding_ids:
-                if device.click({"resourceId": res_id}):
-                    device.sleep(1000)
-                    self.log_callback(f"Handled onboarding dialog: {res_id}", "info")
+            # Handle Google onboarding dialogs: one hierarchy dump finds the next dialog
+            # button to tap, instead of probing every selector with its own click()
+            remaining = [selector['resourceId'] for selector in _SEL_GOOGLE_ONBOARDING]
+            while remaining:
+                hit = self._find_first_resource(device.dump_hierarchy(), remaining)
+                if hit is None:
+                    break
+                res_id, (x, y) = hit
+                device.tap(x, y)
+                device.sleep(1000)
+                self.log_callback(f"Handled onboarding dialog: {res_id}", "info")
+                remaining = remaining[remaining.index(res_id) + 1:]  # Dialogs advance in order
             
             self.log_callback("Google search interaction completed", "info")
             
         except Exception as e:
             self.log_callback(f"Error in Google search: {e}", "warn")
     
+    @staticmethod
+    def _find_first_resource(hierarchy_xml: str, resource_ids: List[str]):
+        """First of resource_ids present in a uiautomator dump, as (resource_id, (center_x, center_y)) or None"""
+        if not hierarchy_xml:
+            return None
+        try:
+            root = ElementTree.fromstring(hierarchy_xml)
+        except ElementTree.ParseError:
+            return None
+        bounds = {node.get('resource-id'): node.get('bounds') for node in root.iter('node')}
+        for res_id in resource_ids:
+            match = _BOUNDS_RE.match(bounds.get(res_id) or "")
+            if match:
+                x1, y1, x2, y2 = map(int, match.groups())
+                return res_id, ((x1 + x2) // 2, (y1 + y2) // 2)
+        return None
+    
     def _step_stop_daq_monitoring(self) -> bool:
         """Stop DAQ monitoring"""
         try:
@@ -1771,10 +2289,10 @@ class TestScenarioEngine(QObject):
             self.log_callback(f"Error stopping DAQ monitoring: {e}", "error")
             return False
     
-    def _get_excel_filename_with_repeat(self, base_name: str = "test_results") -> str:
-        """Generate CSV filename with repeat iteration number"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        repeat_suffix = f"_iter{self.current_repeat:02d}" if hasattr(self, 'current_repeat') and self.current_repeat > 0 else ""
+    def _get_excel_filename_with_repeat(self, base_name: str = "test_results", timestamp: Optional[str] = None) -> str:
+        """Generate CSV filename with repeat iteration number (timestamp defaults to now)"""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        repeat_suffix = f"_iter{self.current_repeat:02d}" if self.current_repeat > 0 else ""
         return f"{base_name}_{timestamp}{repeat_suffix}.csv"
     
     def _step_export_to_csv(self) -> bool:
@@ -1785,8 +2303,10 @@ class TestScenarioEngine(QObject):
                 self.log_callback("Test was stopped - skipping data export", "info")
                 return True
             
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")  # Formatted once for the filename
+            
             # Always export at the end of each iteration
-            if hasattr(self, 'repeat_count') and hasattr(self, 'current_repeat'):
+            if self.current_repeat:
                 self.log_callback(f"Exporting data for iteration {self.current_repeat}/{self.repeat_count}", "info")
             
             self.log_callback("Starting Excel export...", "info")
@@ -1805,26 +2325,19 @@ class TestScenarioEngine(QObject):
                 sample = self.daq_data[0]
                 self.log_callback(f"Data structure: {list(sample.keys())}", "info")
             
-            # Create test_results directory if it doesn't exist
-            import os
+            # Create test_results directory if it doesn't exist (checked once per engine)
             results_dir = "test_results"
-            if not os.path.exists(results_dir):
-                os.makedirs(results_dir)
-                self.log_callback(f"Created directory: {results_dir}", "info")
+            if not self._results_dir_ready:
+                os.makedirs(results_dir, exist_ok=True)  # One call, no exists()/makedirs race
+                self._results_dir_ready = True
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             # Use scenario name for filename with iteration number
             scenario_name = self.current_test.scenario_name if self.current_test else "test"
             safe_name = scenario_name.replace(" ", "_").replace("/", "_").replace("\\", "_")
-            
-            # Add iteration number to filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            repeat_suffix = f"_iter{self.current_repeat:02d}" if hasattr(self, 'current_repeat') and self.current_repeat > 0 else ""
-            csv_filename = f"{results_dir}/{safe_name}_{timestamp}{repeat_suffix}.csv"
+            csv_filename = self._get_excel_filename_with_repeat(f"{results_dir}/{safe_name}", timestamp)
             
             self.log_callback(f"Exporting to CSV file: {csv_filename}", "info")
             
-            # Export to CSV (fast and lightweight, suitable for large datasets)
             csv_success = self._export_to_csv(csv_filename)
             
             if csv_success:
@@ -1835,41 +2348,85 @@ class TestScenarioEngine(QObject):
             return csv_success
         except Exception as e:
             self.log_callback(f"CRITICAL ERROR in CSV export: {e}", "error")
-            import traceback
-            self.log_callback(f"Export error details: {traceback.format_exc()}", "error")
+            self._log_traceback("Export error details")
             return False
     
     def _daq_monitoring_loop(self):
         """DAQ monitoring loop (runs in separate thread) - Thread-safe version"""
-        # Use print for thread-safe logging (no Qt signals)
-        print("DAQ monitoring loop started")
-        
-        # Completely disable Qt signals in this thread to prevent QBasicTimer errors
-        import sys
-        if hasattr(sys, '_getframe'):
-            try:
-                # Disable Qt event processing in this thread
-                import os
-                os.environ['QT_LOGGING_RULES'] = 'qt.qpa.xcb.warning=false'
-            except:
-                pass
+        # Queue-backed logger (no Qt signals): this thread only enqueues records,
+        # formatting and stdout writes happen on the listener thread
+        log = _daq_logger()
+        log.info("DAQ monitoring loop started")
+        # One event ends the loop: set when monitoring_active drops, which stop_test() also does.
+        # Pacing waits on it, so shutdown never waits out a sleep
+        stop_wait = self._monitor_stop_evt.wait
+        monitor_stopped = self._monitor_stop_evt.is_set
+        timer_period_raised = False
         
         try:
             loop_count = 0
             sample_count = 0  # Track number of samples collected (0, 1, 2, 3, ...)
-            data_collection_start_time = None  # Track when data collection actually starts
+            data_collection_start_ns = None  # monotonic_ns() when data collection actually starts
             # Use pre-stored configuration (thread-safe)
             enabled_channels = getattr(self, '_monitoring_channels', ['ai0', 'ai1', 'ai2', 'ai3', 'ai4', 'ai5'])
             measurement_mode = getattr(self, '_monitoring_mode', 'current')
             
             if not enabled_channels:
-                print("ERROR: No enabled channels found for monitoring!")
+                log.error("No enabled channels found for monitoring!")
                 return
             
-            print(f"Monitoring {len(enabled_channels)} channels in {measurement_mode} mode: {enabled_channels}")
-            print(f"Target: 10,000 samples over 10 seconds (Time: 0, 1, 2, 3, ... 9999 ms)")
+            log.info("Monitoring %d channels in %s mode: %s", len(enabled_channels), measurement_mode, enabled_channels)
+            log.info("Target: 10,000 samples over 10 seconds (Time: 0, 1, 2, 3, ... 9999 ms)")
+            
+            # Resolve the read path, column keys and hot-loop bindings once
+            # Keys are interned so every per-sample dict reuses the same string objects
+            current_keys = [sys.intern(f"{channel}_current") for channel in enabled_channels]
+            voltage_keys = [sys.intern(f"{channel}_voltage") for channel in enabled_channels]
+            # Reader returns mA: the A->mA scale is applied to the averaged NumPy vector, not per sample dict
+            current_source, read_currents = self._resolve_current_reader(enabled_channels, current_keys, scale=1000.0)
+            sim_voltage = self._simulation_block(1.0, 5.0, len(enabled_channels), 3) if measurement_mode != "current" else None
+            monotonic_ns = time.monotonic_ns  # Integer ns: interval math without float rounding
+            next_status_ns = 0
+            monitoring_timeout = getattr(self, '_monitoring_timeout', None)  # Set before the thread starts
+            # Deadline pacing: each iteration waits for the next 1 ms boundary on the stop event
+            tick_ns = 1_000_000
+            next_tick_ns = monotonic_ns() + tick_ns
+            if _WINMM:
+                _WINMM.timeBeginPeriod(1)
+                timer_period_raised = True
+            sample_keys = current_keys if measurement_mode == "current" else voltage_keys
+            
+            # Preallocated column buffer for the 10,000-sample capture: each sample is stored
+            # by index instead of as a dict; timestamps derive from started_at
+            daq_buf = self._preallocate_daq_buffers(10000, sample_keys)
+            self.daq_data = daq_buf
+            store = daq_buf.append_values
+            
+            log_progress = log.isEnabledFor(logging.INFO)  # Skip building previews nobody will see
+            
+            def emit_sample(sample_time_ms: int, channel_data: dict, elapsed_ns: int, label: str) -> bool:
+                """Store one sample (screen-test and fallback paths); False if there was no data"""
+                if not channel_data:
+                    return False
+                
+                # Check if all values are 0 (suspicious) - warn occasionally
+                if sample_time_ms % 1000 == 0 and sample_time_ms > 0:
+                    if not any(channel_data.values()):  # Readers only emit floats
+                        log.warning("All channel values are 0 at sample %d (%s)", sample_time_ms, label)
+                
+                # Current readings are already in mA (scaled by the reader)
+                # time_elapsed/screen_test_time are sequential: 0, 1, 2, 3, ..., 9999
+                store((sample_time_ms, sample_time_ms, *[channel_data.get(k, 0.0) for k in sample_keys]))
+                
+                # Log progress every 1000 samples (=1 second)
+                if (sample_time_ms + 1) % 1000 == 0 and log_progress:
+                    # Show first 2 channels only in log (in mA)
+                    channel_preview = ', '.join("%s=%.3fmA" % item for item in islice(channel_data.items(), 2))
+                    log.info("%s: %d samples at %dms (real: %.1fs) [%s...]",
+                             label, sample_time_ms + 1, sample_time_ms, elapsed_ns / 1e9, channel_preview)
+                return True
             
-            while self.monitoring_active and not self.stop_requested:
+            while not monitor_stopped():
                 try:
                     loop_count += 1
                     
@@ -1878,131 +2435,53 @@ class TestScenarioEngine(QObject):
                     successful_reads = 0
                     
                     if measurement_mode == "current":
-                        # Current mode - try real DAQ first, then simulation
+                        # Current mode - read path resolved once before the loop
                         try:
-                            # Try reading from real DAQ service
-                            # New approach: 30kHz sampling with 30:1 compression
-                            # - Sample at 30kHz (30,000 samples/second)
-                            # - Read 30 samples per 1ms data point
-                            # - Average 30 samples → 1 data point
-                            # - Result: 1,000 data points/second (each = 30 samples average)
-                            if self.daq_service and hasattr(self.daq_service, 'read_current_channels_direct'):
-                                try:
-                                    # Match manual measurement settings from NI Trace:
-                                    # - SampQuant.SampPerChan = 1000
-                                    # - SampClk.Rate = 30000
-                                    # - SampClk.ActiveEdge = Rising
-                                    # - SampClk.Src = "OnboardClock"
-                                    result = self.daq_service.read_current_channels_direct(
-                                        channels=enabled_channels,
-                                        samples_per_channel=1000  # Match manual: 1000 samples per channel
-                                    )
-                                    
-                                    if result:
-                                        for channel in enabled_channels:
-                                            if channel in result:
-                                                channel_data_result = result[channel]
-                                                # Get averaged current from multiple samples
-                                                if 'current_data' in channel_data_result:
-                                                    # Calculate average of all samples
-                                                    current_samples = channel_data_result['current_data']
-                                                    if current_samples:
-                                                        avg_current = sum(current_samples) / len(current_samples)
-                                                        channel_data[f"{channel}_current"] = avg_current
-                                                        successful_reads += 1
-                                                        if loop_count == 1:
-                                                            print(f"Real DAQ current from {channel} (1000-sample avg, 30kHz): {avg_current}A")
-                                                elif 'current' in channel_data_result:
-                                                    channel_data[f"{channel}_current"] = channel_data_result['current']
-                                                    successful_reads += 1
-                                                    if loop_count == 1:
-                                                        print(f"Real DAQ current from {channel}: {channel_data_result['current']}A")
-                                except Exception as multi_read_err:
-                                    print(f"Multi-channel read failed, trying individual reads: {multi_read_err}")
-                                    # Fallback: Read each channel individually
-                                    if self.daq_service and hasattr(self.daq_service, 'read_current'):
-                                        for channel in enabled_channels:
-                                            try:
-                                                # Read 1000 samples to match manual measurement settings
-                                                current = self._read_current_from_channel(channel, samples=1000)
-                                                channel_data[f"{channel}_current"] = current
-                                                successful_reads += 1
-                                                if loop_count == 1:
-                                                    print(f"Real DAQ current from {channel} (1000-sample avg, 30kHz): {current}A")
-                                            except Exception as read_err:
-                                                print(f"DAQ read error for {channel}: {read_err}, using fallback")
-                                                # Fallback to simulation for this channel
-                                                import random
-                                                current = round(random.uniform(-0.05, 0.05), 6)
-                                                channel_data[f"{channel}_current"] = current
-                                                successful_reads += 1
-                            elif self.daq_service and hasattr(self.daq_service, 'read_current'):
-                                # Fallback: Single sample read if multi-sample not available
-                                for channel in enabled_channels:
-                                    try:
-                                        current = self._read_current_from_channel(channel, samples=1)
-                                        channel_data[f"{channel}_current"] = current
-                                        successful_reads += 1
-                                        if loop_count == 1:
-                                            print(f"Real DAQ current from {channel}: {current}A")
-                                    except Exception as read_err:
-                                        print(f"DAQ read error for {channel}: {read_err}, using fallback")
-                                        # Fallback to simulation for this channel
-                                        import random
-                                        current = round(random.uniform(-0.05, 0.05), 6)
-                                        channel_data[f"{channel}_current"] = current
-                                        successful_reads += 1
-                            else:
-                                # No real DAQ, use simulation
-                                import random
-                                for channel in enabled_channels:
-                                    current = round(random.uniform(-0.05, 0.05), 6)  # Simulate microamp values
-                                    channel_data[f"{channel}_current"] = current
-                                    successful_reads += 1
-                                    if loop_count == 1:
-                                        print(f"Simulated current from {channel}: {current}A")
+                            channel_data = read_currents()
+                            successful_reads = len(channel_data)
+                            if loop_count == 1:
+                                log.info("%s current (mA): %s", current_source, channel_data)
                         except Exception as e:
-                            print(f"Error in current collection: {e}")
+                            log.error("Error in current collection: %s", e)
                             # Ensure all channels have data even on error
-                            for channel in enabled_channels:
-                                if f"{channel}_current" not in channel_data:
-                                    channel_data[f"{channel}_current"] = 0.0
-                                    print(f"?? WARNING: {channel}_current set to 0.0 due to error")
+                            for key in current_keys:
+                                if key not in channel_data:
+                                    channel_data[key] = 0.0
+                                    log.warning("%s set to 0.0 due to error", key)
                     
                     else:  # voltage mode
                         # Voltage mode - use safe simulation to avoid Qt signal issues
                         try:
-                            import random
-                            for channel in enabled_channels:
-                                voltage = round(random.uniform(1.0, 5.0), 3)  # Simulate voltage values
-                                channel_data[f"{channel}_voltage"] = voltage
-                                successful_reads += 1
-                                if loop_count == 1:
-                                    print(f"Simulated voltage from {channel}: {voltage}V")
+                            # Simulated voltage values, one pre-drawn row per iteration
+                            channel_data = dict(zip(voltage_keys, sim_voltage[loop_count % len(sim_voltage)].tolist()))
+                            successful_reads = len(channel_data)
+                            if loop_count == 1:
+                                log.info("Simulated voltage (V): %s", channel_data)
                         except Exception as e:
-                            print(f"Error in voltage simulation: {e}")
-                            for channel in enabled_channels:
-                                channel_data[f"{channel}_voltage"] = 0.0
+                            log.error("Error in voltage simulation: %s", e)
+                            for key in voltage_keys:
+                                channel_data[key] = 0.0
                     
                     # Add timestamp safely
                     try:
-                        current_time = time.time()
+                        now_ns = monotonic_ns()
+                        current_time = now_ns / 1e9  # Seconds, for the float deadlines set by the test thread
                         
-                        # Check if screen test has started using thread-safe event
-                        if hasattr(self, '_screen_test_started') and self._screen_test_started.is_set():
+                        # Check if screen test has started
+                        if self._screen_test_started:
                             # Screen test has started, calculate elapsed time
                             screen_test_elapsed = 0  # Initialize with default value
                             if hasattr(self, '_screen_test_start_time') and self._screen_test_start_time is not None:
                                 screen_test_elapsed = current_time - self._screen_test_start_time
                                 
                                 # Set data collection start time if not set
-                                if data_collection_start_time is None:
-                                    data_collection_start_time = current_time
-                                    print(f"Data collection started at screen test time: {screen_test_elapsed:.1f}s")
+                                if data_collection_start_ns is None:
+                                    data_collection_start_ns = now_ns
+                                    daq_buf.started_at = datetime.now()
+                                    log.info("Data collection started at screen test time: %.1fs", screen_test_elapsed)
                                 
-                                # Calculate actual elapsed time in ms (real-time based)
-                                actual_elapsed_time = current_time - data_collection_start_time
-                                actual_elapsed_ms = int(actual_elapsed_time * 1000)
+                                # Calculate actual elapsed time in ms (real-time based, integer ns math)
+                                actual_elapsed_ms = (now_ns - data_collection_start_ns) // 1_000_000
                                 
                                 # Collect samples: only collect when actual time catches up with sample count
                                 # This ensures exactly 1 sample per ms over 10 seconds
@@ -2012,47 +2491,13 @@ class TestScenarioEngine(QObject):
                                 # - At 9999ms: collect sample 9999 (sample_count becomes 10000)
                                 if sample_count <= actual_elapsed_ms < 10000:
                                     # Use sample count as time (ms): 0, 1, 2, 3, ..., 9999
-                                    sample_time_ms = sample_count
-                                    
-                                    # Validate channel_data before adding
-                                    if not channel_data:
+                                    if not emit_sample(sample_count, channel_data, now_ns - data_collection_start_ns, "DAQ"):
                                         continue  # Skip empty data
-                                    
-                                    # Check if all values are 0 (suspicious) - warn occasionally
-                                    if sample_count % 1000 == 0 and sample_count > 0:
-                                        all_zero = all(v == 0.0 for v in channel_data.values() if isinstance(v, (int, float)))
-                                        if all_zero:
-                                            print(f"WARNING: All channel values are 0 at sample {sample_count}")
-                                    
-                                    # Convert current from A to mA (multiply by 1000)
-                                    channel_data_mA = {}
-                                    for key, value in channel_data.items():
-                                        if '_current' in key:
-                                            channel_data_mA[key] = value * 1000  # A ? mA
-                                        else:
-                                            channel_data_mA[key] = value
-                                    
-                                    data_point = {
-                                        'timestamp': datetime.now(),
-                                        'time_elapsed': sample_time_ms,  # Sequential: 0, 1, 2, 3, ..., 9999
-                                        'screen_test_time': sample_time_ms,
-                                        **channel_data_mA
-                                    }
-                                    
-                                    # Thread-safe data append
-                                    if hasattr(self, 'daq_data'):
-                                        self.daq_data.append(data_point)
-                                        sample_count += 1  # Increment sample counter
-                                        
-                                        # Log progress every 1000 samples
-                                        if sample_count % 1000 == 0:
-                                            # Show first 2 channels only in log (in mA)
-                                            channel_preview = ', '.join([f"{k}={v:.3f}mA" for k, v in list(channel_data_mA.items())[:2]])
-                                            elapsed_sec = actual_elapsed_time
-                                            print(f"DAQ: {sample_count} samples at {sample_time_ms}ms (real: {elapsed_sec:.1f}s) [{channel_preview}...]")
+                                    sample_count += 1  # Increment sample counter
                                 elif actual_elapsed_ms >= 10000:
                                     # Stop collecting data after 10 seconds (10,000 ms)
-                                    print(f"Data collection completed ({sample_count} samples collected over {actual_elapsed_time:.1f}s), stopping monitoring")
+                                    log.info("Data collection completed (%d samples collected over %.1fs), stopping monitoring",
+                                             sample_count, (now_ns - data_collection_start_ns) / 1e9)
                                     self.monitoring_active = False
                                     break
                             else:
@@ -2060,97 +2505,144 @@ class TestScenarioEngine(QObject):
                                 continue
                         else:
                             # Screen test hasn't started yet, check timeout
-                            if hasattr(self, '_monitoring_timeout') and current_time > self._monitoring_timeout:
-                                timeout_duration = getattr(self, '_monitoring_timeout', current_time) - (current_time - 25)  # Calculate actual timeout duration
-                                print(f"ERROR: Timeout waiting for screen test to start ({timeout_duration:.0f}s), stopping monitoring")
+                            if monitoring_timeout is not None and current_time > monitoring_timeout:
+                                timeout_duration = monitoring_timeout - (current_time - 25)  # Calculate actual timeout duration
+                                log.error("Timeout waiting for screen test to start (%.0fs), stopping monitoring", timeout_duration)
                                 self.monitoring_active = False
                                 break
                             
                             # Fallback: If we've been waiting too long (>10s), start collecting data anyway
                             if loop_count > 10:  # After 10 seconds of waiting
-                                if data_collection_start_time is None:
-                                    data_collection_start_time = current_time
-                                    print("Fallback: Starting data collection without screen test signal")
+                                if data_collection_start_ns is None:
+                                    data_collection_start_ns = now_ns
+                                    daq_buf.started_at = datetime.now()
+                                    log.info("Fallback: Starting data collection without screen test signal")
                                 
                                 # Calculate sample-based time (starts at 0 and increments by 1ms)
-                                current_sample_count = len(self.daq_data) if hasattr(self, 'daq_data') else 0
+                                current_sample_count = len(daq_buf)
                                 sample_time_ms = current_sample_count  # 0, 1, 2, 3, ... (in ms)
                                 
                                 if sample_time_ms < 10000:  # Only collect for 10 seconds (10,000ms)
                                     # Collect EVERY loop iteration (1ms interval = 10,000 samples in 10s)
-                                    
-                                    # Validate channel_data before adding
-                                    if not channel_data:
+                                    if not emit_sample(sample_time_ms, channel_data, now_ns - data_collection_start_ns, "Fallback"):
                                         continue  # Skip empty data
-                                    
-                                    # Check if all values are 0 (suspicious) - warn occasionally
-                                    if current_sample_count % 1000 == 0 and current_sample_count > 0:
-                                        all_zero = all(v == 0.0 for v in channel_data.values() if isinstance(v, (int, float)))
-                                        if all_zero:
-                                            print(f"WARNING: All channel values are 0 at {sample_time_ms}ms (fallback)")
-                                    
-                                    # Convert current from A to mA (multiply by 1000)
-                                    channel_data_mA = {}
-                                    for key, value in channel_data.items():
-                                        if '_current' in key:
-                                            channel_data_mA[key] = value * 1000  # A ? mA
-                                        else:
-                                            channel_data_mA[key] = value
-                                    
-                                    data_point = {
-                                        'timestamp': datetime.now(),
-                                        'time_elapsed': sample_time_ms,  # Integer ms: 0, 1, 2, 3, ...
-                                        'screen_test_time': sample_time_ms,  # Fallback timing
-                                        **channel_data_mA
-                                    }
-                                    
-                                    # Thread-safe data append
-                                    if hasattr(self, 'daq_data'):
-                                        self.daq_data.append(data_point)
-                                        
-                                        # Log progress every 1000 samples (=1 second)
-                                        if len(self.daq_data) % 1000 == 0:
-                                            # Show first 2 channels only in log (in mA)
-                                            channel_preview = ', '.join([f"{k}={v:.3f}mA" for k, v in list(channel_data_mA.items())[:2]])
-                                            print(f"Fallback: {len(self.daq_data)} samples, {sample_time_ms}ms [{channel_preview}...]")
                                 else:
                                     # Stop fallback collection after 10 seconds (10,000 samples)
-                                    print(f"Fallback data collection completed ({len(self.daq_data)} samples, {sample_time_ms}ms)")
+                                    log.info("Fallback data collection completed (%d samples, %dms)", len(daq_buf), sample_time_ms)
                                     self.monitoring_active = False
                                     break
                             
                             # Wait for screen test to start
                             if loop_count % 10 == 1:  # Log every 10 seconds while waiting
-                                timeout_time = getattr(self, '_monitoring_timeout', current_time + 25)  # Use dynamic timeout
+                                timeout_time = monitoring_timeout if monitoring_timeout is not None else current_time + 25  # Use dynamic timeout
                                 remaining_time = max(0, timeout_time - current_time)
-                                print(f"Waiting for screen test to start... ({remaining_time:.0f}s timeout remaining)")
+                                log.info("Waiting for screen test to start... (%.0fs timeout remaining)", remaining_time)
                             
                             # Sleep before continue to avoid tight loop (longer wait for screen test)
-                            time.sleep(1.0)  # Keep 1s for waiting state
+                            stop_wait(1.0)  # Keep 1s for waiting state
                             continue
                         
-                        # Log progress every 10 seconds
-                        if loop_count % 10 == 0:
-                            data_count = len(self.daq_data) if hasattr(self, 'daq_data') else 0
-                            print(f"DAQ monitoring: {data_count} points collected, {successful_reads}/{len(enabled_channels)} channels OK")
+                        # Log progress every 10 seconds (the loop itself spins at sub-ms pace)
+                        if now_ns >= next_status_ns:
+                            next_status_ns = now_ns + 10_000_000_000
+                            data_count = len(daq_buf)
+                            log.info("DAQ monitoring: %d points collected, %d/%d channels OK", data_count, successful_reads, len(enabled_channels))
                             
                     except Exception as e:
-                        print(f"Error creating data point: {e}")
+                        log.error("Error creating data point: %s", e)
                     
-                    # Small sleep to prevent excessive CPU usage while waiting for next ms
-                    # Loop runs fast to check for each ms boundary
-                    time.sleep(0.0001)  # 0.1ms sleep to reduce CPU load
+                    # Sleep until the next ms boundary; when behind (slow read), skip the wait
+                    # so sample_count catches up with real time
+                    delay_ns = next_tick_ns - monotonic_ns()
+                    if delay_ns > 0:
+                        stop_wait(delay_ns / 1e9)
+                    next_tick_ns += tick_ns
                         
                 except Exception as loop_error:
                     # Log loop error but continue monitoring
-                    print(f"Error in monitoring loop iteration {loop_count}: {loop_error}")
-                    time.sleep(0.001)  # Wait before retry
+                    log.error("Error in monitoring loop iteration %d: %s", loop_count, loop_error)
+                    stop_wait(0.001)  # Wait before retry
                     
         except Exception as e:
-            print(f"Critical error in DAQ monitoring loop: {e}")
+            log.error("Critical error in DAQ monitoring loop: %s", e)
         finally:
             self.monitoring_active = False
-            print("DAQ monitoring loop ended")
+            if timer_period_raised:
+                _WINMM.timeEndPeriod(1)
+            log.info("DAQ monitoring loop ended")
+    
+    def _simulation_block(self, low: float, high: float, n_channels: int, decimals: int, n_rows: int = 10000) -> np.ndarray:
+        """Simulated readings drawn in one call (n_rows x n_channels), rounded like the per-sample values were"""
+        return self._rng.uniform(low, high, (n_rows, n_channels)).round(decimals)
+    
+    def _resolve_current_reader(self, enabled_channels: List[str], current_keys: List[str], scale: float = 1.0):
+        """Pick the current-read path for _daq_monitoring_loop once
+        
+        Returns (source, read) where read() gives {"<ch>_current": Amps * scale} for the
+        channels that produced a value. Preference: multi-channel direct read,
+        per-channel reads, simulation.
+        """
+        svc = self.daq_service
+        keyed = list(zip(enabled_channels, current_keys))
+        uniform = random.uniform
+        read_direct = getattr(svc, 'read_current_channels_direct', None)
+        has_read_current = hasattr(svc, 'read_current')
+        
+        sim_rows = None
+        sim_count = 0
+        
+        def simulate():
+            # Cycle through a pre-drawn block instead of one random call per channel
+            nonlocal sim_rows, sim_count
+            if sim_rows is None:
+                sim_rows = self._simulation_block(-0.05, 0.05, len(current_keys), 6) * scale
+            sim_count += 1
+            return dict(zip(current_keys, sim_rows[sim_count % len(sim_rows)].tolist()))
+        
+        def read_each(samples):
+            data = {}
+            for channel, key in keyed:
+                try:
+                    data[key] = self._read_current_from_channel(channel, samples=samples) * scale
+                except Exception as read_err:
+                    print(f"DAQ read error for {channel}: {read_err}, using fallback")
+                    data[key] = round(uniform(-0.05, 0.05), 6) * scale
+            return data
+        
+        def read_multi():
+            # Match manual measurement settings from NI Trace: 1000 samples per channel
+            try:
+                result = read_direct(channels=enabled_channels, samples_per_channel=1000)
+            except Exception as multi_read_err:
+                print(f"Multi-channel read failed, trying individual reads: {multi_read_err}")
+                return read_each(1000) if has_read_current else {}
+            data = {}
+            if result:
+                # Average all sampled channels in one NumPy reduction
+                sampled = [(channel, key) for channel, key in keyed
+                           if channel in result and len(result[channel].get('current_data', ())) > 0]
+                if sampled:
+                    means = np.asarray(self._mean_per_channel([result[channel]['current_data'] for channel, _ in sampled]))
+                    data.update(zip([key for _, key in sampled], (means * scale).tolist()))
+                for channel, key in keyed:
+                    if channel in result and 'current_data' not in result[channel] and 'current' in result[channel]:
+                        data[key] = result[channel]['current'] * scale
+            return data
+        
+        if read_direct:
+            return "Real DAQ (1000-sample avg)", read_multi
+        if has_read_current:
+            return "Real DAQ (single sample)", lambda: read_each(1)
+        return "Simulated", simulate
+    
+    def _preallocate_daq_buffers(self, n: int, channel_keys: List[str]) -> DAQBuffer:
+        """Columnar buffer for a 1 kHz capture: time_elapsed/screen_test_time in ms plus one column per channel
+        
+        Times are integer milliseconds (int64); channel columns stay float64 so
+        exported values read back exactly as measured.
+        """
+        return DAQBuffer(['time_elapsed', 'screen_test_time'] + list(channel_keys), capacity=n,
+                         dtypes={'time_elapsed': np.int64, 'screen_test_time': np.int64}, time_scale=0.001)
     
     def _daq_monitoring_hardware_timed(self):
         """DAQ monitoring using hardware timing (10kHz with 10:1 compression, 1 sample per ms)"""
@@ -2159,12 +2651,17 @@ class TestScenarioEngine(QObject):
         try:
             # Wait for screen test to start
             print("Waiting for screen test to start...")
-            if hasattr(self, '_screen_test_started'):
-                wait_success = self._screen_test_started.wait(timeout=25.0)
-                if not wait_success:
-                    print("ERROR: Screen test start timeout (25s)")
-                    self.monitoring_active = False
-                    return
+            # Blocks until the test thread sets _screen_test_started (stop and cleanup also release it)
+            started = self._screen_start_evt.wait(timeout=25.0)
+            if self.stop_requested or not self.monitoring_active:
+                print("Monitoring stopped before the screen test started, skipping DAQ collection")
+                self.monitoring_active = False
+                return
+            if not started:
+                print("ERROR: Screen test start timeout (25s)")
+                self.monitoring_active = False
+                return
+            capture_started_at = datetime.now()  # Sample timestamps are derived from this
             
             # Get enabled channels
             enabled_channels = getattr(self, '_monitoring_channels', ['ai0', 'ai1'])
@@ -2193,39 +2690,29 @@ class TestScenarioEngine(QObject):
                 if daq_result:
                     print(f"DAQ collection completed: {len(daq_result)} channels")
                     
-                    # Convert to daq_data format
-                    if hasattr(self, 'daq_data'):
-                        self.daq_data = []
-                        
-                        # Get sample count (depends on test duration: 10s=10000, 20s=20000, etc.)
-                        first_channel = list(daq_result.keys())[0]
-                        sample_count = daq_result[first_channel]['sample_count']
-                        
-                        print(f"Processing {sample_count} samples (0 to {sample_count-1} ms)...")
-                        
-                        # Create data points for each sample
-                        for i in range(sample_count):
-                            data_point = {
-                                'timestamp': datetime.now(),
-                                'time_elapsed': i,  # Time in ms: 0, 1, 2, ..., (sample_count-1)
-                                'screen_test_time': i
-                            }
-                            
-                            # Add current data for each channel (already in mA from DAQ)
-                            for channel in enabled_channels:
-                                if channel in daq_result:
-                                    current_mA = daq_result[channel]['current_data'][i]
-                                    data_point[f'{channel}_current'] = current_mA  # Current in mA
-                            
-                            self.daq_data.append(data_point)
-                            
-                            # Log progress every 1000 samples
-                            if (i + 1) % 1000 == 0:
-                                print(f"Processed {i + 1}/{sample_count} samples")
+                    # Get sample count (depends on test duration: 10s=10000, 20s=20000, etc.)
+                    first_channel = list(daq_result.keys())[0]
+                    sample_count = daq_result[first_channel]['sample_count']
                         
-                        print(f"? Successfully processed {len(self.daq_data)} data points")
-                    else:
-                        print("ERROR: daq_data attribute not found")
+                    print(f"Processing {sample_count} samples (0 to {sample_count-1} ms)...")
+                    
+                    # Fill the columnar buffer preallocated by _step_start_daq_monitoring
+                    if not isinstance(self.daq_data, DAQBuffer) or len(self.daq_data):
+                        self.daq_data = self._preallocate_daq_buffers(
+                            sample_count, [f"{channel}_current" for channel in enabled_channels])
+                    self.daq_data.started_at = capture_started_at
+                    
+                    # Whole-column fill: time in ms (0, 1, ..., sample_count-1) plus current per channel
+                    # (already in mA from DAQ); missing channels read as 0
+                    time_ms = np.arange(sample_count, dtype=np.int32)
+                    columns = {'time_elapsed': time_ms, 'screen_test_time': time_ms}
+                    for channel in enabled_channels:
+                        if channel in daq_result:
+                            columns[f"{channel}_current"] = np.asarray(
+                                daq_result[channel]['current_data'][:sample_count], dtype=np.float64)
+                    self.daq_data.extend_columns(columns)
+                    
+                    print(f"? Successfully processed {len(self.daq_data)} data points")
                 else:
                     print("ERROR: DAQ collection returned no data")
             else:
@@ -2235,7 +2722,6 @@ class TestScenarioEngine(QObject):
                 
         except Exception as e:
             print(f"ERROR in hardware-timed DAQ collection: {e}")
-            import traceback
             traceback.print_exc()
         finally:
             self.monitoring_active = False
@@ -2244,7 +2730,6 @@ class TestScenarioEngine(QObject):
     def _daq_monitoring_loop_isolated_simulation(self):
         """Simulation fallback for when DAQ hardware is not available"""
         print("Using simulation mode for DAQ collection")
-        import random
         
         enabled_channels = getattr(self, '_monitoring_channels', ['ai0', 'ai1'])
         test_duration = getattr(self, '_test_duration', 10.0)
@@ -2252,20 +2737,16 @@ class TestScenarioEngine(QObject):
         
         print(f"Simulating {expected_samples} samples for {test_duration}s test")
         
-        if hasattr(self, 'daq_data'):
-            self.daq_data = []
-            for i in range(expected_samples):
-                data_point = {
-                    'timestamp': datetime.now(),
-                    'time_elapsed': i,
-                    'screen_test_time': i
-                }
-                for channel in enabled_channels:
-                    data_point[f'{channel}_current'] = random.uniform(-50, 50)  # mA
-                self.daq_data.append(data_point)
-                
-                if (i + 1) % 1000 == 0:
-                    print(f"Simulation: {i + 1}/10000 samples")
+        current_keys = [f"{channel}_current" for channel in enabled_channels]
+        self.daq_data = self._preallocate_daq_buffers(expected_samples, current_keys)
+        self.daq_data.started_at = datetime.now()
+        # Whole capture in one block (mA), stored column by column
+        noise = self._simulation_block(-50, 50, len(enabled_channels), 6, expected_samples)
+        time_ms = np.arange(expected_samples, dtype=np.int32)
+        columns = {'time_elapsed': time_ms, 'screen_test_time': time_ms}
+        columns.update(zip(current_keys, noise.T))
+        self.daq_data.extend_columns(columns)
+        print(f"Simulation: {len(self.daq_data)} samples")
     
     def _daq_monitoring_loop_isolated(self):
         """Completely isolated DAQ monitoring loop - no Qt dependencies"""
@@ -2273,7 +2754,6 @@ class TestScenarioEngine(QObject):
         
         try:
             # Completely isolate from Qt
-            import threading
             current_thread = threading.current_thread()
             current_thread.name = "DAQ-Isolated"
             
@@ -2284,30 +2764,42 @@ class TestScenarioEngine(QObject):
             
             print(f"Isolated monitoring {len(enabled_channels)} channels in {measurement_mode} mode")
             
-            while self.monitoring_active and not self.stop_requested:
+            # Pre-drawn simulation rows, cycled one per iteration
+            if measurement_mode == "current":
+                sim_keys = [f"{channel}_current" for channel in enabled_channels]
+                sim_rows = self._simulation_block(-0.05, 0.05, len(enabled_channels), 6)  # Microamps
+            else:
+                sim_keys = [f"{channel}_voltage" for channel in enabled_channels]
+                sim_rows = self._simulation_block(1.0, 5.0, len(enabled_channels), 3)  # Volts
+            
+            # Bind everything the 1 kHz loop touches once; only the flags the test thread
+            # updates (_screen_test_started/_screen_test_start_time) are read per iteration
+            monitor_stopped = self._monitor_stop_evt.is_set
+            stop_requested = self._stop_evt.is_set
+            daq_data = self.daq_data
+            append = daq_data.append
+            timeout = getattr(self, '_monitoring_timeout', None)
+            monotonic = time.monotonic
+            time_ns = time.time_ns
+            sleep = time.sleep
+            n_rows = len(sim_rows)
+            n_channels = len(enabled_channels)
+            
+            while not monitor_stopped() and not stop_requested():
                 try:
                     loop_count += 1
-                    current_time = time.time()
+                    current_time = monotonic()
                     
                     # Generate simulation data (no DAQ service calls to avoid Qt issues)
-                    channel_data = {}
-                    successful_reads = 0
-                    
-                    import random
-                    for channel in enabled_channels:
-                        if measurement_mode == "current":
-                            value = round(random.uniform(-0.05, 0.05), 6)  # Microamps
-                            channel_data[f"{channel}_current"] = value
-                        else:
-                            value = round(random.uniform(1.0, 5.0), 3)  # Volts
-                            channel_data[f"{channel}_voltage"] = value
-                        successful_reads += 1
+                    channel_data = dict(zip(sim_keys, sim_rows[loop_count % n_rows].tolist()))
+                    successful_reads = len(channel_data)
                     
-                    # Check if screen test has started using thread-safe event
-                    if hasattr(self, '_screen_test_started') and self._screen_test_started.is_set():
+                    # Check if screen test has started
+                    if self._screen_test_started:
                         # Screen test has started, calculate elapsed time
-                        if hasattr(self, '_screen_test_start_time') and self._screen_test_start_time is not None:
-                            screen_test_elapsed = current_time - self._screen_test_start_time
+                        screen_test_start_time = self._screen_test_start_time
+                        if screen_test_start_time is not None:
+                            screen_test_elapsed = current_time - screen_test_start_time
                             
                             # Set data collection start time if not set
                             if data_collection_start_time is None:
@@ -2320,19 +2812,18 @@ class TestScenarioEngine(QObject):
                             # Only collect data during test period (0-10 seconds for Phone app test)
                             if screen_test_elapsed >= 0 and screen_test_elapsed <= 10.0 and data_elapsed_time <= 10.0:
                                 data_point = {
-                                    'timestamp': datetime.now(),
+                                    'timestamp_ns': time_ns(),  # Wall clock as int ns; exports convert to datetimes
                                     'time_elapsed': round(data_elapsed_time, 1),  # Time from data collection start (0-10s)
                                     'screen_test_time': round(data_elapsed_time, 1),  # Same as elapsed time
                                     **channel_data
                                 }
                                 
                                 # Thread-safe data append
-                                if hasattr(self, 'daq_data'):
-                                    self.daq_data.append(data_point)
+                                append(data_point)
                                     
                                 # Log progress every 10 data points
-                                if len(self.daq_data) % 10 == 1:
-                                    print(f"Isolated: Data collection: {len(self.daq_data)} points, time: {data_elapsed_time:.1f}s")
+                                if len(daq_data) % 10 == 1:
+                                    print(f"Isolated: Data collection: {len(daq_data)} points, time: {data_elapsed_time:.1f}s")
                             elif data_elapsed_time > 10.0:
                                 print(f"Isolated: Data collection completed ({data_elapsed_time:.1f}s), stopping")
                                 self.monitoring_active = False
@@ -2341,33 +2832,33 @@ class TestScenarioEngine(QObject):
                             continue
                     else:
                         # Check timeout
-                        if hasattr(self, '_monitoring_timeout') and current_time > self._monitoring_timeout:
-                            timeout_duration = getattr(self, '_monitoring_timeout', current_time) - (current_time - 25)  # Calculate actual timeout duration
+                        if timeout is not None and current_time > timeout:
+                            timeout_duration = timeout - (current_time - 25)  # Calculate actual timeout duration
                             print(f"Isolated: ERROR - Timeout waiting for screen test ({timeout_duration:.0f}s)")
                             self.monitoring_active = False
                             break
                         
                         # Wait message (less frequent)
                         if loop_count % 10 == 1:
-                            timeout_time = getattr(self, '_monitoring_timeout', current_time + 25)  # Use dynamic timeout
+                            timeout_time = timeout if timeout is not None else current_time + 25  # Use dynamic timeout
                             remaining = max(0, timeout_time - current_time)
                             print(f"Isolated: Waiting for screen test... ({remaining:.0f}s remaining)")
                         
                         # Sleep before continue to avoid tight loop (longer wait for screen test)
-                        time.sleep(1.0)  # Keep 1s for waiting state
+                        sleep(1.0)  # Keep 1s for waiting state
                         continue
                     
                     # Progress logging
                     if loop_count % 10 == 0:
-                        data_count = len(self.daq_data) if hasattr(self, 'daq_data') else 0
-                        print(f"Isolated DAQ: {data_count} points, {successful_reads}/{len(enabled_channels)} channels OK")
+                        data_count = len(daq_data)
+                        print(f"Isolated DAQ: {data_count} points, {successful_reads}/{n_channels} channels OK")
                     
                     # Sleep
-                    time.sleep(0.001)  # 1ms interval
+                    sleep(0.001)  # 1ms interval
                     
                 except Exception as loop_error:
                     print(f"Isolated DAQ loop error: {loop_error}")
-                    time.sleep(0.001)  # 1ms interval
+                    sleep(0.001)  # 1ms interval
                     
         except Exception as e:
             print(f"Isolated DAQ critical error: {e}")
@@ -2379,7 +2870,7 @@ class TestScenarioEngine(QObject):
         """Get list of enabled channels from multi-channel monitor"""
         return self._get_enabled_channels_from_monitor()
     
-    def _calculate_robust_statistics(self, values: List[float], 
+    def _calculate_robust_statistics(self, values: Union[List[float], np.ndarray], 
                                      exclude_stabilization: bool = True,
                                      stabilization_seconds: float = 1.0,
                                      remove_outliers: bool = True,
@@ -2388,7 +2879,7 @@ class TestScenarioEngine(QObject):
         Calculate robust statistics with outlier removal and stabilization period exclusion
         
         Args:
-            values: List of values to analyze
+            values: Values to analyze (list or NumPy array; arrays are used without copying)
             exclude_stabilization: Whether to exclude initial stabilization period
             stabilization_seconds: Duration of stabilization period in seconds (assuming 1ms sampling)
             remove_outliers: Whether to remove outliers
@@ -2397,15 +2888,15 @@ class TestScenarioEngine(QObject):
         Returns:
             Dictionary with statistics: avg, median, min, max, std, count, filtered_count
         """
-        if not values:
+        if len(values) == 0:
             return {
                 'avg': 0.0, 'median': 0.0, 'min': 0.0, 'max': 0.0,
                 'std': 0.0, 'count': 0, 'filtered_count': 0
             }
         
-        # Convert to numpy array for easier processing
-        import numpy as np
-        values_array = np.array(values)
+        # View NumPy input as-is (e.g. a DAQBuffer column); lists are converted once
+        values_array = np.asarray(values, dtype=np.float64)
+        owns_array = values_array is not values  # Converted here, so it may be sorted in place
         
         # Step 1: Exclude stabilization period (first N samples)
         if exclude_stabilization and len(values_array) > 0:
@@ -2422,14 +2913,20 @@ class TestScenarioEngine(QObject):
             }
         
         # Step 2: Remove outliers
-        filtered_values = values_array.copy()
+        # One sort serves the quartiles, the bounds filter (a contiguous slice) and median/min/max
+        # (caller arrays are sorted into a copy; a freshly converted list is sorted in place)
+        if owns_array:
+            values_array.sort()
+        else:
+            values_array = np.sort(values_array)
+        filtered_values = values_array
         original_count = len(filtered_values)
         
         if remove_outliers and len(filtered_values) > 10:  # Need enough samples for outlier detection
             if outlier_method == 'iqr':
                 # IQR (Interquartile Range) method
-                Q1 = np.percentile(filtered_values, 25)
-                Q3 = np.percentile(filtered_values, 75)
+                Q1 = self._sorted_percentile(filtered_values, 25)
+                Q3 = self._sorted_percentile(filtered_values, 75)
                 IQR = Q3 - Q1
                 
                 # Define outlier bounds (1.5 * IQR is standard)
@@ -2437,8 +2934,7 @@ class TestScenarioEngine(QObject):
                 upper_bound = Q3 + 1.5 * IQR
                 
                 # Filter outliers
-                mask = (filtered_values >= lower_bound) & (filtered_values <= upper_bound)
-                filtered_values = filtered_values[mask]
+                filtered_values = self._sorted_within(filtered_values, lower_bound, upper_bound)
                 
                 outlier_count = original_count - len(filtered_values)
                 if outlier_count > 0:
@@ -2446,33 +2942,22 @@ class TestScenarioEngine(QObject):
             
             elif outlier_method == 'zscore':
                 # Z-score method (values beyond 3 standard deviations)
-                mean = np.mean(filtered_values)
-                std = np.std(filtered_values)
+                mean, std = _mean_std(filtered_values, float(filtered_values[original_count // 2]))
                 
                 if std > 0:
-                    z_scores = np.abs((filtered_values - mean) / std)
-                    mask = z_scores < 3.0
-                    filtered_values = filtered_values[mask]
+                    # |z| < 3 as scalar bounds: no z-score temporaries
+                    filtered_values = self._sorted_within(filtered_values, mean - 3.0 * std, mean + 3.0 * std,
+                                                          inclusive=False)
                     
                     outlier_count = original_count - len(filtered_values)
                     if outlier_count > 0:
                         self.log_callback(f"Removed {outlier_count} outliers using Z-score method", "info")
         
-        # Step 3: Calculate statistics on filtered data
-        if len(filtered_values) > 0:
-            avg = float(np.mean(filtered_values))
-            median = float(np.median(filtered_values))
-            min_val = float(np.min(filtered_values))
-            max_val = float(np.max(filtered_values))
-            std = float(np.std(filtered_values))
-        else:
+        # Step 3: Calculate statistics on filtered data (still sorted)
+        if len(filtered_values) == 0:
             # Fallback to original values if all filtered out
-            avg = float(np.mean(values_array))
-            median = float(np.median(values_array))
-            min_val = float(np.min(values_array))
-            max_val = float(np.max(values_array))
-            std = float(np.std(values_array))
             filtered_values = values_array
+        avg, median, min_val, max_val, std = self._sorted_stats(filtered_values)
         
         return {
             'avg': avg,
@@ -2484,6 +2969,35 @@ class TestScenarioEngine(QObject):
             'filtered_count': len(filtered_values)
         }
     
+    @staticmethod
+    def _sorted_percentile(sorted_values: np.ndarray, q: float) -> float:
+        """np.percentile (linear interpolation) of an already sorted array"""
+        pos = q / 100.0 * (len(sorted_values) - 1)
+        lo = int(pos)
+        hi = min(lo + 1, len(sorted_values) - 1)
+        return float(sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo))
+    
+    @staticmethod
+    def _sorted_within(sorted_values: np.ndarray, lower: float, upper: float, inclusive: bool = True) -> np.ndarray:
+        """Values of a sorted array within [lower, upper] (or (lower, upper)) as a slice view"""
+        start = np.searchsorted(sorted_values, lower, side='left' if inclusive else 'right')
+        end = np.searchsorted(sorted_values, upper, side='right' if inclusive else 'left')
+        return sorted_values[start:end]
+    
+    @staticmethod
+    def _sorted_stats(sorted_values: np.ndarray) -> tuple:
+        """(avg, median, min, max, std) of a non-empty sorted array
+        
+        Order statistics are read by index; mean and population std come from
+        one sum / sum-of-squares pair (taken around the median) instead of
+        separate mean() and std() passes.
+        """
+        n = len(sorted_values)
+        mid = n // 2
+        median = float(sorted_values[mid] if n % 2 else (sorted_values[mid - 1] + sorted_values[mid]) / 2.0)
+        avg, std = _mean_std(sorted_values, median)
+        return avg, median, float(sorted_values[0]), float(sorted_values[-1]), std
+    
     def _read_channel_current(self, channel: str) -> float:
         """Read current from specific DAQ channel"""
         if not self.daq_service:
@@ -2506,16 +3020,14 @@ class TestScenarioEngine(QObject):
                 return True
             
             # Get enabled channels, rail names, and measurement mode
-            enabled_channels = self._get_enabled_channels_from_monitor()
-            rail_names = self._get_channel_rail_names()
-            measurement_mode = getattr(self, '_monitoring_mode', 'current')
+            enabled_channels, rail_names, measurement_mode = self._resolve_export_schema()
             
             # Create column mapping from original names to Power rail names
             column_mapping = {}
             
             # Add timestamp columns
-            if 'timestamp' in self.daq_data[0]:
-                column_mapping['timestamp'] = 'Timestamp'
+            if 'timestamp' in self.daq_data[0] or 'timestamp_ns' in self.daq_data[0]:
+                column_mapping['timestamp'] = 'Timestamp'  # timestamp_ns is converted by _daq_dataframe
             if 'time_elapsed' in self.daq_data[0]:
                 column_mapping['time_elapsed'] = 'Time_Elapsed(s)'
             if 'screen_test_time' in self.daq_data[0]:
@@ -2541,7 +3053,7 @@ class TestScenarioEngine(QObject):
                     column_mapping[key] = key
             
             # Create DataFrame with original data
-            df = pd.DataFrame(self.daq_data)
+            df = self._daq_dataframe()
             
             # Rename columns using the mapping
             df = df.rename(columns=column_mapping)
@@ -2585,15 +3097,11 @@ class TestScenarioEngine(QObject):
     def _export_to_csv_fallback(self, filename: str) -> bool:
         """Export data to CSV as fallback with Power rail names"""
         try:
-            import csv
-            
             if not self.daq_data:
                 return True
             
             # Get enabled channels, rail names, and measurement mode
-            enabled_channels = self._get_enabled_channels_from_monitor()
-            rail_names = self._get_channel_rail_names()
-            measurement_mode = getattr(self, '_monitoring_mode', 'current')
+            enabled_channels, rail_names, measurement_mode = self._resolve_export_schema()
             
             # Create column mapping from original names to Power rail names
             column_mapping = {}
@@ -2601,6 +3109,8 @@ class TestScenarioEngine(QObject):
             # Add timestamp columns
             if 'timestamp' in self.daq_data[0]:
                 column_mapping['timestamp'] = 'Timestamp'
+            elif 'timestamp_ns' in self.daq_data[0]:
+                column_mapping['timestamp_ns'] = 'Timestamp'
             if 'time_elapsed' in self.daq_data[0]:
                 column_mapping['time_elapsed'] = 'Time_Elapsed(s)'
             if 'screen_test_time' in self.daq_data[0]:
@@ -2625,19 +3135,27 @@ class TestScenarioEngine(QObject):
                 if key not in column_mapping:
                     column_mapping[key] = key
             
+            # Source keys in output order; rows are written as plain lists (no per-row dict)
+            keys = list(column_mapping)
+            
             with open(filename, 'w', newline='') as csvfile:
-                # Use new column names as fieldnames
-                fieldnames = list(column_mapping.values())
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+                writer = csv.writer(csvfile)
+                writer.writerow(column_mapping.values())  # Power rail names as header
                 
-                # Write data with renamed columns
-                for row in self.daq_data:
-                    new_row = {}
-                    for original_key, new_key in column_mapping.items():
-                        if original_key in row:
-                            new_row[new_key] = row[original_key]
-                    writer.writerow(new_row)
+                if isinstance(self.daq_data, DAQBuffer):
+                    # Columnar: Python values per column (timestamps as datetimes), then rows by zip
+                    data = self.daq_data.to_dict()
+                    writer.writerows(zip(*(data[key].tolist() for key in keys)))
+                elif 'timestamp_ns' in column_mapping:
+                    ts_index = keys.index('timestamp_ns')
+                    fromtimestamp = datetime.fromtimestamp
+                    for row in self.daq_data:
+                        values = [row.get(key, '') for key in keys]
+                        if values[ts_index] != '':
+                            values[ts_index] = fromtimestamp(values[ts_index] / 1e9)
+                        writer.writerow(values)
+                else:
+                    writer.writerows([row.get(key, '') for key in keys] for row in self.daq_data)
             
             self.log_callback(f"CSV export completed with Power rail names: {list(rail_names.values())}", "info")
             return True
@@ -2659,6 +3177,45 @@ class TestScenarioEngine(QObject):
         """Get current test result"""
         return self.current_test
     
+    def export_to_excel(self, filename: str, compression: str = 'deflated', split: bool = False) -> Future:
+        """Export collected DAQ data to Excel on a background thread
+        
+        Returns a Future resolving to the export result (bool). Log messages go
+        through log_callback, which reaches the UI via the queued log_message
+        signal. Export before starting the next test, which resets daq_data.
+        
+        With split=True the DAQ data goes to '<base>_data.csv' and only the
+        summary is written as '<base>_summary.xlsx' (see _export_split).
+        """
+        if split:
+            future = self._export_pool.submit(self._export_split, filename)
+        else:
+            future = self._export_pool.submit(self._export_to_excel_basic, filename, compression)
+        future.add_done_callback(self._on_export_done)
+        return future
+    
+    def _on_export_done(self, future: Future):
+        """Flush batched export messages and report an export that raised"""
+        self.log_callback_flush()
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.log_callback(f"Excel export failed: {type(error).__name__}: {error}", "error")
+    
+    def _emit_progress(self, progress: int, status: str):
+        """Emit progress_updated, dropping repeats of the same value within 100 ms
+        
+        A changed value always goes out, so the final state is never lost; the
+        same value with a new status is re-sent at most every 100 ms.
+        """
+        now_ns = time.monotonic_ns()
+        if progress == self._last_progress and now_ns - self._last_progress_emit_ns < 100_000_000:
+            return
+        self._last_progress = progress
+        self._last_progress_emit_ns = now_ns
+        self._emit(self.progress_updated, progress, status)
+    
     def connect_progress_callback(self, callback: Callable[[int, str], None]):
         """Connect progress callback to signal"""
         if QT_AVAILABLE:
@@ -2667,6 +3224,7 @@ class TestScenarioEngine(QObject):
     def set_multi_channel_monitor(self, monitor):
         """Set multi-channel monitor reference"""
         self.multi_channel_monitor = monitor
+        self._export_schema = None
     
     def _update_progress_safe(self, step_name: str):
         """Update progress safely (no Qt signals from threads)"""
@@ -2678,7 +3236,7 @@ class TestScenarioEngine(QObject):
             # Only emit Qt signal if we're in main thread (safe)
             try:
                 if not threading.current_thread().daemon:
-                    self._emit_signal_safe(self.progress_updated, progress, step_name)
+                    self._emit_progress(progress, step_name)
             except Exception as e:
                 # Ignore Qt signal errors in threads
                 pass
@@ -2689,12 +3247,15 @@ class TestScenarioEngine(QObject):
         test_progress = max(0, min(100, test_progress))
         
         # Use log for detailed progress
-        self.log_callback(f"Test Progress: {test_progress}% - {status}", "info")
+        self._log("info", "Test Progress: %d%% - %s", test_progress, status)
         
-        # Emit Qt signal safely (only for pure test progress)
+        # Emit Qt signal safely (only for pure test progress), once per distinct percentage
+        if test_progress == self._last_emitted_pct:
+            return
+        self._last_emitted_pct = test_progress
         try:
             if not threading.current_thread().daemon:
-                self._emit_signal_safe(self.progress_updated, test_progress, f"Screen Test: {test_progress}%")
+                self._emit_progress(test_progress, _FMT_SCREEN_PCT(test_progress))
         except Exception as e:
             # Ignore Qt signal errors
             pass
@@ -2725,7 +3286,15 @@ class TestScenarioEngine(QObject):
                 # Before screen test, don't show progress or show preparation progress
                 progress = 0
             
-            self._emit_signal_safe(self.progress_updated, progress, step_name)
+            self._emit_progress(progress, step_name)
+    
+    @staticmethod
+    def _mean_per_channel(sample_lists) -> List[float]:
+        """Mean of each channel's samples (lists or arrays); one 2-D reduction when lengths match"""
+        try:
+            return np.asarray(sample_lists, dtype=np.float64).mean(axis=1).tolist()
+        except ValueError:  # ragged reads: fall back to per-channel means
+            return [float(np.mean(samples)) for samples in sample_lists]
     
     def _read_current_from_channel(self, channel: str, samples: int = 1000) -> float:
         """Read current from a specific DAQ channel with averaging
@@ -2766,10 +3335,9 @@ class TestScenarioEngine(QObject):
                         # Get all samples and calculate average
                         if 'current_data' in channel_data:
                             current_samples = channel_data['current_data']
-                            if current_samples:
+                            if len(current_samples) > 0:
                                 # Calculate average of all samples
-                                avg_current = sum(current_samples) / len(current_samples)
-                                return avg_current
+                                return float(np.mean(current_samples))
                         elif 'current' in channel_data:
                             return channel_data['current']
                 except Exception as e:
@@ -2795,6 +3363,8 @@ class TestScenarioEngine(QObject):
     
     def _get_enabled_channels_from_monitor(self) -> List[str]:
         """Get enabled channels from multi-channel monitor (ONLY enabled channels, no fallback)"""
+        if self._cached_channels is not None:
+            return list(self._cached_channels)  # Snapshot taken at run start
         if not self.multi_channel_monitor:
             self.log_callback("?? No multi-channel monitor available", "warn")
             return []
@@ -2818,6 +3388,8 @@ class TestScenarioEngine(QObject):
     
     def _get_channel_rail_names(self) -> Dict[str, str]:
         """Get rail names for enabled channels"""
+        if self._cached_rails is not None:
+            return dict(self._cached_rails)  # Snapshot taken at run start
         if not self.multi_channel_monitor:
             return {
                 'ai0': 'VDD_CORE', 'ai1': 'VDD_MEM', 'ai2': 'VDD_GPU',
@@ -2826,7 +3398,12 @@ class TestScenarioEngine(QObject):
         
         try:
             rail_names = {}
-            enabled_channels = self._get_enabled_channels_from_monitor()
+            if self._cached_channels is not None:
+                enabled_channels = self._cached_channels
+            else:
+                # Walk the configs directly (no per-channel log lines from _get_enabled_channels_from_monitor)
+                enabled_channels = [channel for channel, config in self.multi_channel_monitor.channel_configs.items()
+                                    if config.get('enabled', False)]
             
             for channel in enabled_channels:
                 if channel in self.multi_channel_monitor.channel_configs:
@@ -2870,8 +3447,28 @@ class TestScenarioEngine(QObject):
                 'ai3': 'VDD_NPU', 'ai4': 'VDD_CAM', 'ai5': 'VDD_DISP'
             }
     
+    def _resolve_export_schema(self) -> "ExportSchema":
+        """(enabled_channels, rail_names, measurement_mode) for exports, resolved once per run
+        
+        During a run the channel snapshot is fixed, so the schema is cached until the
+        monitor, the snapshot or _monitoring_mode changes. Outside a run the monitor
+        can be edited at any time and the schema is rebuilt per call. The containers
+        are read-only because every export shares them.
+        """
+        schema = self._export_schema
+        if schema is None:
+            schema = ExportSchema(
+                tuple(self._get_enabled_channels_from_monitor()),
+                MappingProxyType(self._get_channel_rail_names()),
+                getattr(self, '_monitoring_mode', 'current'))
+            if self._cached_channels is not None:
+                self._export_schema = schema
+        return schema
+    
     def _get_measurement_mode(self) -> str:
         """Get current measurement mode from multi-channel monitor"""
+        if self._cached_mode is not None:
+            return self._cached_mode  # Snapshot taken at run start
         if not self.multi_channel_monitor:
             return "current"  # Default to current mode
         
@@ -2907,11 +3504,11 @@ class TestScenarioEngine(QObject):
             summary_sheet.write('B3', self.current_test.scenario_name if self.current_test else 'Unknown')
             
             summary_sheet.write('A4', 'Start Time:', label_format)
-            summary_sheet.write('B4', self.current_test.start_time.strftime('%Y-%m-%d %H:%M:%S') if self.current_test else 'Unknown')
+            summary_sheet.write('B4', self.current_test.start_time.isoformat(sep=' ', timespec='seconds') if self.current_test else 'Unknown')
             
             summary_sheet.write('A5', 'End Time:', label_format)
             end_time = self.current_test.end_time if self.current_test and self.current_test.end_time else datetime.now()
-            summary_sheet.write('B5', end_time.strftime('%Y-%m-%d %H:%M:%S'))
+            summary_sheet.write('B5', end_time.isoformat(sep=' ', timespec='seconds'))
             
             summary_sheet.write('A6', 'Duration:', label_format)
             if self.current_test:
@@ -2928,9 +3525,7 @@ class TestScenarioEngine(QObject):
             summary_sheet.write('A10', 'Power Rail Statistics:', title_format)
             
             # Get enabled channels, rail names, and measurement mode
-            enabled_channels = self._get_enabled_channels_from_monitor()
-            rail_names = self._get_channel_rail_names()
-            measurement_mode = getattr(self, '_monitoring_mode', 'current')
+            enabled_channels, rail_names, measurement_mode = self._resolve_export_schema()
             
             row = 11
             for channel in enabled_channels:
@@ -2951,9 +3546,12 @@ class TestScenarioEngine(QObject):
                 
                 if self.daq_data and channel_key in self.daq_data[0]:
                     # Get all values for this channel
-                    values = [data.get(channel_key, 0) for data in self.daq_data if channel_key in data]
+                    if isinstance(self.daq_data, DAQBuffer):
+                        values = self.daq_data.column(channel_key)  # No per-row dicts
+                    else:
+                        values = [data.get(channel_key, 0) for data in self.daq_data if channel_key in data]
                     
-                    if values:
+                    if len(values):
                         # Calculate robust statistics with outlier removal and stabilization exclusion
                         stats = self._calculate_robust_statistics(
                             values,
@@ -3010,86 +3608,57 @@ class TestScenarioEngine(QObject):
         except Exception as e:
             self.log_callback(f"Error creating summary sheet: {e}", "error")
     
+    def _export_daq_csv(self, filename: str, daq_df) -> None:
+        """Write the DAQ DataFrame to CSV through a large buffered file in row chunks"""
+        # 1 MB buffer merges the many small row writes into large physical writes;
+        # chunksize keeps pandas' formatting memory constant for long captures
+        with open(filename, 'w', buffering=1 << 20, newline='', encoding='utf-8') as f:
+            daq_df.to_csv(
+                f,
+                index=False,
+                float_format='%.6f',  # Limit decimal places for smaller file
+                chunksize=50000,
+            )
+        _drop_page_cache(filename)
+    
     def _export_to_csv(self, filename: str) -> bool:
         """Export data to CSV file (optimized for large datasets)"""
         try:
-            import pandas as pd
-            import time as time_module
-
             if not self.daq_data:
                 self.log_callback("No data to export", "warn")
                 return True
+            if not PANDAS_AVAILABLE:
+                self.log_callback("pandas not available, using basic CSV export", "warn")
+                return self._export_to_csv_fallback(filename)
 
             # Get enabled channels, rail names, and measurement mode
-            enabled_channels = self._get_enabled_channels_from_monitor()
-            rail_names = self._get_channel_rail_names()
-            measurement_mode = getattr(self, '_monitoring_mode', 'current')
+            enabled_channels, rail_names, measurement_mode = self._resolve_export_schema()
 
-            self.log_callback(f"CSV export - Enabled channels: {enabled_channels}", "info")
-            self.log_callback(f"CSV export - Rail names: {rail_names}", "info")
+            self.log_callback(f"CSV export - Enabled channels: {list(enabled_channels)}", "info")
+            self.log_callback(f"CSV export - Rail names: {dict(rail_names)}", "info")
             self.log_callback(f"CSV export - Measurement mode: {measurement_mode}", "info")
             self.log_callback(f"CSV export - Data points: {len(self.daq_data)}", "info")
 
             # Start timing
-            start_time = time_module.time()
-
-            # OPTIMIZATION 1: Create DataFrame directly from list of dicts (no for loops!)
-            self.log_callback("Creating DataFrame from data (vectorized)...", "info")
-            df = pd.DataFrame(self.daq_data)
-
-            # OPTIMIZATION 2: Prepare column mapping for rename (batch operation)
-            column_mapping = {}
-            columns_to_keep = ['time_elapsed']  # Keep time column
-
-            # Build column mapping and identify columns to keep
-            for channel in enabled_channels:
-                if measurement_mode == "current":
-                    old_col = f"{channel}_current"
-                    rail_name = rail_names.get(channel, f"Rail_{channel}")
-                    new_col = f"{rail_name} (mA)"
-                    column_mapping[old_col] = new_col
-                    columns_to_keep.append(old_col)
-                else:
-                    old_col = f"{channel}_voltage"
-                    rail_name = rail_names.get(channel, f"Rail_{channel}")
-                    new_col = f"{rail_name} (V)"
-                    column_mapping[old_col] = new_col
-                    columns_to_keep.append(old_col)
-
-            # Select only needed columns
-            df = df[columns_to_keep]
-
-            # OPTIMIZATION 3: Rename columns in batch (vectorized)
-            df = df.rename(columns=column_mapping)
-
-            # OPTIMIZATION 4: Rename time column and convert to int (vectorized)
-            df = df.rename(columns={'time_elapsed': 'Time (ms)'})
-            df['Time (ms)'] = df['Time (ms)'].astype(int)
+            start_time = time.time()
 
-            # OPTIMIZATION 5: Move Time column to first position using insert
-            time_col = df.pop('Time (ms)')
-            df.insert(0, 'Time (ms)', time_col)
+            # Build the export-layout DataFrame straight from the sample columns
+            self.log_callback("Creating DataFrame from data (columnar)...", "info")
+            df = self._daq_export_frame(enabled_channels, rail_names, measurement_mode)
 
-            creation_time = time_module.time() - start_time
+            creation_time = time.time() - start_time
             self.log_callback(f"DataFrame created in {creation_time:.2f}s", "info")
 
-            # OPTIMIZATION 6: Export to CSV with optimal settings
+            # Export to CSV with optimal settings
             self.log_callback("Writing CSV file (optimized)...", "info")
-            write_start = time_module.time()
+            write_start = time.time()
 
-            # Use fast CSV writer with minimal overhead
-            df.to_csv(
-                filename,
-                index=False,
-                encoding='utf-8',  # Faster than utf-8-sig
-                float_format='%.6f',  # Limit decimal places for smaller file
-            )
+            self._export_daq_csv(filename, df)
 
-            write_time = time_module.time() - write_start
-            total_time = time_module.time() - start_time
+            write_time = time.time() - write_start
+            total_time = time.time() - start_time
 
             # Log summary info
-            import os
             file_size_mb = os.path.getsize(filename) / (1024 * 1024)
             self.log_callback(f"CSV export completed: {filename}", "info")
             self.log_callback(f"  - Data points: {len(self.daq_data)}", "info")
@@ -3103,72 +3672,380 @@ class TestScenarioEngine(QObject):
 
         except Exception as e:
             self.log_callback(f"Error exporting to CSV: {e}", "error")
-            import traceback
-            self.log_callback(f"CSV export traceback: {traceback.format_exc()}", "error")
+            self._log_traceback("CSV export traceback")
             return False
     
-    def _export_to_excel_basic(self, filename: str) -> bool:
-        """Export data to Excel with custom format (A1=Time, B1=Rail_Name, etc.)"""
+    def _daq_dataframe(self):
+        """DataFrame of the collected DAQ samples (columnar buffers are wrapped without copying)"""
+        if isinstance(self.daq_data, DAQBuffer):
+            return pd.DataFrame(self.daq_data.to_dict(), copy=False)
+        df = pd.DataFrame(self.daq_data)
+        if 'timestamp_ns' in df.columns:
+            # Integer wall-clock ns -> local datetimes in one vectorized conversion
+            utc_offset_ns = int(datetime.now().astimezone().utcoffset().total_seconds() * 1e9)
+            df.insert(0, 'timestamp', pd.to_datetime(df.pop('timestamp_ns') + utc_offset_ns, unit='ns'))
+        return df
+    
+    @staticmethod
+    def _export_header(enabled_channels: List[str], rail_names: Dict[str, str], measurement_mode: str) -> List[str]:
+        """CSV export header: Time (ms), then '<rail> (mA|V)' per channel"""
+        unit = "mA" if measurement_mode == "current" else "V"
+        return ['Time (ms)'] + [f"{rail_names.get(channel, f'Rail_{channel}')} ({unit})" for channel in enabled_channels]
+    
+    def _daq_export_frame(self, enabled_channels: List[str], rail_names: Dict[str, str], measurement_mode: str):
+        """Export-layout DataFrame (see _export_header) built column by column
+        
+        Columnar buffers hand their arrays over directly; row dicts are read one
+        column at a time with no intermediate full-width DataFrame.
+        """
+        suffix = "_current" if measurement_mode == "current" else "_voltage"
+        if isinstance(self.daq_data, DAQBuffer):
+            column = self.daq_data.column
+        else:
+            rows = self.daq_data
+            column = lambda key: np.fromiter((row[key] for row in rows), dtype=np.float64, count=len(rows))
+        header = self._export_header(enabled_channels, rail_names, measurement_mode)
+        frame = {header[0]: column('time_elapsed').astype(np.int64)}
+        for name, channel in zip(header[1:], enabled_channels):
+            frame[name] = column(f"{channel}{suffix}")
+        return pd.DataFrame(frame, copy=False)
+    
+    def _daq_as_ndarray(self, enabled_channels: List[str]):
+        """Convert DAQ samples to a structured NumPy array, once per export
+        
+        Fields: 'time_elapsed' (int64, ms) followed by '<channel>_current' (float64, mA).
+        """
+        keys = [f"{channel}_current" for channel in enabled_channels]
+        arr = np.empty(len(self.daq_data), dtype=[('time_elapsed', np.int64)] + [(key, np.float64) for key in keys])
+        if isinstance(self.daq_data, DAQBuffer):
+            # Already columnar: copy whole columns
+            for key in ('time_elapsed', *keys):
+                arr[key] = self.daq_data.column(key) if key in self.daq_data.columns else 0
+            return arr
+        arr['time_elapsed'] = [data_point.get('time_elapsed', 0) for data_point in self.daq_data]
+        for key in keys:
+            arr[key] = [data_point.get(key, 0.0) for data_point in self.daq_data]
+        return arr
+    
+    def _format_excel_columns(self, arr, enabled_channels: List[str], rail_names: Dict[str, str]) -> Dict[str, Any]:
+        """Map Test_Results headers (A1=Time, B1=Rail_Name, ...) to columns of the DAQ array"""
+        # Time in ms as INTEGER (0, 1, 2, 3, ...), then rail current in mA (already converted by DAQ)
+        formatted_data = {'Time (ms)': arr['time_elapsed']}
+        for channel in enabled_channels:
+            rail_name = rail_names.get(channel, f"Rail_{channel}")
+            formatted_data[f"{rail_name} (mA)"] = arr[f"{channel}_current"]
+        return formatted_data
+    
+    def _daq_columns(self):
+        """Yield (column name, ndarray) pairs in export layout: Time (ms), then one column per rail"""
+        enabled_channels, rail_names, _ = self._resolve_export_schema()
+        arr = self._daq_as_ndarray(enabled_channels)
+        yield from self._format_excel_columns(arr, enabled_channels, rail_names).items()
+    
+    def _export_parquet(self, filename: str) -> bool:
+        """Export DAQ data to Parquet (columnar, snappy-compressed) in one bulk write"""
+        if not self.daq_data:
+            self.log_callback("No data to export", "warn")
+            return True
+        if not PYARROW_AVAILABLE:
+            self.log_callback("pyarrow not available, cannot export Parquet", "error")
+            return False
+        
         try:
-            import pandas as pd
+            table = pa.Table.from_pydict(dict(self._daq_columns()))
+            pq.write_table(table, filename, compression='snappy')
+            _drop_page_cache(filename)
+            self.log_callback(f"Parquet export completed ({table.num_rows} rows): {filename}", "info")
+            return True
+        except (OSError, pa.ArrowException) as e:
+            self.log_callback(f"Error exporting to Parquet: {e}", "error")
+            return False
+    
+    def export(self, filename: str, fmt: str = 'xlsx') -> bool:
+        """Export collected DAQ data in the given format
+        
+        Args:
+            filename: Output path
+            fmt: 'xlsx' (Test_Results + Test_Summary), 'csv', 'split'
+                 (<base>_data.csv + <base>_summary.xlsx) or 'parquet' (needs pyarrow)
+        """
+        exporters = {
+            'xlsx': self._export_to_excel_basic,
+            'csv': self._export_to_csv,
+            'split': self._export_split,
+            'parquet': self._export_parquet,
+        }
+        if fmt not in exporters:
+            self.log_callback(f"Unknown export format: {fmt}", "error")
+            return False
+        result = exporters[fmt](filename)
+        self.log_callback_flush()
+        return result
+    
+    def _build_excel_summary(self, formatted_data: Dict[str, np.ndarray], enabled_channels: List[str],
+                             rail_names: Dict[str, str], measurement_mode: str) -> List[tuple]:
+        """Build Test_Summary rows as (metric, value) pairs"""
+        # Resolve test info once, with a single None-guard
+        ct = self.current_test
+        name = str(ct.scenario_name) if ct else 'Unknown'
+        start = ct.start_time.isoformat(sep=' ', timespec='seconds') if ct else 'Unknown'
+        npts = len(self.daq_data)
+        
+        summary_rows = list(zip(_SUMMARY_KEYS, (name, start, npts, npts)))
+        summary_rows.append(('', ''))  # Empty row separator
+        
+        # Add rail statistics with separation
+        for channel in enabled_channels:
+            rail_name = rail_names.get(channel, f"Rail_{channel}")
+            unit = "mA" if measurement_mode == "current" else "V"
+            
+            column_name = f"{rail_name} ({unit})"
+            if column_name not in formatted_data:
+                continue
+            # Numeric by construction (float64 field of _daq_as_ndarray): no per-value type filter
+            values = formatted_data[column_name]
+            if len(values) == 0:
+                continue
+            
+            # Calculate robust statistics with outlier removal and stabilization exclusion
+            stats = self._calculate_robust_statistics(
+                values,
+                exclude_stabilization=True,
+                stabilization_seconds=1.0,  # Exclude first 1 second
+                remove_outliers=True,
+                outlier_method='iqr'
+            )
             
-            if not self.daq_data:
-                self.log_callback("No data to export", "warn")
-                return True
+            summary_rows.extend((
+                (f'[{rail_name}]', ''),  # Rail header
+                (f'  Average (filtered) ({unit})', float(f'{stats["avg"]:.6f}')),
+                (f'  Median ({unit})', float(f'{stats["median"]:.6f}')),
+                (f'  Minimum ({unit})', float(f'{stats["min"]:.6f}')),
+                (f'  Maximum ({unit})', float(f'{stats["max"]:.6f}')),
+                (f'  Range ({unit})', float(f'{stats["max"] - stats["min"]:.6f}')),
+                (f'  Std Dev ({unit})', float(f'{stats["std"]:.6f}')),
+                ('  Samples (filtered/total)', f"{stats['filtered_count']}/{stats['count']}"),
+                ('', ''),  # Separator between rails
+            ))
+        
+        return summary_rows
+    
+    def _open_xlsx_workbook(self, filename: str, n_rows: int):
+        """Open an xlsxwriter Workbook, buffering in memory only when the sheet is small"""
+        big = n_rows > _XLSX_IN_MEMORY_MAX_ROWS
+        options = {'in_memory': not big}
+        if big and self.export_tmpdir:
+            options['tmpdir'] = self.export_tmpdir
+        workbook = xlsxwriter.Workbook(filename, options)
+        if big:
+            workbook.use_zip64()
+        return workbook
+    
+    def _write_summary_sheet(self, workbook, summary_rows: List[tuple]):
+        """Write Test_Summary rows directly to an xlsxwriter workbook"""
+        # No DataFrame / ExcelFormatter round-trip for a few dozen rows
+        summary_sheet = workbook.add_worksheet('Test_Summary')
+        summary_sheet.write_row(0, 0, ('Metric', 'Value'), workbook.add_format({'bold': True}))
+        for r, (metric, value) in enumerate(summary_rows, start=1):
+            summary_sheet.write(r, 0, metric)
+            if isinstance(value, float) and not math.isfinite(value):
+                continue  # Blank cell for NaN/inf, as df.to_excel wrote it
+            summary_sheet.write(r, 1, value)
+        
+        # Format summary sheet
+        summary_sheet.set_column('A:A', 35)
+        
+        # Format Value column with proper number format
+        num_format = workbook.add_format({'num_format': '0.000000'})
+        summary_sheet.set_column('B:B', 20, num_format)
+    
+    def _write_summary_xlsx(self, filename: str) -> bool:
+        """Write only the Test_Summary sheet to its own .xlsx file"""
+        enabled_channels, rail_names, measurement_mode = self._resolve_export_schema()
+        
+        arr = self._daq_as_ndarray(enabled_channels)
+        formatted_data = self._format_excel_columns(arr, enabled_channels, rail_names)
+        summary_rows = self._build_excel_summary(formatted_data, enabled_channels, rail_names, measurement_mode)
+        
+        with self._open_xlsx_workbook(filename, len(summary_rows)) as workbook:
+            self._write_summary_sheet(workbook, summary_rows)
+        return True
+    
+    def _export_split(self, filename: str) -> bool:
+        """Export Test_Summary to '<base>_summary.xlsx' and DAQ data to '<base>_data.csv' in parallel
+        
+        The summary is tiny and the DAQ dump is large, so writing them as two
+        independent files on two threads costs roughly the DAQ write alone.
+        """
+        if not self.daq_data:
+            self.log_callback("No data to export", "warn")
+            return True
+        
+        base = os.path.splitext(filename)[0]
+        try:
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="SplitExport") as pool:
+                futures = {base + '_data.csv': pool.submit(self._export_to_csv, base + '_data.csv')}
+                if XLSXWRITER_AVAILABLE:
+                    futures[base + '_summary.xlsx'] = pool.submit(self._write_summary_xlsx, base + '_summary.xlsx')
+                else:
+                    self.log_callback("xlsxwriter not available, skipping summary workbook", "warn")
+                results = {path: future.result() for path, future in futures.items()}
             
+            written = [path for path, ok in results.items() if ok]
+            if all(results.values()):
+                self.log_callback(f"Split export completed: {' + '.join(written)}", "info")
+                return True
+            failed = [path for path, ok in results.items() if not ok]
+            self.log_callback(f"Split export failed for {', '.join(failed)}"
+                              + (f" (written: {', '.join(written)})" if written else ""), "error")
+            return False
+        except _EXCEL_EXPORT_ERRORS as e:
+            self.log_callback(f"Error in split export: {e}", "error")
+            return False
+    
+    def _export_fast_xlsx(self, filename: str, compression: str = 'deflated') -> bool:
+        """Export data to Excel by writing the worksheet XML straight into the zip container
+        
+        Used for large captures: avoids the per-cell object creation and style
+        handling of pandas/xlsxwriter. Produces the same Test_Results + Test_Summary
+        layout as _export_to_excel_basic (without column formatting).
+        
+        Args:
+            filename: Output .xlsx path
+            compression: 'deflated' (smaller file) or 'stored' (no deflate, less CPU)
+        """
+        csv_filename = os.path.splitext(filename)[0] + '.csv'
+        try:
+            enabled_channels, rail_names, measurement_mode = self._resolve_export_schema()
+            
+            arr = self._daq_as_ndarray(enabled_channels)
+            formatted_data = self._format_excel_columns(arr, enabled_channels, rail_names)
+            summary_rows = self._build_excel_summary(formatted_data, enabled_channels, rail_names, measurement_mode)
+            
+            headers = list(formatted_data.keys())
+            columns = _XLSX_COLUMNS[:len(headers)]
+            
+            # One row template per sheet: '<row r="{0}"><c r="A{0}"><v>{1:d}</v></c>...</row>'
+            # Time stays an exact integer; rail values carry 6 significant digits
+            # (DAQ precision), which keeps the XML and zip payload small
+            row_template = '<row r="{0}">' + ''.join(
+                f'<c r="{col}{{0}}"><v>{{{i + 1}:{"d" if i == 0 else ".6g"}}}</v></c>'
+                for i, col in enumerate(columns)
+            ) + '</row>'
+            header_row = '<row r="1">' + ''.join(
+                _xlsx_cell(f'{col}1', name) for col, name in zip(columns, headers)
+            ) + '</row>'
+            
+            with zipfile.ZipFile(filename, 'w', _XLSX_COMPRESSION[compression]) as zf:
+                for part_name, content in _XLSX_SKELETON.items():
+                    zf.writestr(part_name, content)
+                
+                # Stream Test_Results rows in chunks (constant memory per chunk)
+                with zf.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+                    sheet.write(_XLSX_SHEET_HEAD)
+                    sheet.write(header_row.encode('utf-8'))
+                    
+                    # Chunks are copied into one preallocated buffer and handed to the
+                    # zip stream as memoryview slices, so zlib sees few large writes
+                    buf = bytearray(_FAST_XLSX_BUFFER_BYTES)
+                    view = memoryview(buf)
+                    pos = 0
+                    fmt = row_template.format
+                    value_fields = arr.dtype.names[1:]
+                    for start in range(0, len(arr), _FAST_XLSX_CHUNK_ROWS):
+                        chunk = arr[start:start + _FAST_XLSX_CHUNK_ROWS]
+                        non_finite = np.zeros(len(chunk), dtype=bool)
+                        for field in value_fields:
+                            non_finite |= ~np.isfinite(chunk[field])
+                        # tolist() converts a chunk to Python scalars in one C pass
+                        rows = chunk.tolist()
+                        if non_finite.any():
+                            # Rare: rows holding NaN/inf drop those cells instead of writing <v>nan</v>
+                            data = ''.join(
+                                _xlsx_sparse_row(row_num, row, columns) if bad else fmt(row_num, *row)
+                                for row_num, row, bad in zip(range(start + 2, start + 2 + len(rows)), rows,
+                                                             non_finite.tolist())
+                            ).encode('utf-8')
+                        else:
+                            data = ''.join(
+                                fmt(row_num, *row) for row_num, row in enumerate(rows, start=start + 2)
+                            ).encode('utf-8')
+                        if pos + len(data) > len(buf):
+                            sheet.write(view[:pos])
+                            pos = 0
+                        if len(data) > len(buf):
+                            sheet.write(data)
+                            continue
+                        view[pos:pos + len(data)] = data
+                        pos += len(data)
+                    sheet.write(view[:pos])
+                    view.release()
+                    
+                    sheet.write(_XLSX_SHEET_TAIL)
+                
+                # Test_Summary is small; build it in one go
+                summary_rows = [
+                    f'<row r="{row_num}">{_xlsx_cell(f"A{row_num}", metric)}{_xlsx_cell(f"B{row_num}", value)}</row>'
+                    for row_num, (metric, value) in enumerate(
+                        [('Metric', 'Value')] + summary_rows, start=1)
+                ]
+                zf.writestr('xl/worksheets/sheet2.xml',
+                            _XLSX_SHEET_HEAD + ''.join(summary_rows).encode('utf-8') + _XLSX_SHEET_TAIL)
+            _drop_page_cache(filename)
+            
+            self._log_batched.put((f"Excel export completed (fast path, {len(self.daq_data)} rows): {filename}", "info"))
+            return True
+        except _EXCEL_EXPORT_ERRORS as e:
+            self._log_batched.put((f"Error exporting to Excel (fast path): {e}", "error"))
+            return self._export_to_csv_fallback(csv_filename)
+    
+    def _export_to_excel_basic(self, filename: str, compression: str = 'deflated') -> bool:
+        """Export data to Excel with custom format (A1=Time, B1=Rail_Name, etc.)
+        
+        compression applies to large captures written by _export_fast_xlsx.
+        """
+        csv_filename = os.path.splitext(filename)[0] + '.csv'
+        if not self.daq_data:
+            self._log_batched.put(("No data to export", "warn"))
+            return True
+        
+        # Large captures use the raw XML writer, which needs no Excel engine
+        if len(self.daq_data) >= _FAST_XLSX_MIN_ROWS:
+            return self._export_fast_xlsx(filename, compression)
+        
+        if not XLSXWRITER_AVAILABLE:
+            self._log_batched.put(("xlsxwriter not available, exporting CSV instead", "warn"))
+            return self._export_to_csv_fallback(csv_filename)
+        
+        try:
             # Get enabled channels, rail names, and measurement mode
-            enabled_channels = self._get_enabled_channels_from_monitor()
-            rail_names = self._get_channel_rail_names()
-            measurement_mode = getattr(self, '_monitoring_mode', 'current')
-            
-            self.log_callback(f"Excel export debug - Enabled channels: {enabled_channels}", "info")
-            self.log_callback(f"Excel export debug - Rail names: {rail_names}", "info")
-            self.log_callback(f"Excel export debug - Measurement mode: {measurement_mode}", "info")
-            self.log_callback(f"Creating Excel with format: A1=Time, B1={rail_names} ({measurement_mode} mode)", "info")
-            
-            # Create custom formatted data
-            formatted_data = {}
+            enabled_channels, rail_names, measurement_mode = self._resolve_export_schema()
             
-            # First column: Time in ms as INTEGER (0, 1, 2, 3, ...)
-            formatted_data['Time (ms)'] = []
-            for data_point in self.daq_data:
-                # Use time_elapsed which is already in ms (integer)
-                time_ms = data_point.get('time_elapsed', 0)
-                formatted_data['Time (ms)'].append(int(time_ms))  # Store as integer ms
+            self._log_batched.put((f"Excel export debug - Enabled channels: {list(enabled_channels)}", "info"))
+            self._log_batched.put((f"Excel export debug - Rail names: {dict(rail_names)}", "info"))
+            self._log_batched.put((f"Excel export debug - Measurement mode: {measurement_mode}", "info"))
+            self._log_batched.put((f"Creating Excel with format: A1=Time, B1={dict(rail_names)} ({measurement_mode} mode)", "info"))
             
-            # Additional columns: Rail data (current in mA)
-            for channel in enabled_channels:
-                rail_name = rail_names.get(channel, f"Rail_{channel}")
-                
-                # Output as Current (mA) - converted from shunt voltage
-                column_name = f"{rail_name} (mA)"  # Current in milliAmperes
-                data_key = f"{channel}_current"
-                
-                formatted_data[column_name] = []
-                
-                for data_point in self.daq_data:
-                    value = data_point.get(data_key, 0.0)
-                    # Value is already in mA from DAQ conversion
-                    formatted_data[column_name].append(value)
-            
-            # Create DataFrame with custom format
-            df = pd.DataFrame(formatted_data)
-            
-            # Export to Excel with xlsxwriter (includes Summary sheet)
-            if not XLSXWRITER_AVAILABLE:
-                self.log_callback("xlsxwriter not available, using simple export", "warn")
-                df.to_excel(filename, sheet_name='Test_Results', index=False, engine='openpyxl')
-                self.log_callback(f"Excel export completed (simple): {filename}", "info")
-                return True
+            # Convert DAQ samples to columns once (structured array)
+            arr = self._daq_as_ndarray(enabled_channels)
+            formatted_data = self._format_excel_columns(arr, enabled_channels, rail_names)
             
             # Use xlsxwriter for proper formatting and Summary sheet
-            with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
-                # Write main data
-                df.to_excel(writer, sheet_name='Test_Results', index=False)
-                
-                # Get workbook and worksheet for formatting
-                workbook = writer.book
-                worksheet = writer.sheets['Test_Results']
+            with self._open_xlsx_workbook(filename, len(arr)) as workbook:
+                # Write main data row by row from the array (no per-cell pandas formatting)
+                worksheet = workbook.add_worksheet('Test_Results')
+                worksheet.write_row(0, 0, list(formatted_data.keys()), workbook.add_format({'bold': True}))
+                non_finite = np.zeros(len(arr), dtype=bool)
+                for field in arr.dtype.names[1:]:
+                    non_finite |= ~np.isfinite(arr[field])
+                for r, (row, bad) in enumerate(zip(arr.tolist(), non_finite.tolist()), start=1):
+                    if not bad:
+                        worksheet.write_row(r, 0, row)
+                        continue
+                    # write_number() rejects NaN/inf: leave those cells blank, as df.to_excel did
+                    for c, value in enumerate(row):
+                        if c == 0 or math.isfinite(value):
+                            worksheet.write_number(r, c, value)
                 
                 # Format columns
                 time_format = workbook.add_format({'num_format': '0.0'})
@@ -3178,94 +4055,16 @@ class TestScenarioEngine(QObject):
                 worksheet.set_column('B:Z', 15, value_format)  # Value columns
                 
                 # Create Summary sheet with simple data (no complex structures)
-                summary_data = {
-                    'Metric': [
-                        'Test Name',
-                        'Start Time', 
-                        'Data Points',
-                        'Duration (s)',
-                        ''  # Empty row separator
-                    ],
-                    'Value': [
-                        str(self.current_test.scenario_name) if self.current_test else 'Unknown',
-                        str(self.current_test.start_time.strftime('%Y-%m-%d %H:%M:%S')) if self.current_test else 'Unknown',
-                        int(len(self.daq_data)),
-                        int(len(self.daq_data)),
-                        ''  # Empty row separator
-                    ]
-                }
-                
-                # Add rail statistics with separation
-                for i, channel in enumerate(enabled_channels):
-                    rail_name = rail_names.get(channel, f"Rail_{channel}")
-                    
-                    if measurement_mode == "current":
-                        channel_key = f'{channel}_current'
-                        unit = "mA"  # Changed to milliAmperes
-                    else:
-                        channel_key = f'{channel}_voltage'
-                        unit = "V"
-                    
-                    column_name = f"{rail_name} ({unit})"
-                    if column_name in formatted_data:
-                        values = [v for v in formatted_data[column_name] if isinstance(v, (int, float))]
-                        
-                        if values:
-                            # Calculate robust statistics with outlier removal and stabilization exclusion
-                            stats = self._calculate_robust_statistics(
-                                values,
-                                exclude_stabilization=True,
-                                stabilization_seconds=1.0,  # Exclude first 1 second
-                                remove_outliers=True,
-                                outlier_method='iqr'
-                            )
-                            
-                            # Add rail header
-                            summary_data['Metric'].append(f'[{rail_name}]')
-                            summary_data['Value'].append('')
-                            
-                            # Add statistics
-                            summary_data['Metric'].extend([
-                                f'  Average (filtered) ({unit})',
-                                f'  Median ({unit})',
-                                f'  Minimum ({unit})',
-                                f'  Maximum ({unit})',
-                                f'  Range ({unit})',
-                                f'  Std Dev ({unit})',
-                                f'  Samples (filtered/total)'
-                            ])
-                            summary_data['Value'].extend([
-                                float(f'{stats["avg"]:.6f}'),
-                                float(f'{stats["median"]:.6f}'),
-                                float(f'{stats["min"]:.6f}'),
-                                float(f'{stats["max"]:.6f}'),
-                                float(f'{stats["max"] - stats["min"]:.6f}'),
-                                float(f'{stats["std"]:.6f}'),
-                                f"{stats['filtered_count']}/{stats['count']}"
-                            ])
-                            
-                            # Add separator between rails
-                            summary_data['Metric'].append('')
-                            summary_data['Value'].append('')
-                
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='Test_Summary', index=False)
-                
-                # Format summary sheet
-                summary_sheet = writer.sheets['Test_Summary']
-                summary_sheet.set_column('A:A', 35)
-                
-                # Format Value column with proper number format
-                num_format = workbook.add_format({'num_format': '0.000000'})
-                summary_sheet.set_column('B:B', 20, num_format)
+                summary_rows = self._build_excel_summary(formatted_data, enabled_channels, rail_names, measurement_mode)
+                self._write_summary_sheet(workbook, summary_rows)
+            _drop_page_cache(filename)
             
-            self.log_callback(f"Excel export completed with Summary: {filename}", "info")
-            self.log_callback(f"Excel structure: Test_Results + Test_Summary sheets", "info")
+            self._log_batched.put((f"Excel export completed with Summary: {filename}", "info"))
+            self._log_batched.put((f"Excel structure: Test_Results + Test_Summary sheets", "info"))
             return True
-        except Exception as e:
-            self.log_callback(f"Error exporting to Excel (basic): {e}", "error")
+        except _EXCEL_EXPORT_ERRORS as e:
+            self._log_batched.put((f"Error exporting to Excel (basic): {e}", "error"))
             # Fallback to CSV if Excel fails
-            csv_filename = filename.replace('.xlsx', '.csv')
             return self._export_to_csv_fallback(csv_filename)
     
     def _step_connect_wifi_2g(self) -> bool:
@@ -3361,8 +4160,7 @@ class TestScenarioEngine(QObject):
                         return False
                 except Exception as daq_error:
                     self.log_callback(f"Error calling _step_start_daq_monitoring: {daq_error}", "error")
-                    import traceback
-                    self.log_callback(f"DAQ start traceback: {traceback.format_exc()}", "error")
+                    self._log_traceback("DAQ start traceback")
                     return False
             else:
                 self.log_callback("? _step_start_daq_monitoring method does not exist", "error")
@@ -3373,16 +4171,12 @@ class TestScenarioEngine(QObject):
                 return False
             
             # Initialize screen test timing for DAQ data collection
-            test_start_time = time.time()
+            test_start_time = time.monotonic()
             self._screen_test_start_time = test_start_time
             
             # Signal DAQ monitoring that test has started
-            if hasattr(self, '_screen_test_started'):
-                self._screen_test_started.set()
-                self.log_callback("? Phone app test start signal sent to DAQ monitoring", "info")
-            else:
-                self.log_callback("?? Warning: _screen_test_started event not found", "warn")
-            
+            self._screen_test_started = True
+            self.log_callback("? Phone app test start signal sent to DAQ monitoring", "info")
             # Execute Phone app test sequence
             self.log_callback("=== Phone App Test Sequence Started ===", "info")
             
@@ -3457,16 +4251,12 @@ class TestScenarioEngine(QObject):
                 return False
             
             # Initialize screen test timing for DAQ data collection
-            test_start_time = time.time()
+            test_start_time = time.monotonic()
             self._screen_test_start_time = test_start_time
             
             # Signal DAQ monitoring that test has started
-            if hasattr(self, '_screen_test_started'):
-                self._screen_test_started.set()
-                self.log_callback("? Phone app test start signal sent to DAQ monitoring", "info")
-            else:
-                self.log_callback("?? Warning: _screen_test_started event not found", "warn")
-            
+            self._screen_test_started = True
+            self.log_callback("? Phone app test start signal sent to DAQ monitoring", "info")
             # Execute Phone app test sequence
             self.log_callback("=== Phone App Test Sequence Started ===", "info")
             
@@ -3590,16 +4380,12 @@ class TestScenarioEngine(QObject):
                 return False
             
             # Initialize screen test timing for DAQ data collection
-            test_start_time = time.time()
+            test_start_time = time.monotonic()
             self._screen_test_start_time = test_start_time
             
             # Signal DAQ monitoring that test has started
-            if hasattr(self, '_screen_test_started'):
-                self._screen_test_started.set()
-                self.log_callback("? Phone app test start signal sent to DAQ monitoring", "info")
-            else:
-                self.log_callback("?? Warning: _screen_test_started event not found", "warn")
-            
+            self._screen_test_started = True
+            self.log_callback("? Phone app test start signal sent to DAQ monitoring", "info")
             # 8. Phone App Test (10 seconds)
             self.log_callback("=== Step 8: Phone App Test Started (10s) ===", "info")
             
@@ -3837,16 +4623,12 @@ class TestScenarioEngine(QObject):
                 return False
             
             # Initialize screen test timing for DAQ data collection
-            test_start_time = time.time()
+            test_start_time = time.monotonic()
             self._screen_test_start_time = test_start_time
             
             # Signal DAQ monitoring that test has started
-            if hasattr(self, '_screen_test_started'):
-                self._screen_test_started.set()
-                self.log_callback("✅ Screen test start signal sent to DAQ monitoring", "info")
-            else:
-                self.log_callback("⚠️ Warning: _screen_test_started event not found", "warn")
-            
+            self._screen_test_started = True
+            self.log_callback("✅ Screen test start signal sent to DAQ monitoring", "info")
             # 테스트 시작 - 3초 간격으로 hold key를 눌러 LCD ON/OFF 토글
             # 0.5s: ON -> 3s: hold key (toggle) -> 6s: hold key (toggle) -> ... -> 27s: hold key (toggle) -> 30s: 종료
             # 총 hold key 10회
@@ -3854,7 +4636,7 @@ class TestScenarioEngine(QObject):
             test_duration = 30.0  # 30초
             toggle_times = [0.5, 3, 6, 9, 12, 15, 18, 21, 24, 27]  # Exact toggle times (0.5s for DAQ sync)
 
-            start_time = time.time()
+            start_time = time.monotonic()
 
             # Wait 0.5s before first action to allow DAQ to stabilize
             self.log_callback("Waiting 0.5s for DAQ to stabilize before first action...", "info")
@@ -3868,19 +4650,13 @@ class TestScenarioEngine(QObject):
                     self.log_callback("Screen On/Off test stopped by user request", "warn")
                     return False
 
-                # Wait until exact toggle time
-                while True:
-                    elapsed = time.time() - start_time
-                    if elapsed >= toggle_time:
-                        break
-                    remaining = toggle_time - elapsed
-                    if remaining > 0.1:
-                        time.sleep(remaining - 0.05)
-                    else:
-                        time.sleep(0.01)
+                # Wait until exact toggle time (wakes immediately on stop)
+                if self._stop_evt.wait(max(0.0, toggle_time - (time.monotonic() - start_time))):
+                    self.log_callback("Screen On/Off test stopped by user request", "warn")
+                    return False
 
                 action_count += 1
-                actual_elapsed = time.time() - start_time
+                actual_elapsed = time.monotonic() - start_time
 
                 if screen_on:
                     self.log_callback(f"{toggle_time}s (actual: {actual_elapsed:.1f}s): Action {action_count}/10 - Turning LCD ON", "info")
@@ -3897,15 +4673,16 @@ class TestScenarioEngine(QObject):
                 screen_on = not screen_on
 
             # Wait until test_duration is reached
-            while time.time() - start_time < test_duration:
-                time.sleep(0.1)
+            if self._stop_evt.wait(max(0.0, test_duration - (time.monotonic() - start_time))):
+                self.log_callback("Screen On/Off test stopped by user request", "warn")
+                return False
 
             # 30초: 테스트 끝
-            total_elapsed = time.time() - start_time
+            total_elapsed = time.monotonic() - start_time
             self.log_callback(f"30s: Screen On/Off test completed (actual: {total_elapsed:.1f}s)", "info")
             
             # Log data collection status
-            data_count = len(self.daq_data) if hasattr(self, 'daq_data') and self.daq_data else 0
+            data_count = len(self.daq_data)
             self.log_callback(f"✅ Screen On/Off test completed. Collected {data_count} data points", "info")
 
             if data_count >= 30000:
@@ -3918,7 +4695,6 @@ class TestScenarioEngine(QObject):
             
         except Exception as e:
             self.log_callback(f"Error executing Screen On/Off test: {e}", "error")
-            import traceback
             traceback.print_exc()
             return False
     
@@ -3942,7 +4718,6 @@ class TestScenarioEngine(QObject):
             
         except Exception as e:
             self.log_callback(f"Error turning LCD off: {e}", "error")
-            import traceback
             traceback.print_exc()
             return False
     
@@ -3956,16 +4731,12 @@ class TestScenarioEngine(QObject):
                 return False
             
             # Initialize screen test timing for DAQ data collection
-            test_start_time = time.time()
+            test_start_time = time.monotonic()
             self._screen_test_start_time = test_start_time
             
             # Signal DAQ monitoring that test has started
-            if hasattr(self, '_screen_test_started'):
-                self._screen_test_started.set()
-                self.log_callback("? Phone app test start signal sent to DAQ monitoring", "info")
-            else:
-                self.log_callback("?? Warning: _screen_test_started event not found", "warn")
-            
+            self._screen_test_started = True
+            self.log_callback("? Phone app test start signal sent to DAQ monitoring", "info")
             # Phone App Scenario Test (10 seconds)
             # Uses real-time based timing to ensure accurate sync with DAQ collection
             self.log_callback("[Phone App Scenario] Starting 10-second test", "info")
@@ -3973,34 +4744,36 @@ class TestScenarioEngine(QObject):
             test_duration = 10.0  # 10 seconds total
             action_times = [0.5, 5.0]  # Exact action times (0.5s for DAQ sync, 5s for back key)
 
-            start_time = time.time()
+            start_time = time.monotonic()
 
             # Wait 0.5s before first action to allow DAQ to stabilize
             self.log_callback("Waiting 0.5s for DAQ to stabilize before first action...", "info")
             time.sleep(0.5)
 
             # 0.5s: Phone app 열기
-            actual_elapsed = time.time() - start_time
+            actual_elapsed = time.monotonic() - start_time
             self.log_callback(f"0.5s (actual: {actual_elapsed:.1f}s): Click Phone app", "info")
             if not self.adb_service.open_phone_app():
                 self.log_callback("Failed to open Phone app", "error")
 
             # Wait until 5s
-            while time.time() - start_time < 5.0:
-                time.sleep(0.1)
+            if self._stop_evt.wait(max(0.0, 5.0 - (time.monotonic() - start_time))):
+                self.log_callback("Phone app test stopped by user request", "warn")
+                return False
 
             # 5s: Back key 누르기
-            actual_elapsed = time.time() - start_time
+            actual_elapsed = time.monotonic() - start_time
             self.log_callback(f"5s (actual: {actual_elapsed:.1f}s): Click back key", "info")
             if not self.adb_service.press_back_key():
                 self.log_callback("Failed to press back key", "error")
 
             # Wait until 10s
-            while time.time() - start_time < test_duration:
-                time.sleep(0.1)
+            if self._stop_evt.wait(max(0.0, test_duration - (time.monotonic() - start_time))):
+                self.log_callback("Phone app test stopped by user request", "warn")
+                return False
 
             # 10s: Test end
-            total_elapsed = time.time() - start_time
+            total_elapsed = time.monotonic() - start_time
             self.log_callback(f"10s: Test end (actual: {total_elapsed:.1f}s)", "info")
             
             self.log_callback("=== Phone App Scenario Test Completed ===", "info")
@@ -4023,8 +4796,6 @@ class TestScenarioEngine(QObject):
             
             # Use WiFi config from test_scenarios/configs/wifi_config.py
             try:
-                import sys
-                import os
                 # Add project root to path if not already there
                 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
                 if project_root not in sys.path:
@@ -4097,8 +4868,6 @@ class TestScenarioEngine(QObject):
 
             # Use WiFi config from test_scenarios/configs/wifi_config.py
             try:
-                import sys
-                import os
                 # Add project root to path if not already there
                 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
                 if project_root not in sys.path:
@@ -4168,10 +4937,9 @@ class TestScenarioEngine(QObject):
             self.log_callback("=== Waiting 15 minutes for WiFi test (900 seconds) ===", "info")
 
             # Signal DAQ monitoring to start immediately (WiFi test doesn't need screen sync)
-            if hasattr(self, '_screen_test_started'):
-                self._screen_test_started.set()
-                self._screen_test_start_time = time.time()
-                self.log_callback("DAQ monitoring signaled to start", "info")
+            self._screen_test_started = True
+            self._screen_test_start_time = time.monotonic()
+            self.log_callback("DAQ monitoring signaled to start", "info")
 
             # Brief pause to ensure DAQ starts collecting
             time.sleep(0.5)
@@ -4181,11 +4949,6 @@ class TestScenarioEngine(QObject):
             update_interval = 60  # 60초(1분)마다 업데이트
 
             for i in range(total_seconds):
-                # Check for stop request
-                if self.stop_requested:
-                    self.log_callback("Stop requested during 15-minute wait", "warn")
-                    return False
-
                 if (i + 1) % update_interval == 0 or i == 0:
                     progress = int((i + 1) / total_seconds * 100)
                     minutes = (i + 1) // 60
@@ -4194,7 +4957,10 @@ class TestScenarioEngine(QObject):
                         f"WiFi test progress: {i+1}/{total_seconds} seconds ({progress}%) - {minutes}m {seconds}s",
                         "info"
                     )
-                time.sleep(1)
+                # Check for stop request while waiting
+                if self._stop_evt.wait(1):
+                    self.log_callback("Stop requested during 15-minute wait", "warn")
+                    return False
 
             self.log_callback("✅ 15-minute WiFi test completed", "info")
             return True
@@ -4314,16 +5080,12 @@ class TestScenarioEngine(QObject):
                 return False
             
             # Initialize test timing for DAQ data collection
-            test_start_time = time.time()
+            test_start_time = time.monotonic()
             self._screen_test_start_time = test_start_time
             
             # Signal DAQ monitoring that test has started
-            if hasattr(self, '_screen_test_started'):
-                self._screen_test_started.set()
-                self.log_callback("? Phone app test start signal sent to DAQ monitoring", "info")
-            else:
-                self.log_callback("?? Warning: _screen_test_started event not found", "warn")
-            
+            self._screen_test_started = True
+            self.log_callback("? Phone app test start signal sent to DAQ monitoring", "info")
             # 0?: Phone app ??
             self.log_callback("0s: Clicking Phone app", "info")
             # Open phone app using intent
@@ -4339,12 +5101,11 @@ class TestScenarioEngine(QObject):
             self.log_callback("Waiting in Phone app until 5s...", "info")
             elapsed = 0
             while elapsed < 5.0:
-                if self.stop_requested:
+                if self._stop_evt.wait(0.5):
                     self.log_callback("Stop requested during Phone app test", "warn")
                     return False
                 
-                time.sleep(0.5)
-                elapsed = time.time() - test_start_time
+                elapsed = time.monotonic() - test_start_time
                 progress = int((elapsed / 10.0) * 100)
                 self.log_callback(f"Phone app test progress: {elapsed:.1f}s/10s ({progress}%)", "info")
             
@@ -4358,12 +5119,11 @@ class TestScenarioEngine(QObject):
             # Wait until 10 seconds (test end)
             self.log_callback("Waiting until 10s (test end)...", "info")
             while elapsed < 10.0:
-                if self.stop_requested:
+                if self._stop_evt.wait(0.5):
                     self.log_callback("Stop requested during Phone app test", "warn")
                     return False
                 
-                time.sleep(0.5)
-                elapsed = time.time() - test_start_time
+                elapsed = time.monotonic() - test_start_time
                 progress = int((elapsed / 10.0) * 100)
                 self.log_callback(f"Phone app test progress: {elapsed:.1f}s/10s ({progress}%)", "info")
             
@@ -4371,7 +5131,7 @@ class TestScenarioEngine(QObject):
             self.log_callback("10s: Phone app test completed", "info")
             
             # Record test completion time
-            test_end_time = time.time()
+            test_end_time = time.monotonic()
             actual_duration = test_end_time - test_start_time
             self.log_callback(f"Phone app scenario completed in {actual_duration:.1f} seconds", "info")
             
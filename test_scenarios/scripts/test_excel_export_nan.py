@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Regression test: Excel export of DAQ data holding NaN/inf samples
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime
+
+import numpy as np
+import openpyxl
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+import services.test_scenario_engine as tse
+from services.test_scenario_engine import TestScenarioEngine
+
+
+def _engine_with_nan_samples(n_rows: int) -> TestScenarioEngine:
+    """Engine whose daq_data has one NaN and one inf sample on VDD and an all-NaN VBAT"""
+    engine = TestScenarioEngine(log_callback=lambda msg, level="info": None)
+    engine._get_enabled_channels_from_monitor = lambda: ['ai0', 'ai1']
+    engine._get_channel_rail_names = lambda: {'ai0': 'VDD', 'ai1': 'VBAT'}
+    
+    buf = engine._preallocate_daq_buffers(n_rows, ['ai0_current', 'ai1_current'])
+    buf.started_at = datetime(2026, 1, 1)
+    vdd = np.full(n_rows, 0.15)
+    vdd[7] = np.nan
+    vdd[n_rows // 2] = np.inf
+    times = np.arange(n_rows)
+    buf.extend_columns({'time_elapsed': times, 'screen_test_time': times,
+                        'ai0_current': vdd, 'ai1_current': np.full(n_rows, np.nan)})
+    engine.daq_data = buf
+    return engine
+
+
+def _check_workbook(filename: str, n_rows: int):
+    workbook = openpyxl.load_workbook(filename)
+    assert workbook.sheetnames == ['Test_Results', 'Test_Summary']
+    sheet = workbook['Test_Results']
+    assert sheet.max_row == n_rows + 1
+    assert [cell.value for cell in sheet[2]] == [0, 0.15, None]
+    assert [cell.value for cell in sheet[9]] == [7, None, None]
+    assert sheet.cell(n_rows // 2 + 2, 2).value is None
+
+
+def test_excel_export_nan(n_rows: int = 1_000):
+    """xlsxwriter path: NaN/inf samples become blank cells"""
+    engine = _engine_with_nan_samples(n_rows)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'nan.xlsx')
+        assert engine._export_to_excel_basic(filename)
+        _check_workbook(filename, n_rows)
+
+
+def test_fast_xlsx_export_nan():
+    """Raw XML path (large captures): NaN/inf samples are left out of the sheet"""
+    n_rows = tse._FAST_XLSX_MIN_ROWS
+    engine = _engine_with_nan_samples(n_rows)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'nan_fast.xlsx')
+        assert engine._export_to_excel_basic(filename)
+        _check_workbook(filename, n_rows)
+
+
+if __name__ == "__main__":
+    test_excel_export_nan()
+    test_fast_xlsx_export_nan()
+    print("Excel NaN export tests passed")